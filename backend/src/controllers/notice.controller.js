@@ -1,13 +1,34 @@
 const fs = require("fs");
 const path = require("path");
+const axios = require("axios");
 
 /**
  * 최신 공지사항 JSON 파일 경로
- * - RAG 크롤러/배치 작업에서 생성
+ * - RAG ingest가 실행마다 공지 카탈로그 기준 최신 공지로 다시 생성
  * - 서버는 읽기 전용으로 사용
  */
 const LATEST_NOTICES_PATH = path.join(__dirname, "../rag/latest_notices.json");
 
+/**
+ * FastAPI 서버 주소 (공지 목록 /notices 제공)
+ */
+const FASTAPI_URL = process.env.FASTAPI_URL || "http://localhost:8001";
+
+/**
+ * 최신 공지사항 캐시
+ * - 파일 수정 시각(mtime)이 바뀐 경우에만 다시 읽고 파싱
+ */
+let latestNoticesCache = { mtimeMs: null, notices: null };
+
+const loadLatestNotices = async () => {
+  const stat = await fs.promises.stat(LATEST_NOTICES_PATH);
+  if (latestNoticesCache.mtimeMs !== stat.mtimeMs) {
+    const data = await fs.promises.readFile(LATEST_NOTICES_PATH, "utf-8");
+    latestNoticesCache = { mtimeMs: stat.mtimeMs, notices: JSON.parse(data) };
+  }
+  return latestNoticesCache.notices;
+};
+
 // ======================================================
 // GET LATEST NOTICES
 // ======================================================
@@ -20,28 +41,17 @@ const LATEST_NOTICES_PATH = path.join(__dirname, "../rag/latest_notices.json");
 const getLatestNotices = async (req, res) => {
   try {
     // --------------------------------------------------
-    // 1. 파일 존재 여부 확인
+    // 1. 파일 읽기 (mtime이 같으면 캐시 사용)
     // --------------------------------------------------
-    if (!fs.existsSync(LATEST_NOTICES_PATH)) {
-      return res.status(404).json({
-        success: false,
-        message: "최신 공지사항 데이터를 찾을 수 없습니다. 크롤링을 먼저 실행해주세요.",
-      });
-    }
-
-    // --------------------------------------------------
-    // 2. 파일 읽기
-    // --------------------------------------------------
-    const data = fs.readFileSync(LATEST_NOTICES_PATH, "utf-8");
 
     /**
      * JSON 파싱
-     * - 잘못된 형식일 경우 SyntaxError 발생
+     * - 파일이 없으면 ENOENT, 잘못된 형식일 경우 SyntaxError 발생
      */
-    const latestNotices = JSON.parse(data);
+    const latestNotices = await loadLatestNotices();
 
     // --------------------------------------------------
-    // 3. 응답 반환
+    // 2. 응답 반환
     // --------------------------------------------------
     return res.json({
       success: true,
@@ -49,6 +59,14 @@ const getLatestNotices = async (req, res) => {
     });
 
   } catch (err) {
+    // 파일 없음
+    if (err.code === "ENOENT") {
+      return res.status(404).json({
+        success: false,
+        message: "최신 공지사항 데이터를 찾을 수 없습니다. 크롤링을 먼저 실행해주세요.",
+      });
+    }
+
     console.error("Get Latest Notices Error:", err);
 
     // JSON 파싱 오류
@@ -67,9 +85,48 @@ const getLatestNotices = async (req, res) => {
   }
 };
 
+// ======================================================
+// GET NOTICES (PAGINATED)
+// ======================================================
+
+/**
+ * 공지사항 목록 조회
+ * - FastAPI /notices로 그대로 전달 (게시판/제목/기간 필터 + cursor 페이지네이션)
+ * - query: board(여러 개 가능), q, date_from, date_to, limit, cursor
+ */
+const getNotices = async (req, res) => {
+  try {
+    const response = await axios.get(`${FASTAPI_URL}/notices`, {
+      params: req.query,
+      paramsSerializer: { indexes: null }, // board=a&board=b
+    });
+
+    return res.json({
+      success: true,
+      ...response.data,
+    });
+
+  } catch (err) {
+    // 잘못된 필터/cursor
+    if (err.response && err.response.status < 500) {
+      return res.status(err.response.status).json({
+        success: false,
+        message: err.response.data?.detail || "잘못된 요청입니다.",
+      });
+    }
+
+    console.error("Get Notices Error:", err.message);
+    return res.status(500).json({
+      success: false,
+      message: "공지사항 목록 조회 실패",
+    });
+  }
+};
+
 // ======================================================
 // EXPORT
 // ======================================================
 module.exports = {
   getLatestNotices,
+  getNotices,
 };
\ No newline at end of file
@@ -0,0 +1,262 @@
+"""
+학사일정 구간 인덱스 모듈
+static_data.ACADEMIC_CALENDAR_2025의 "일정명: 시작일 ~ 종료일" 행을 (제목, 시작, 종료, 학기) 이벤트로 파싱하여
+시작일 순으로 정렬해 두고, 질문의 날짜 표현("다음 주", "이번 달", "3일 후", "이번 학기", "12월 15일")을
+오늘 기준 기간으로 바꾼 뒤 그 기간과 겹치는 일정만 이진 탐색으로 찾음
+- 벡터 검색으로 학사일정 섹션을 통째로 넣는 대신 해당 기간의 행만 프롬프트에 넣음
+- 학사일정 범위 밖의 기간(다음 학년도 등)은 찾지 않음 -> 기존 벡터 검색 결과 그대로 사용
+"""
+
+import re
+import threading
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass
+from datetime import date, timedelta
+from typing import List, Optional, Tuple
+
+from date_utils import semester_of
+from static_data import ACADEMIC_CALENDAR_2025
+
+CALENDAR_BOARD = "학사일정"
+CALENDAR_TITLE = "2025학년도 학사일정"
+UPCOMING_DAYS = 14  # "다가오는 일정", "곧" 등 기간 없는 질문의 조회 기간
+MAX_CALENDAR_ROWS = 15  # 프롬프트에 넣을 최대 일정 수 (넘으면 "외 N건")
+
+_ROW_PATTERN = re.compile(r"^(.+?):\s*(\d{4})-(\d{2})-(\d{2})\s*~\s*(\d{4})-(\d{2})-(\d{2})\s*$")
+
+
+@dataclass(frozen=True)
+class CalendarEvent:
+    """학사일정 행 하나"""
+    title: str
+    start: date
+    end: date
+    semester: str  # "2025-1", "2025-2" (학년도-학기)
+
+    def format(self) -> str:
+        if self.start == self.end:
+            return f"- {self.title}: {self.start.isoformat()}"
+        return f"- {self.title}: {self.start.isoformat()} ~ {self.end.isoformat()}"
+
+
+@dataclass(frozen=True)
+class DateRange:
+    """질문에서 찾은 조회 기간 (label은 프롬프트 표시용, 예: "다음 주")"""
+    start: date
+    end: date
+    label: str
+    semester: Optional[str] = None  # "이번 학기" 등 학기 질문이면 그 학기 일정만
+
+
+def parse_calendar(text: str) -> List[CalendarEvent]:
+    """학사일정 텍스트 -> 이벤트 (형식이 맞지 않는 행은 건너뜀)"""
+    events = []
+    for line in text.splitlines():
+        match = _ROW_PATTERN.match(line.strip())
+        if not match:
+            continue
+        title = match.group(1).strip()
+        start = date(*(int(g) for g in match.group(2, 3, 4)))
+        end = date(*(int(g) for g in match.group(5, 6, 7)))
+        events.append(CalendarEvent(title, start, max(start, end), semester_of(title, start)))
+    return events
+
+
+class CalendarIndex:
+    """
+    시작일 순으로 정렬한 일정 구간 인덱스
+    가장 긴 일정 길이(max_span)를 알고 있으므로, [start, end]와 겹치는 일정은
+    시작일이 [start - max_span, end]인 일정 중에 있음 -> 이진 탐색 2번 + 후보만 확인 (O(log n + k))
+    """
+
+    def __init__(self, events: List[CalendarEvent]):
+        self.events = sorted(events, key=lambda e: (e.start, e.end, e.title))
+        self.starts = [e.start for e in self.events]
+        self.max_span = max((e.end - e.start for e in self.events), default=timedelta(0))
+        self.first = self.events[0].start if self.events else None
+        self.last = max((e.end for e in self.events), default=None)
+
+    def __len__(self) -> int:
+        return len(self.events)
+
+    def covers(self, start: date, end: date) -> bool:
+        """조회 기간이 학사일정 범위와 겹치는지 (범위 밖이면 "일정 없음"이 아니라 모르는 것)"""
+        return bool(self.events) and start <= self.last and end >= self.first
+
+    def overlapping(self, start: date, end: date) -> List[CalendarEvent]:
+        """[start, end]와 하루라도 겹치는 일정 (시작일 순)"""
+        lo = bisect_left(self.starts, start - self.max_span)
+        hi = bisect_right(self.starts, end)
+        return [e for e in self.events[lo:hi] if e.end >= start]
+
+    def semester_bounds(self, semester: str) -> Optional[Tuple[date, date]]:
+        """학기 태그의 첫 일정 시작일 ~ 마지막 일정 종료일"""
+        events = [e for e in self.events if e.semester == semester]
+        if not events:
+            return None
+        return min(e.start for e in events), max(e.end for e in events)
+
+
+# ---------- 질문의 날짜 표현 -> 기간 ----------
+
+_DAY_WORDS = {"그저께": -2, "그제": -2, "어제": -1, "오늘": 0, "금일": 0, "내일": 1, "명일": 1, "모레": 2, "글피": 3}
+_DAY_PATTERN = re.compile("|".join(sorted(_DAY_WORDS, key=len, reverse=True)))
+_WEEK_PATTERN = re.compile(r"(이번|다음|다다음|지난|저번)\s*주(말)?|(금주|차주)")
+_MONTH_PATTERN = re.compile(r"(이번|다음|지난|저번)\s*달|(이달|금월|익월)")
+_SEMESTER_WORD_PATTERN = re.compile(r"(이번|다음|지난|저번)\s*학기")
+_AFTER_PATTERN = re.compile(r"(\d+)\s*(일|주|개월|달)\s*(?:후|뒤)")
+_WITHIN_PATTERN = re.compile(r"(?:앞으로|향후)\s*(\d+)\s*(일|주|개월|달)|(\d+)\s*(일|주|개월|달)\s*(?:이내|안에|동안)")
+_MONTH_DAY_PATTERN = re.compile(r"(?:(\d{4})\s*년\s*)?(\d{1,2})\s*월\s*(\d{1,2})\s*일|(\d{4})-(\d{1,2})-(\d{1,2})")
+_MONTH_ONLY_PATTERN = re.compile(r"(?:(\d{4})\s*년\s*)?(\d{1,2})\s*월(?!\s*\d)")
+_UPCOMING_PATTERN = re.compile(r"다가오는|곧|앞으로|남은\s*일정|다음\s*일정|예정된")
+# 일정이 없을 때도 "없음"을 알려줄 학사 관련 질문
+_SCHEDULE_PATTERN = re.compile(r"일정|학사|시험|신청|기간|마감|개강|종강|방학|등록|휴학|복학|수강|성적|졸업|학위|언제")
+
+_OFFSETS = {"이번": 0, "금주": 0, "이달": 0, "금월": 0, "다음": 1, "차주": 1, "익월": 1, "다다음": 2, "지난": -1, "저번": -1}
+
+
+def _add_months(day: date, months: int) -> date:
+    month_index = day.year * 12 + day.month - 1 + months
+    return date(month_index // 12, month_index % 12 + 1, 1)
+
+
+def _month_range(first: date) -> Tuple[date, date]:
+    return first, _add_months(first, 1) - timedelta(days=1)
+
+
+def _period_days(count: int, unit: str) -> int:
+    return count * {"일": 1, "주": 7, "개월": 30, "달": 30}[unit]
+
+
+def _nearest_year(month: int, day: int, today: date) -> Optional[date]:
+    """연도 없는 "12월 15일" -> 오늘과 가장 가까운 해의 날짜"""
+    candidates = []
+    for year in (today.year - 1, today.year, today.year + 1):
+        try:
+            candidates.append(date(year, month, day))
+        except ValueError:
+            continue
+    return min(candidates, key=lambda d: abs((d - today).days)) if candidates else None
+
+
+def resolve_date_range(question: str, today: date, index: Optional[CalendarIndex] = None) -> Optional[DateRange]:
+    """
+    질문의 날짜 표현을 오늘 기준 기간으로 변환 (날짜 표현이 없으면 None)
+    앞에 나온 규칙이 우선: 특정 날짜 > 월 > 주 > 달 > 학기 > N일 후/이내 > 오늘/내일 > 다가오는 일정
+    """
+    match = _MONTH_DAY_PATTERN.search(question)
+    if match:
+        try:
+            if match.group(4):
+                day = date(int(match.group(4)), int(match.group(5)), int(match.group(6)))
+            elif match.group(1):
+                day = date(int(match.group(1)), int(match.group(2)), int(match.group(3)))
+            else:
+                day = _nearest_year(int(match.group(2)), int(match.group(3)), today)
+        except ValueError:
+            day = None
+        if day:
+            return DateRange(day, day, day.isoformat())
+
+    match = _MONTH_ONLY_PATTERN.search(question)
+    if match and 1 <= int(match.group(2)) <= 12:
+        month = int(match.group(2))
+        if match.group(1):
+            first = date(int(match.group(1)), month, 1)
+        else:
+            first = _nearest_year(month, 1, today)
+        start, end = _month_range(first)
+        return DateRange(start, end, f"{first.year}년 {month}월")
+
+    match = _WEEK_PATTERN.search(question)
+    if match:
+        word = match.group(1) or match.group(3)
+        monday = today - timedelta(days=today.weekday()) + timedelta(weeks=_OFFSETS[word])
+        if match.group(2):
+            return DateRange(monday + timedelta(days=5), monday + timedelta(days=6), f"{word} 주말")
+        return DateRange(monday, monday + timedelta(days=6), f"{word} 주" if match.group(1) else word)
+
+    match = _MONTH_PATTERN.search(question)
+    if match:
+        word = match.group(1) or match.group(2)
+        start, end = _month_range(_add_months(today.replace(day=1), _OFFSETS[word]))
+        return DateRange(start, end, f"{start.year}년 {start.month}월")
+
+    match = _SEMESTER_WORD_PATTERN.search(question)
+    if match and index is not None:
+        year, term = (int(v) for v in semester_of("", today).split("-"))
+        ordinal = (year * 2 + term - 1) + _OFFSETS[match.group(1)]
+        semester = f"{ordinal // 2}-{ordinal % 2 + 1}"
+        bounds = index.semester_bounds(semester)
+        if bounds:
+            start, end = bounds
+            if match.group(1) == "이번":
+                start = max(start, today)  # 이번 학기는 남은 일정만
+            return DateRange(start, end, f"{match.group(1)} 학기 ({semester.replace('-', '학년도 ')}학기)", semester)
+
+    match = _AFTER_PATTERN.search(question)
+    if match:
+        day = today + timedelta(days=_period_days(int(match.group(1)), match.group(2)))
+        return DateRange(day, day, f"{match.group(1)}{match.group(2)} 후")
+
+    match = _WITHIN_PATTERN.search(question)
+    if match:
+        count, unit = (match.group(1), match.group(2)) if match.group(1) else (match.group(3), match.group(4))
+        return DateRange(today, today + timedelta(days=_period_days(int(count), unit)), f"앞으로 {count}{unit}")
+
+    match = _DAY_PATTERN.search(question)
+    if match:
+        day = today + timedelta(days=_DAY_WORDS[match.group(0)])
+        return DateRange(day, day, match.group(0))
+
+    if _UPCOMING_PATTERN.search(question):
+        return DateRange(today, today + timedelta(days=UPCOMING_DAYS), f"앞으로 {UPCOMING_DAYS}일")
+    return None
+
+
+# ---------- 조회 ----------
+
+_index: Optional[CalendarIndex] = None
+_index_lock = threading.Lock()
+
+
+def get_calendar_index() -> CalendarIndex:
+    """프로세스 전체에서 공유하는 학사일정 인덱스"""
+    global _index
+    with _index_lock:
+        if _index is None:
+            _index = CalendarIndex(parse_calendar(ACADEMIC_CALENDAR_2025))
+        return _index
+
+
+def lookup_calendar(question: str, today: Optional[date] = None) -> Optional[Tuple[DateRange, List[CalendarEvent]]]:
+    """
+    질문의 날짜 표현에 해당하는 학사일정
+    Returns:
+        tuple: (조회 기간, 겹치는 일정) - 날짜 표현이 없거나 학사일정 범위 밖이면 None
+               (겹치는 일정이 없으면 학사 관련 질문일 때만 빈 목록, "내일 학식"처럼 관련 없는 질문은 None)
+    """
+    index = get_calendar_index()
+    date_range = resolve_date_range(question, today or date.today(), index)
+    if date_range is None or not index.covers(date_range.start, date_range.end):
+        return None
+    events = index.overlapping(date_range.start, date_range.end)
+    if date_range.semester:
+        events = [e for e in events if e.semester == date_range.semester]
+    if not events and not _SCHEDULE_PATTERN.search(question):
+        return None
+    return date_range, events
+
+
+def format_calendar_rows(date_range: DateRange, events: List[CalendarEvent]) -> str:
+    """프롬프트에 넣을 학사일정 행 (최대 MAX_CALENDAR_ROWS개)"""
+    period = date_range.start.isoformat()
+    if date_range.end != date_range.start:
+        period += f" ~ {date_range.end.isoformat()}"
+    lines = [f"=== {CALENDAR_TITLE}: {date_range.label} ({period}) ==="]
+    lines.extend(e.format() for e in events[:MAX_CALENDAR_ROWS])
+    if len(events) > MAX_CALENDAR_ROWS:
+        lines.append(f"- 외 {len(events) - MAX_CALENDAR_ROWS}건")
+    if not events:
+        lines.append("- 해당 기간 학사일정 없음")
+    return "\n".join(lines)
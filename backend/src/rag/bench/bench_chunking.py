@@ -0,0 +1,187 @@
+"""
+문서 분할 벤치마크 (정적 데이터 + 게시판 상세페이지 fixture, 네트워크 불필요)
+기존 분할(RecursiveCharacterTextSplitter 400자 / 100자 겹침)과 구조 기반 분할(chunking.py)을 비교
+
+- 인덱스 크기: 청크 수, 임베딩 토큰 수, 저장 글자 수 (청크 + 부모 섹션)
+- recall: 질문별 정답 문자열이 프롬프트에 들어갈 문서에 온전히 포함된 비율
+  (학사일정 행, 도서관 "이름/운영시간" 레코드가 중간에서 잘리면 실패)
+- 프롬프트 토큰: format_docs_with_metadata로 만든 context의 평균 토큰 수
+
+검색은 기본적으로 문자 bigram TF-IDF로 흉내냄 (API 키 불필요, 분할 방식 간 상대 비교용)
+--openai를 주면 실제 임베딩(text-embedding-3-small, 디스크 캐시 사용)으로 검색
+
+실행: python bench/bench_chunking.py [--openai] [--show-misses]
+"""
+
+import os
+import sys
+import math
+import argparse
+from collections import Counter
+from typing import Dict, List
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("OPENAI_API_KEY", "bench")
+
+import numpy as np  # noqa: E402
+from langchain_core.documents import Document  # noqa: E402
+from langchain_text_splitters import RecursiveCharacterTextSplitter  # noqa: E402
+
+from chunking import split_documents  # noqa: E402
+from parent_store import CHILD_FETCH_K, MAX_CONTEXT_DOCS, expand_to_parents  # noqa: E402
+from embedding_cache import count_tokens  # noqa: E402
+from rag_engine import format_docs_with_metadata  # noqa: E402
+from static_data import get_static_documents  # noqa: E402
+from crawler.boards import BOARD_SPECS  # noqa: E402
+from crawler.engine import parse_body  # noqa: E402
+from crawler.parsing import parse_html  # noqa: E402
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+BASELINE_K = 5  # 기존 rag_engine retriever의 k
+
+# (질문, 정답 문자열) - 정답 문자열이 context에 그대로 있어야 맞힌 것으로 봄
+QUERIES = [
+    ("2학기 중간시험 기간이 언제야?", "2학기 중간시험: 2025-10-20 ~ 2025-10-24"),
+    ("1학기 기말시험 언제 봐?", "1학기 기말시험: 2025-06-17 ~ 2025-06-23"),
+    ("2학기 기말시험 일정", "2학기 기말시험: 2025-12-15 ~ 2025-12-19"),
+    ("2학기 복학 신청 기간", "2학기 복학 신청: 2025-07-21 ~ 2025-08-01"),
+    ("2학기 수강철회 신청은 언제까지야?", "수강철회 신청: 2025-09-17 ~ 2025-09-19"),
+    ("겨울 학위수여식 날짜", "2026년 겨울 학위수여식: 2026-02-25 ~ 2026-02-25"),
+    ("건학기념일이 언제야?", "건학기념일: 2025-09-25 ~ 2025-09-25"),
+    ("교직과정 신청 기간", "학사과정 교직과정 신청: 2025-11-10 ~ 2025-11-14"),
+    ("2026학년도 1학기 등록금 분할납부 신청", "2026학년도 1학기 등록금 분할납부 신청: 2026-02-11 ~ 2026-02-13"),
+    ("여름 계절수업 언제 시작해?", "여름방학/여름 계절수업 시작: 2025-06-24 ~ 2025-06-24"),
+    ("반도체관 몇 번 건물이야?", "반도체관: 40번 건물(반도체시스템공학과)"),
+    ("소프트웨어학과 건물 어디야?", "21번 건물(정보통신대학, 소프트웨어학과)"),
+    ("인관은 몇 번 건물?", "인관: 91번 건물"),
+    ("퇴계인문관에 있는 단과대는?", "퇴계인문관: 31번 건물(유학대학, 문과대학)"),
+    ("600주년기념관 건물 번호", "600주년기념관: 1번 건물"),
+    ("N센터 위치", "N센터: 86번 건물"),
+    ("경영관 열람실 운영시간", "이름: 경영관(학부/대학원)\n운영시간: 06:00~24:00"),
+    ("법학도서관 자료실 몇 시까지 해?", "이름: 법학도서관\n운영시간: 08:00~21:40 (토 10:00~17:00)"),
+    ("디도 컴넷 운영시간", "실명: 컴넷\n운영시간: 08:00 ~ 21:40"),
+    ("시험기간에 디도 F/G 열람실 몇 시까지 열어?", "실명: F / G 열람실\n운영시간: 06:00 ~ 05:00"),
+    ("시험기간 중앙학술정보관 열람실 운영시간", "이름: 중앙학술정보관\n운영시간: 06:00~익일 05:00\n비고: 청소 05:00~06:00"),
+    ("삼성학술정보관 스터디 공간 숲:콤 존 운영시간", "실명: 숲:콤 존\n운영시간: 08:00 ~ 21:40"),
+]
+
+
+def load_fixture_notices() -> List[Document]:
+    """게시판 상세페이지 fixture 본문 (인덱스 크기 비교용)"""
+    docs = []
+    for spec in BOARD_SPECS:
+        path = os.path.join(FIXTURES_DIR, f"{spec.board_name}_detail.html")
+        if not os.path.exists(path):
+            continue
+        with open(path, 'r', encoding='utf-8') as f:
+            html = f.read()
+        body, extra = parse_body(spec, parse_html(html, spec.body_strainer, spec.body_selector))
+        metadata = {"board_name": spec.board_name, "post_num": "fixture", "title": f"{spec.board_name} fixture"}
+        docs.append(Document(page_content=body, metadata={**metadata, **extra}))
+    return docs
+
+
+class BigramTfidf:
+    """문자 bigram TF-IDF 임베딩 (API 없이 분할 방식 간 검색 품질을 비교하기 위한 대용)"""
+
+    def __init__(self):
+        self.vocab: Dict[str, int] = {}
+        self.idf = None
+
+    @staticmethod
+    def _grams(text: str) -> Counter:
+        text = "".join(text.lower().split())
+        return Counter(text[i:i + 2] for i in range(len(text) - 1))
+
+    def fit(self, texts: List[str]):
+        df = Counter()
+        for text in texts:
+            df.update(set(self._grams(text)))
+        self.vocab = {gram: i for i, gram in enumerate(df)}
+        self.idf = np.array([math.log((1 + len(texts)) / (1 + df[g])) + 1 for g in self.vocab])
+
+    def _vector(self, text: str) -> np.ndarray:
+        vector = np.zeros(len(self.vocab))
+        for gram, count in self._grams(text).items():
+            if gram in self.vocab:
+                vector[self.vocab[gram]] = count
+        vector *= self.idf
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
+
+    def embed_documents(self, texts: List[str]) -> List[np.ndarray]:
+        self.fit(texts)
+        return [self._vector(t) for t in texts]
+
+    def embed_query(self, text: str) -> np.ndarray:
+        return self._vector(text)
+
+
+def search(embedder, chunks: List[Document], vectors: np.ndarray, query: str, k: int) -> List[Document]:
+    scores = vectors @ np.asarray(embedder.embed_query(query))
+    return [chunks[i] for i in np.argsort(-scores)[:k]]
+
+
+def evaluate(name: str, embedder, chunks: List[Document], parents: Dict[str, tuple], show_misses: bool) -> dict:
+    vectors = np.asarray(embedder.embed_documents([c.page_content for c in chunks]), dtype=float)
+    if not parents:
+        retrieve = lambda q: search(embedder, chunks, vectors, q, BASELINE_K)  # noqa: E731
+    else:
+        parent_texts = {parent_id: text for parent_id, (_, text) in parents.items()}
+        retrieve = lambda q: expand_to_parents(  # noqa: E731
+            search(embedder, chunks, vectors, q, CHILD_FETCH_K), parent_texts, max_docs=MAX_CONTEXT_DOCS
+        )
+
+    hits = 0
+    prompt_tokens = []
+    for question, answer in QUERIES:
+        docs = retrieve(question)
+        if any(answer in d.page_content for d in docs):
+            hits += 1
+        elif show_misses:
+            print(f"  ❌ [{name}] {question} -> {answer!r}")
+        prompt_tokens.append(count_tokens(format_docs_with_metadata(docs)))
+
+    return {
+        "chunks": len(chunks),
+        "embed_tokens": sum(count_tokens(c.page_content) for c in chunks),
+        "stored_chars": sum(len(c.page_content) for c in chunks) + sum(len(t) for _, t in parents.values()),
+        "parents": len(parents),
+        "recall": hits / len(QUERIES),
+        "prompt_tokens": sum(prompt_tokens) / len(prompt_tokens),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Chunking benchmark")
+    parser.add_argument("--openai", action="store_true", help="Retrieve with real embeddings (needs OPENAI_API_KEY)")
+    parser.add_argument("--show-misses", action="store_true", help="Print questions whose answer was not retrieved")
+    args = parser.parse_args()
+
+    docs = get_static_documents() + load_fixture_notices()
+    print(f"📄 {len(docs)} documents ({sum(len(d.page_content) for d in docs)} chars), {len(QUERIES)} questions")
+
+    if args.openai:
+        from embedding_cache import CachedEmbeddings
+        embedder = CachedEmbeddings()
+    else:
+        embedder = BigramTfidf()
+
+    baseline = RecursiveCharacterTextSplitter(chunk_size=400, chunk_overlap=100).split_documents(docs)
+    children, parents = split_documents(docs)
+    results = {
+        f"recursive 400/100 (top {BASELINE_K})": evaluate("recursive", embedder, baseline, {}, args.show_misses),
+        f"structural children (top {BASELINE_K})": evaluate("children", embedder, children, {}, args.show_misses),
+        f"structural + parents (top {CHILD_FETCH_K} -> {MAX_CONTEXT_DOCS})": evaluate(
+            "parents", embedder, children, parents, args.show_misses
+        ),
+    }
+
+    print(f"\n{'method':<42}{'chunks':>8}{'parents':>9}{'embed tok':>11}{'stored':>9}{'recall':>8}{'prompt tok':>12}")
+    for name, r in results.items():
+        print(f"{name:<42}{r['chunks']:>8}{r['parents']:>9}{r['embed_tokens']:>11}{r['stored_chars']:>9}"
+              f"{r['recall']:>8.0%}{r['prompt_tokens']:>12.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""
+게시판 크롤러 병렬 실행 벤치마크 (fixture 기반, 네트워크/Chrome 불필요)
+각 게시판 크롤러를 페이지/게시글마다 delay초씩 대기하는 fixture 크롤러로 바꿔
+순차 실행(workers=1)과 병렬 실행의 wall-clock 시간을 비교
+
+실행: python bench/bench_crawlers.py [--delay 0.2] [--pages 3] [--per-page 5]
+"""
+
+import os
+import sys
+import time
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("OPENAI_API_KEY", "bench")
+
+import ingest  # noqa: E402
+
+
+def make_fixture_crawler(board_name: str, pages: int, per_page: int, delay: float):
+    """페이지 목록 1회 + 게시글 per_page개 요청마다 delay초 대기하는 fixture 크롤러"""
+    def crawl(existing_post_nums=None, **kwargs):  # max_pages, delay 등 실제 인자는 무시
+        existing_post_nums = existing_post_nums or set()
+        notices = []
+        for page in range(pages):
+            time.sleep(delay)  # 목록 페이지
+            for i in range(per_page):
+                post_num = str(1000 - page * per_page - i)
+                if post_num in existing_post_nums:
+                    continue
+                time.sleep(delay)  # 상세 페이지
+                notices.append({
+                    "title": f"{board_name} 공지 {post_num}",
+                    "link": f"https://fixture/{board_name}/{post_num}",
+                    "date": f"2025.11.{(int(post_num) % 28) + 1:02d}",
+                    "post_num": post_num,
+                    "body": f"{board_name} 공지 {post_num} 본문",
+                })
+        return notices
+    return crawl
+
+
+def run(workers: int) -> tuple:
+    """게시판 결과는 끝나는 순서대로 오므로 NOTICE_CRAWLERS 순서로 정렬해서 비교"""
+    start = time.perf_counter()
+    units = {unit.name: unit for unit in ingest.iter_crawled_boards({}, workers=workers)}
+    elapsed = time.perf_counter() - start
+    docs, updated = [], {}
+    for config in ingest.NOTICE_CRAWLERS:
+        unit = units[f"board:{config['board_name']}"]
+        docs.extend(unit.docs)
+        updated[config["board_name"]] = set(unit.extra["new_post_nums"])
+    return elapsed, docs, updated
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Crawler concurrency benchmark")
+    parser.add_argument("--delay", type=float, default=0.2, help="Seconds per simulated request")
+    parser.add_argument("--pages", type=int, default=3, help="List pages per board")
+    parser.add_argument("--per-page", type=int, default=5, help="Posts per list page")
+    args = parser.parse_args()
+
+    for config in ingest.NOTICE_CRAWLERS:
+        config["crawl_func"] = make_fixture_crawler(config["board_name"], args.pages, args.per_page, args.delay)
+
+    sequential, docs_seq, data_seq = run(workers=1)
+    parallel, docs_par, data_par = run(workers=ingest.CRAWL_WORKERS)
+
+    same = (
+        [d.metadata for d in docs_seq] == [d.metadata for d in docs_par]
+        and data_seq == data_par
+    )
+    print(f"\n{'='*60}")
+    print(f"📊 Crawler benchmark ({len(ingest.NOTICE_CRAWLERS)} boards, delay={args.delay}s)")
+    print(f"  - Sequential (workers=1): {sequential:.2f}s")
+    print(f"  - Parallel (workers={ingest.CRAWL_WORKERS}): {parallel:.2f}s")
+    print(f"  - Speedup: {sequential / parallel:.2f}x")
+    print(f"  - Identical merge result: {same}")
+
+
+if __name__ == "__main__":
+    main()
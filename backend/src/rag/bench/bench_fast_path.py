@@ -0,0 +1,115 @@
+"""
+빠른 답변(fast_path.py) 벤치마크 (네트워크 불필요)
+질문 표본에서 빠른 답변이 처리하는 비율, 처리한 답변의 정답률, 응답 시간을 측정
+
+- 표본: 정적 데이터로 답할 수 있는 질문 + RAG가 필요한 질문(공지, 개인화, 설명, 영어)
+- 정답 문자열이 None인 질문을 빠른 답변이 처리하면 오답(잘못 가로챔)으로 셈
+- 실제 서비스 비율은 rag_api의 GET /health 응답의 fast_path (서버 시작 이후 누적)
+
+실행: python bench/bench_fast_path.py [--today 2025-10-15] [--show]
+"""
+
+import os
+import sys
+import time
+import argparse
+from datetime import date
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("OPENAI_API_KEY", "bench")
+
+from fast_path import answer_fast_path, get_fast_path_index  # noqa: E402
+
+USER_INFO = {"campus": "자연과학캠퍼스"}
+
+# (질문, 답변에 있어야 할 문자열 - None이면 RAG로 넘겨야 하는 질문)
+QUERIES = [
+    ("2학기 중간시험 기간이 언제야?", "2025-10-20 ~ 2025-10-24"),
+    ("1학기 기말시험 언제 봐?", "2025-06-17 ~ 2025-06-23"),
+    ("기말고사 언제야?", "2025-12-15 ~ 2025-12-19"),
+    ("이번 학기 기말시험 언제야", "2025-12-15 ~ 2025-12-19"),
+    ("2학기 수강철회 신청은 언제까지야?", "2025-09-17 ~ 2025-09-19"),
+    ("겨울 학위수여식 날짜", "2026-02-25"),
+    ("건학기념일이 언제야?", "2025-09-25"),
+    ("교직과정 신청 기간", "2025-11-10 ~ 2025-11-14"),
+    ("여름 계절수업 언제 시작해?", "2025-06-24"),
+    ("반도체관 몇 번 건물이야?", "40번 건물"),
+    ("소프트웨어학과 건물 어디야?", "21번 건물"),
+    ("인관은 몇 번 건물?", "91번 건물"),
+    ("600주년기념관 건물 번호", "1번 건물"),
+    ("N센터 위치", "86번 건물"),
+    ("학생회관 어디야?", "3번 건물"),
+    ("인사캠 학생회관 어디야?", "8번 건물"),
+    ("경영관 열람실 운영시간", "06:00~24:00"),
+    ("법학도서관 자료실 몇 시까지 해?", "08:00~21:40 (토 10:00~17:00)"),
+    ("디도 컴넷 운영시간", "08:00 ~ 21:40"),
+    ("시험기간에 디도 F/G 열람실 몇 시까지 열어?", "06:00 ~ 05:00"),
+    ("시험기간 중앙학술정보관 열람실 운영시간", "06:00~익일 05:00"),
+    ("삼성학술정보관 스터디 공간 숲:콤 존 운영시간", "08:00 ~ 21:40"),
+    ("중도 몇 시까지 해?", "08:00~21:40"),
+    ("스터디룸 운영시간", "09:00~21:40"),
+    # RAG가 답해야 하는 질문
+    ("다음 주 학사일정 알려줘", None),
+    ("수강신청 어떻게 해?", None),
+    ("내 시간표랑 기말시험 겹쳐?", None),
+    ("장학금 신청 언제야?", None),
+    ("오늘 학식 메뉴 뭐야", None),
+    ("When is the final exam?", None),
+    ("도서관 몇 시까지 해?", None),
+    ("열람실 운영시간", None),
+    ("소프트웨어학과 최근 공지 알려줘", None),
+    ("기숙사 입사 신청 기간 언제야?", None),
+    ("교환학생 지원 자격이 뭐야?", None),
+    ("복수전공 신청하려면 뭐가 필요해?", None),
+    ("졸업 요건 알려줘", None),
+    ("휴학하면 등록금 환불돼?", None),
+    ("삼성학술정보관 스터디룸 예약 방법", None),
+    ("이번 주 금요일까지 마감인 공지 있어?", None),
+    # 정적 데이터에 없는 연도/기간 (평시 표나 2025학년도 일정으로 답하면 틀림)
+    ("2026년 기말시험 언제야?", None),
+    ("내년 기말시험 언제야?", None),
+    ("작년 기말시험 언제였어?", None),
+    ("중앙도서관 방학 운영시간", None),
+]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Fast path benchmark")
+    parser.add_argument("--today", default="2025-10-15", help="Date the questions are asked on (YYYY-MM-DD)")
+    parser.add_argument("--show", action="store_true", help="Print every answer")
+    args = parser.parse_args()
+    today = date.fromisoformat(args.today)
+
+    started = time.perf_counter()
+    get_fast_path_index()
+    print(f"📄 Parsed static data in {(time.perf_counter() - started) * 1000:.1f}ms, {len(QUERIES)} questions ({today})")
+
+    served = correct = wrong = 0
+    latencies = []
+    for question, expected in QUERIES:
+        started = time.perf_counter()
+        answer = answer_fast_path(question, USER_INFO, today)
+        latencies.append((time.perf_counter() - started) * 1000)
+        if answer is None:
+            if args.show:
+                print(f"  ↪ RAG        {question}")
+            continue
+        served += 1
+        ok = expected is not None and expected in answer.text
+        correct += ok
+        wrong += not ok
+        if args.show or not ok:
+            print(f"  {'✅' if ok else '❌'} {answer.kind:<13}{question}")
+            if args.show:
+                print("    " + answer.text.replace("\n", "\n    "))
+
+    answerable = sum(1 for _, expected in QUERIES if expected is not None)
+    latencies.sort()
+    print(f"\nserved by fast path: {served}/{len(QUERIES)} ({served / len(QUERIES):.0%})"
+          f", answerable from static data: {answerable} ({answerable / len(QUERIES):.0%})")
+    print(f"correct: {correct}/{served}, wrong or intercepted: {wrong}")
+    print(f"latency: p50 {latencies[len(latencies) // 2]:.3f}ms, max {latencies[-1]:.3f}ms")
+
+
+if __name__ == "__main__":
+    main()
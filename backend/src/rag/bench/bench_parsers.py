@@ -0,0 +1,118 @@
+"""
+HTML 파서 벤치마크 (저장된 게시판 HTML fixture 기반, 네트워크 불필요)
+게시판별 목록/상세 페이지를 아래 방식으로 파싱해 시간과 결과 일치 여부를 비교
+
+- html.parser: 기존 방식 (전체 문서)
+- lxml: 전체 문서
+- lxml + strainer: 목록/본문 부분만 파싱 (crawler.parsing, 실제 크롤링 경로)
+
+실행: python bench/bench_parsers.py [--repeat 50]
+fixture 갱신: python bench/bench_parsers.py --save  (각 게시판 첫 목록 페이지 + 첫 상세페이지 저장)
+"""
+
+import os
+import sys
+import time
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bs4 import BeautifulSoup  # noqa: E402
+
+from crawler.boards import BOARD_SPECS  # noqa: E402
+from crawler.engine import parse_list_page, parse_body  # noqa: E402
+from crawler.fetcher import create_session, HTTP_TIMEOUT  # noqa: E402
+from crawler.parsing import HTML_PARSER, parse_html  # noqa: E402
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+
+
+def fixture_path(board_name: str, kind: str) -> str:
+    return os.path.join(FIXTURES_DIR, f"{board_name}_{kind}.html")
+
+
+def save_fixtures():
+    """각 게시판의 첫 목록 페이지와 첫 일반 글 상세페이지를 fixture로 저장"""
+    os.makedirs(FIXTURES_DIR, exist_ok=True)
+    session = create_session()
+    for spec in BOARD_SPECS:
+        try:
+            response = session.get(spec.page_url(0), timeout=HTTP_TIMEOUT)
+            response.raise_for_status()
+            response.encoding = response.apparent_encoding
+            list_html = response.text
+            rows = [r for r in parse_list_page(spec, BeautifulSoup(list_html, "html.parser")) if not r["is_fixed_notice"]]
+            if not rows:
+                print(f"⚠️ {spec.board_name}: no rows over HTTP, skipped")
+                continue
+            response = session.get(rows[0]["link"], timeout=HTTP_TIMEOUT)
+            response.raise_for_status()
+            response.encoding = response.apparent_encoding
+        except Exception as e:
+            print(f"❌ {spec.board_name}: {e}")
+            continue
+
+        for kind, html in (("list", list_html), ("detail", response.text)):
+            with open(fixture_path(spec.board_name, kind), 'w', encoding='utf-8') as f:
+                f.write(html)
+        print(f"💾 Saved fixtures: {spec.board_name}")
+    session.close()
+
+
+def parse_full(parser: str):
+    def parse(html, parse_only=None, expect=None):
+        return BeautifulSoup(html, parser)
+    return parse
+
+
+def timed(parse, spec, list_html: str, detail_html: str, repeat: int) -> tuple:
+    """repeat회 목록+상세 파싱 평균 시간(ms)과 마지막 결과"""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        rows = parse_list_page(spec, parse(list_html, spec.list_strainer, spec.row_selector))
+        body = parse_body(spec, parse(detail_html, spec.body_strainer, spec.body_selector))
+    return (time.perf_counter() - start) / repeat * 1000, (rows, body)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="HTML parser benchmark")
+    parser.add_argument("--repeat", type=int, default=50, help="Parses per board and method")
+    parser.add_argument("--save", action="store_true", help="Refresh fixtures from the live boards")
+    args = parser.parse_args()
+
+    if args.save:
+        save_fixtures()
+
+    methods = [("html.parser", parse_full("html.parser"))]
+    if HTML_PARSER == "lxml":
+        methods.append(("lxml", parse_full("lxml")))
+    methods.append((f"{HTML_PARSER} + strainer", parse_html))
+
+    print(f"\n⏱️ HTML parsing benchmark (list + detail, avg of {args.repeat} runs)")
+    totals = {name: 0.0 for name, _ in methods}
+    for spec in BOARD_SPECS:
+        paths = [fixture_path(spec.board_name, kind) for kind in ("list", "detail")]
+        if not all(os.path.exists(p) for p in paths):
+            print(f"  - {spec.board_name}: no fixtures (run with --save)")
+            continue
+        list_html, detail_html = (open(p, 'r', encoding='utf-8').read() for p in paths)
+
+        results = []
+        line = []
+        for name, parse in methods:
+            elapsed, result = timed(parse, spec, list_html, detail_html, args.repeat)
+            totals[name] += elapsed
+            results.append(result)
+            line.append(f"{name} {elapsed:.2f}ms")
+        same = all(r == results[0] for r in results)
+        print(f"  - {spec.board_name}: {' / '.join(line)} (identical: {same})")
+
+    baseline = totals["html.parser"]
+    print("\n📊 Total (all boards):")
+    for name, elapsed in totals.items():
+        speedup = f" ({baseline / elapsed:.1f}x)" if elapsed else ""
+        print(f"  - {name}: {elapsed:.2f}ms{speedup}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+"""
+질문 라우터(query_router.py) 벤치마크 (네트워크 불필요)
+키워드 규칙의 경로/게시판 정확도와, notices 경로 검색이 교차 게시 공지를 찾는지 확인
+
+- 경로: 질문 표본의 기대 경로(+ 게시판)와 비교 (centroid 단계는 임베딩이 필요하므로 제외 -> 규칙에 없는 질문은 full)
+- 교차 게시: 소프트웨어학과에도 올라왔지만 학교_대표공지의 대표 공지로 합쳐진 공지(ingest.collapse_duplicates)가
+  "소프트웨어학과 공지" 검색 결과에 포함되는지 임시 샤드 인덱스로 확인 (board:<게시판> 플래그)
+- 실제 서비스의 경로별 검색 시간은 rag_api의 GET /health 응답의 router
+
+실행: python bench/bench_query_router.py [--today 2025-10-15] [--show]
+"""
+
+import os
+import sys
+import time
+import shutil
+import argparse
+import tempfile
+from datetime import date
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("OPENAI_API_KEY", "bench")
+
+from langchain_core.embeddings import DeterministicFakeEmbedding  # noqa: E402
+
+from query_router import QueryRouter, STATIC_BOARDS  # noqa: E402
+from vector_shards import ShardedVectorStore, board_flags, shards_for_filter  # noqa: E402
+
+# (질문, 기대 경로, 기대 게시판 - None이면 게시판 확인 안 함)
+QUERIES = [
+    ("안녕", "none", ()),
+    ("고마워~", "none", ()),
+    ("감사합니다!", "none", ()),
+    # 인사로 시작하지만 검색이 필요한 질문
+    ("하이브리드 강의 공지", "full", None),
+    ("고마워 휴학 신청 기간은?", "full", None),
+    ("좋아 기숙사 공지 보여줘", "notices", ("기숙사_서울", "기숙사_수원")),
+    ("감사합니다 장학금 마감일은?", "full", None),
+    ("ok 그럼 수강신청 언제야", "full", None),
+    ("영어로 다시 말해줘", "none", ()),
+    ("오늘 내 수업 뭐야?", "none", ()),
+    ("소프트웨어학과 공지 알려줘", "notices", ("소프트웨어학과",)),
+    ("소융대 최근 공지", "notices", ("소프트웨어융합대학",)),
+    ("기숙사 공지 있어?", "notices", ("기숙사_서울", "기숙사_수원")),
+    ("명륜학사 공지 알려줘", "notices", ("기숙사_서울",)),
+    ("학교 공지 중에 장학금 관련", "notices", ("학교_대표공지",)),
+    ("공학관 위치 알려줘", "static", STATIC_BOARDS),
+    ("도서관 운영시간 알려줘", "static", STATIC_BOARDS),
+    ("교환학생 모집 공지 알려줘", "full", None),
+    ("졸업 요건 알려줘", "full", None),
+]
+# 대화 기록이 있어야 후속 요청으로 보는 질문
+HISTORY = [{"role": "user", "content": "수강신청 언제야?"}, {"role": "assistant", "content": "..."}]
+
+# 교차 게시 공지 인덱스: (source_key, board_name, 공지가 올라온 게시판, 본문)
+CROSS_POSTED = "학교_대표공지:1001"
+NOTICES = [
+    (CROSS_POSTED, "학교_대표공지", ("학교_대표공지", "소프트웨어학과", "기숙사_서울"),
+     "2025학년도 2학기 SW중심대학 해외연수 프로그램 참가자 모집 안내"),
+    ("소프트웨어학과:501", "소프트웨어학과", ("소프트웨어학과",), "캡스톤디자인 최종 발표회 일정 안내"),
+    ("소프트웨어융합대학:77", "소프트웨어융합대학", ("소프트웨어융합대학",), "대학원 진학 설명회 개최 안내"),
+    ("기숙사_수원:12", "기숙사_수원", ("기숙사_수원",), "봉룡학사 동계 입사 신청 안내"),
+    ("학교_대표공지:1002", "학교_대표공지", ("학교_대표공지",), "2학기 국가장학금 2차 신청 안내"),
+]
+# (질문, 결과에 있어야 할 source_key)
+CROSS_POST_QUERIES = [
+    ("소프트웨어학과 공지 알려줘", CROSS_POSTED),
+    ("서울 기숙사 공지 알려줘", CROSS_POSTED),
+    ("학교 공지 알려줘", CROSS_POSTED),
+    ("소프트웨어학과 공지 알려줘", "소프트웨어학과:501"),
+]
+
+
+def bench_routes(router: QueryRouter, today: date, show: bool) -> int:
+    correct = 0
+    latencies = []
+    for question, expected, boards in QUERIES:
+        history = HISTORY if expected == "none" and "다시" in question else []
+        start = time.perf_counter()
+        route = router.route(question, history, today)
+        latencies.append((time.perf_counter() - start) * 1000)
+        ok = route.name == expected and (boards is None or set(route.boards) == set(boards))
+        correct += ok
+        if show or not ok:
+            print(f"  {'✅' if ok else '❌'} {question} -> {route.name} {route.boards} ({route.reason})")
+    latencies.sort()
+    print(f"routes: {correct}/{len(QUERIES)} correct, p50 {latencies[len(latencies) // 2]:.3f}ms")
+    return len(QUERIES) - correct
+
+
+def bench_cross_posts(router: QueryRouter, today: date, show: bool) -> int:
+    persist_dir = tempfile.mkdtemp(prefix="bench_router_")
+    try:
+        vectordb = ShardedVectorStore(persist_dir, DeterministicFakeEmbedding(size=32))
+        for source_key, board_name, boards, text in NOTICES:
+            metadata = {
+                "source_key": source_key, "board_name": board_name, "source_type": "skku_notice",
+                "source_boards": ",".join(boards), **board_flags(boards),
+            }
+            embedding = vectordb.embeddings.embed_documents([text])[0]
+            vectordb.upsert([source_key], [embedding], [text], [metadata])
+
+        missing = 0
+        for question, expected in CROSS_POST_QUERIES:
+            route = router.route(question, [], today)
+            docs = vectordb.similarity_search(question, k=len(NOTICES), filter=route.search_filter)
+            found = [doc.metadata["source_key"] for doc in docs]
+            ok = expected in found and all(
+                set(route.boards) & set(doc.metadata["source_boards"].split(",")) for doc in docs
+            )
+            missing += not ok
+            if show or not ok:
+                shards = sorted(shards_for_filter(route.search_filter) or ())
+                print(f"  {'✅' if ok else '❌'} {question} boards={route.boards} shards={shards} -> {found}")
+        print(f"cross-posted notices: {len(CROSS_POST_QUERIES) - missing}/{len(CROSS_POST_QUERIES)} found on their boards")
+        return missing
+    finally:
+        shutil.rmtree(persist_dir, ignore_errors=True)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--today", default="2025-10-15", help="기준 날짜 (YYYY-MM-DD)")
+    parser.add_argument("--show", action="store_true", help="질문별 결과 출력")
+    args = parser.parse_args()
+
+    today = date.fromisoformat(args.today)
+    router = QueryRouter()  # 임베딩 없음 -> 키워드 규칙만
+    bench_routes(router, today, args.show)
+    bench_cross_posts(router, today, args.show)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,12 +1,15 @@
 # chatbot.py (로컬 테스트용)
 import os
 
-from langchain_community.vectorstores import Chroma
 from langchain_openai import OpenAIEmbeddings, ChatOpenAI
 from dotenv import load_dotenv
 load_dotenv()
 
-PERSIST_DIR = "chroma_db"
+from index_versions import get_live_dir
+from parent_store import ParentStore, ParentSectionRetriever
+from vector_store import open_vectorstore
+
+PERSIST_DIR = get_live_dir()
 
 def clean_text(text: str) -> str:
     """ 임베딩/LLM에 넣기 전에 텍스트를 UTF-8 기준으로 정리 """
@@ -16,19 +19,16 @@ def clean_text(text: str) -> str:
     return text.encode("utf-8", "ignore").decode("utf-8", "ignore")
 
 def get_retriever():
-    """ Chroma 벡터스토어에서 문서를 가져오는 Retriever(문서 검색 개수(k)=5)를 생성 """
+    """ 샤드 벡터스토어에서 청크를 검색해 청크가 속한 섹션을 가져오는 Retriever를 생성 """
     embeddings = OpenAIEmbeddings(model="text-embedding-3-small")
-    vectordb = Chroma(
-        embedding_function=embeddings,
-        persist_directory=PERSIST_DIR,
-    )
-    return vectordb.as_retriever(search_kwargs={"k": 5})
+    vectordb = open_vectorstore(PERSIST_DIR, embeddings)
+    return ParentSectionRetriever(vectordb, ParentStore(PERSIST_DIR))
 
 
 def main():
-    if not os.path.exists(PERSIST_DIR):
+    if PERSIST_DIR is None or not os.path.exists(PERSIST_DIR):
         raise FileNotFoundError(
-            f"{PERSIST_DIR} not found. Run ingest.py first to build the DB."
+            "Vector DB not found. Run ingest.py first to build the DB."
         )
 
     retriever = get_retriever()
@@ -0,0 +1,241 @@
+"""
+ingest 체크포인트 모듈
+단계별 결과를 cache/checkpoint/에 원자적으로 기록하여,
+중간에 죽은 ingest를 `ingest.py --resume`으로 이어서 실행
+
+- parts/<해시>.json: 출처 단위(게시판 1개, PDF 1개, 재검증 결과)의 수집 결과 (수집되는 대로 기록)
+- state.json: 출처 단위의 인덱싱이 끝날 때마다 크롤링 기록 + 공지 상태 + 인덱싱이 끝난 PDF
+- manifest.json: 진행 단계, 실행 옵션, 스테이징 인덱스 디렉토리, 인덱싱이 끝난 출처 단위, 임베딩 진행 상황
+
+청크는 window 단위로 스테이징 인덱스에 바로 저장되므로 따로 기록하지 않음
+재개 시 같은 디렉토리를 다시 열면 인덱싱이 끝난 출처 단위는 건너뛰고,
+수집만 끝난 출처 단위는 다시 수집하지 않고 기록된 결과로 인덱싱 (이미 저장된 청크는 다시 임베딩하지 않음)
+"""
+
+import os
+import json
+import shutil
+import hashlib
+import threading
+from datetime import datetime
+from typing import Dict, List, Optional, Set, Tuple
+
+from langchain_core.documents import Document
+
+from index_versions import get_live_dir
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+CHECKPOINT_DIR = os.path.join(BASE_DIR, "cache", "checkpoint")
+
+# 진행 단계 (순서대로)
+STAGES = ("indexing", "published")
+
+
+def _write_atomic(path: str, text: str):
+    """임시 파일에 쓰고 fsync 후 교체 (중간에 죽어도 이전 파일 또는 새 파일만 남음)"""
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        f.write(text)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+
+def _doc_to_dict(doc: Document) -> dict:
+    return {"page_content": doc.page_content, "metadata": doc.metadata}
+
+
+def _dict_to_doc(data: dict) -> Document:
+    return Document(page_content=data["page_content"], metadata=data["metadata"])
+
+
+class IngestCheckpoint:
+    """ingest 실행 하나의 체크포인트"""
+
+    def __init__(self, checkpoint_dir: str, manifest: dict):
+        self.checkpoint_dir = checkpoint_dir
+        self.parts_dir = os.path.join(checkpoint_dir, "parts")
+        self.manifest = manifest
+        self._lock = threading.Lock()
+
+    @classmethod
+    def start(cls, options: dict, checkpoint_dir: str = None) -> "IngestCheckpoint":
+        """
+        새 실행 시작 (이전 체크포인트와 배포되지 않은 스테이징 인덱스는 삭제)
+        Args:
+            options: 재개 시 그대로 사용할 실행 옵션 (update_mode 등)
+        """
+        checkpoint_dir = checkpoint_dir or CHECKPOINT_DIR
+        previous = cls.load(checkpoint_dir)
+        if previous is not None:
+            previous.clear()
+
+        os.makedirs(os.path.join(checkpoint_dir, "parts"), exist_ok=True)
+        checkpoint = cls(checkpoint_dir, {
+            "stage": STAGES[0],
+            "started_at": datetime.now().isoformat(timespec="seconds"),
+            "options": options,
+            "staging_dir": None,
+            "parts": [],
+            "indexed": [],
+            "embedded_chunks": 0,
+        })
+        checkpoint._save_manifest()
+        return checkpoint
+
+    @classmethod
+    def load(cls, checkpoint_dir: str = None) -> Optional["IngestCheckpoint"]:
+        """이전 실행의 체크포인트 (없으면 None)"""
+        checkpoint_dir = checkpoint_dir or CHECKPOINT_DIR
+        try:
+            with open(os.path.join(checkpoint_dir, "manifest.json"), 'r', encoding='utf-8') as f:
+                manifest = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if manifest.get("stage") not in STAGES:
+            return None
+        return cls(checkpoint_dir, manifest)
+
+    # ---------- 진행 단계 ----------
+
+    @property
+    def stage(self) -> str:
+        return self.manifest["stage"]
+
+    @property
+    def options(self) -> dict:
+        return self.manifest["options"]
+
+    @property
+    def staging_dir(self) -> Optional[str]:
+        """
+        이전 실행이 만들던 스테이징 인덱스 디렉토리 (남아 있을 때만)
+        배포 직후 죽어서 이미 서비스 중인 디렉토리면 None (서비스 중인 인덱스는 수정하지 않음)
+        """
+        path = self.manifest.get("staging_dir")
+        if not path or not os.path.isdir(path):
+            return None
+        live_dir = get_live_dir()
+        if live_dir and os.path.abspath(path) == os.path.abspath(live_dir):
+            return None
+        return path
+
+    def _save_manifest(self):
+        _write_atomic(
+            os.path.join(self.checkpoint_dir, "manifest.json"),
+            json.dumps(self.manifest, ensure_ascii=False, indent=2),
+        )
+
+    def _set(self, **values):
+        with self._lock:
+            self.manifest.update(values)
+            self.manifest["updated_at"] = datetime.now().isoformat(timespec="seconds")
+            self._save_manifest()
+
+    # ---------- 수집 (출처 단위 결과) ----------
+
+    def _part_path(self, name: str) -> str:
+        digest = hashlib.sha1(name.encode("utf-8")).hexdigest()[:16]
+        return os.path.join(self.parts_dir, f"{digest}.json")
+
+    def save_part(self, name: str, docs: List[Document], extra: dict = None):
+        """수집이 끝난 출처 단위(게시판 1개, PDF 1개 등)의 Document 기록"""
+        os.makedirs(self.parts_dir, exist_ok=True)
+        _write_atomic(self._part_path(name), json.dumps({
+            "name": name,
+            "documents": [_doc_to_dict(d) for d in docs],
+            "extra": extra or {},
+        }, ensure_ascii=False))
+        # 여러 수집 스레드가 동시에 호출하므로 확인과 추가를 한 번의 잠금 안에서 처리
+        with self._lock:
+            if name not in self.manifest["parts"]:
+                self.manifest["parts"].append(name)
+                self.manifest["updated_at"] = datetime.now().isoformat(timespec="seconds")
+                self._save_manifest()
+
+    def load_part(self, name: str) -> Optional[Tuple[List[Document], dict]]:
+        """
+        기록된 부분 결과
+        Returns:
+            tuple: (documents, extra) 또는 None
+        """
+        try:
+            with open(self._part_path(name), 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return None
+        return [_dict_to_doc(d) for d in data["documents"]], data["extra"]
+
+    # ---------- 인덱싱 / 배포 ----------
+
+    def start_indexing(self, staging_dir: str):
+        """새 스테이징 인덱스 디렉토리 기록 (이전 디렉토리에 인덱싱한 기록은 무효)"""
+        self._set(stage="indexing", staging_dir=staging_dir, indexed=[], embedded_chunks=0)
+
+    def is_indexed(self, name: str) -> bool:
+        return name in self.manifest["indexed"]
+
+    def mark_indexed(
+        self,
+        name: str,
+        crawled_data: Dict[str, Set[str]],
+        notice_state: Dict[str, dict],
+        pdf_files: Dict[str, dict] = None
+    ):
+        """출처 단위의 청크가 모두 스테이징 인덱스에 저장됨 (상태를 먼저 기록한 뒤 manifest 갱신)"""
+        self._write_state(crawled_data, notice_state, pdf_files)
+        if name not in self.manifest["indexed"]:
+            self._set(indexed=self.manifest["indexed"] + [name])
+
+    def record_batch(self, embedded_chunks: int):
+        """임베딩 배치 저장 후 진행 상황 기록 (이번 실행에서 임베딩한 누적 청크 수)"""
+        self._set(embedded_chunks=embedded_chunks)
+
+    def mark_published(
+        self,
+        crawled_data: Dict[str, Set[str]],
+        notice_state: Dict[str, dict],
+        pdf_files: Dict[str, dict] = None
+    ):
+        """배포(또는 변경 없음) 완료 - 이후에는 크롤링 기록/공지 상태/PDF manifest 저장만 남음"""
+        self._write_state(crawled_data, notice_state, pdf_files)
+        self._set(stage="published")
+
+    def _write_state(
+        self,
+        crawled_data: Dict[str, Set[str]],
+        notice_state: Dict[str, dict],
+        pdf_files: Dict[str, dict] = None
+    ):
+        _write_atomic(os.path.join(self.checkpoint_dir, "state.json"), json.dumps({
+            "crawled_data": {board: sorted(nums) for board, nums in crawled_data.items()},
+            "notice_state": notice_state,
+            "pdf_files": pdf_files or {},
+        }, ensure_ascii=False))
+
+    def load_state(self) -> Optional[Tuple[Dict[str, Set[str]], Dict[str, dict]]]:
+        """
+        마지막으로 기록된 크롤링 기록 + 공지 상태
+        Returns:
+            tuple: (crawled_data, notice_state) 또는 None (인덱싱이 끝난 출처 단위가 없음)
+        """
+        try:
+            with open(os.path.join(self.checkpoint_dir, "state.json"), 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return None
+        return {board: set(nums) for board, nums in data["crawled_data"].items()}, data["notice_state"]
+
+    def load_pdf_files(self) -> Dict[str, dict]:
+        """마지막으로 기록된 인덱싱이 끝난 PDF ({sha256: 기록}, pdf_source manifest 형식)"""
+        try:
+            with open(os.path.join(self.checkpoint_dir, "state.json"), 'r', encoding='utf-8') as f:
+                return json.load(f).get("pdf_files", {})
+        except (OSError, ValueError):
+            return {}
+
+    def clear(self):
+        """체크포인트 삭제 (배포되지 않은 스테이징 인덱스도 함께 삭제)"""
+        if self.stage != "published" and self.staging_dir:
+            shutil.rmtree(self.staging_dir, ignore_errors=True)
+        shutil.rmtree(self.checkpoint_dir, ignore_errors=True)
@@ -0,0 +1,242 @@
+"""
+구조 기반 문서 분할 모듈
+RecursiveCharacterTextSplitter(400자, 100자 겹침) 대신 문서 구조를 따라 분할
+- 분할 단위: 문장(한국어 "~다." 등 문장 끝), 목록 항목("- ", "1.", "①" 등), 학사일정 행, "구분:/이름:" 같은 레코드 묶음
+  (단위 중간에서 자르지 않고, 단위 하나가 자식 청크보다 길 때만 글자 수로 나눔)
+- 부모(섹션): 빈 줄/제목("[평시]", "생활/체육시설:" 등) 경계를 따라 PARENT_MAX_CHARS까지 묶음
+  (학사일정처럼 긴 표는 월이 바뀌는 행에서 나눔)
+- 자식(청크): 부모 안에서 CHILD_MAX_CHARS까지 묶어 임베딩 (겹침 없음)
+  앞 청크에 있던 섹션 제목은 자식 앞에 붙여서 "[시험기간]"의 운영시간이 평시와 섞이지 않게 함
+- 자식 메타데이터의 parent_id로 부모 섹션을 찾아 프롬프트에 넣음 (parent_store.py)
+  부모에 자식이 하나뿐이면 부모를 따로 저장하지 않음 (자식이 곧 섹션)
+"""
+
+import re
+import hashlib
+from dataclasses import dataclass
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from langchain_core.documents import Document
+from langchain_text_splitters import RecursiveCharacterTextSplitter
+
+from vector_store import get_source_key
+
+PARENT_MAX_CHARS = 1000  # 부모 섹션 최대 글자 수
+PARENT_MIN_CHARS = 300  # 이보다 짧은 섹션은 다음 제목/월 경계에서 나누지 않고 이어 붙임
+CHILD_MAX_CHARS = 250  # 자식 청크 최대 글자 수 (임베딩/검색 단위)
+RECORD_MAX_LINES = 6  # "키: 값" 줄이 이 이하로 모인 빈 줄 사이 묶음은 레코드 하나로 취급
+
+# 섹션 제목 (항상 새 부모 시작): [평시], 【안내】, ■ 신청 방법, Ⅰ. 개요
+_SECTION_PATTERN = re.compile(r"^(\[[^\]]+\]|【[^】]+】|[■□◆◇▶]\s*\S.{0,40}|[ⅠⅡⅢⅣⅤⅥⅦⅧⅨⅩ]\.?\s*\S.{0,40})$")
+# 소제목 (부모가 충분히 길면 새 부모 시작): "생활/체육시설:", "가. 신청 기간", "1. 모집 개요"
+_HEADING_PATTERN = re.compile(r"^([^:]{1,40}:|([가-하]|\d{1,2})\.\s+[^.:]{1,30}[^.:다요])$")
+# 목록 항목
+_LIST_ITEM_PATTERN = re.compile(r"^([-•·*▪◦○●※]|\d{1,2}[.)]|\(\d{1,2}\)|[①-⑳]|[가-하][.)])\s*\S")
+# "키: 값" 레코드 줄 (운영시간: 08:00 ~ 21:40)
+_FIELD_PATTERN = re.compile(r"^[^:\s][^:]{0,15}:\s*\S")
+# 학사일정 등 날짜 행의 첫 날짜 (월 경계 판단용)
+_DATE_PATTERN = re.compile(r"(20\d{2})[-./]\s*(\d{1,2})[-./]\s*\d{1,2}")
+# 문장 끝: 한글/닫는 괄호·따옴표 뒤의 . ! ? 다음 공백 (12. 14. 같은 숫자 뒤 마침표는 제외)
+_SENTENCE_END_PATTERN = re.compile(r"(?<=[가-힣)\]\"'’”][.!?])\s+|(?<=[.!?][)\]\"'’”])\s+")
+
+_long_unit_splitter = RecursiveCharacterTextSplitter(
+    chunk_size=CHILD_MAX_CHARS,
+    chunk_overlap=0,
+    separators=["\n", ", ", " ", ""],
+)
+
+
+@dataclass
+class _Unit:
+    """분할 단위 (문장 / 목록 항목 / 일정 행 / 레코드 / 제목)"""
+    text: str
+    sep: str  # 앞 단위와 이어 붙일 구분자 ("\n\n", "\n", " ")
+    kind: str = "text"  # "text", "title" (문서 첫 줄 제목), "heading" (소제목), "section" (섹션 제목)
+    month: Optional[str] = None  # 날짜 행이면 "YYYY-MM"
+
+
+def _line_month(line: str) -> Optional[str]:
+    match = _DATE_PATTERN.search(line)
+    return f"{match.group(1)}-{int(match.group(2)):02d}" if match else None
+
+
+def _split_long(text: str, sep: str, month: Optional[str] = None) -> Iterator[_Unit]:
+    """자식 청크보다 긴 단위는 줄/쉼표/공백 경계에서 나눔"""
+    if len(text) <= CHILD_MAX_CHARS:
+        yield _Unit(text, sep, month=month)
+        return
+    for i, piece in enumerate(_long_unit_splitter.split_text(text)):
+        yield _Unit(piece, sep if i == 0 else " ", month=month)
+
+
+def _line_units(line: str, sep: str) -> Iterator[_Unit]:
+    """한 줄 -> 제목 / 목록 항목·일정 행 / 문장 단위"""
+    if _SECTION_PATTERN.match(line):
+        yield _Unit(line, sep, "section")
+        return
+    if _HEADING_PATTERN.match(line):
+        yield _Unit(line, sep, "heading")
+        return
+    month = _line_month(line)
+    if month or _LIST_ITEM_PATTERN.match(line) or len(line) <= CHILD_MAX_CHARS // 2:
+        yield from _split_long(line, sep, month)
+        return
+    for i, sentence in enumerate(s for s in _SENTENCE_END_PATTERN.split(line) if s.strip()):
+        yield from _split_long(sentence.strip(), sep if i == 0 else " ")
+
+
+def _is_title(line: str) -> bool:
+    """문서 첫 줄이 제목인지 (짧고, 문장/목록/"키: 값"/날짜 행이 아님)"""
+    return (
+        len(line) <= 60
+        and not line.endswith((".", "다", ":"))
+        and not _FIELD_PATTERN.match(line)
+        and not _LIST_ITEM_PATTERN.match(line)
+        and not _SECTION_PATTERN.match(line)
+        and _line_month(line) is None
+    )
+
+
+def iter_units(text: str) -> Iterator[_Unit]:
+    """본문 -> 분할 단위 (빈 줄로 나뉜 블록 순서대로)"""
+    for block_index, block in enumerate(re.split(r"\n\s*\n", text.strip())):
+        lines = [line.strip() for line in block.splitlines() if line.strip()]
+        if not lines:
+            continue
+        block_sep = "\n\n" if block_index else ""
+        if block_index == 0 and _is_title(lines[0]):
+            # "자연과학캠퍼스 주요 건물 안내" 같은 문서 제목 줄은 혼자 청크가 되지 않게 다음 단위와 묶음
+            yield _Unit(lines[0], "", "title")
+            lines, block_sep = lines[1:], "\n"
+            if not lines:
+                continue
+        body = [line for line in lines if not _SECTION_PATTERN.match(line)]
+        is_record = 2 <= len(body) <= RECORD_MAX_LINES and all(_FIELD_PATTERN.match(line) for line in body)
+        if is_record and len("\n".join(lines)) <= CHILD_MAX_CHARS:
+            # 도서관 "구분:/이름:/운영시간:/비고:"처럼 함께 읽어야 하는 줄은 한 단위로
+            for line in lines[:len(lines) - len(body)]:
+                yield _Unit(line, block_sep, "section")
+                block_sep = "\n"
+            yield _Unit("\n".join(body), block_sep)
+            continue
+        for line_index, line in enumerate(lines):
+            yield from _line_units(line, block_sep if line_index == 0 else "\n")
+
+
+def _join(units: List[_Unit]) -> str:
+    return "".join((unit.sep if i else "") + unit.text for i, unit in enumerate(units))
+
+
+def _pack_parents(units: List[_Unit]) -> List[List[_Unit]]:
+    """단위 -> 부모 섹션 (섹션 제목은 항상, 소제목/월 경계는 PARENT_MIN_CHARS 이상일 때 나눔)"""
+    parents = []
+    current: List[_Unit] = []
+    size = 0
+    month = None
+    for unit in units:
+        has_body = any(u.kind == "text" for u in current)
+        boundary = has_body and (
+            unit.kind == "section"
+            or size + len(unit.sep) + len(unit.text) > PARENT_MAX_CHARS
+            or (size >= PARENT_MIN_CHARS and (
+                unit.kind == "heading" or (unit.month and month and unit.month != month)
+            ))
+        )
+        if boundary:
+            # 끝에 남은 제목은 다음 섹션으로 넘김
+            carry = []
+            while current and current[-1].kind != "text":
+                carry.insert(0, current.pop())
+            parents.append(current)
+            current = carry
+            size = len(_join(current))
+        current.append(unit)
+        size += len(unit.sep) + len(unit.text)
+        month = unit.month or month
+    if current:
+        parents.append(current)
+    return parents
+
+
+def _pack_children(units: List[_Unit], context: List[str]) -> Tuple[List[str], List[str]]:
+    """
+    부모 섹션 -> 자식 청크 텍스트
+    Args:
+        context: 이 부모 앞에서 이어지는 [섹션 제목, 소제목] (자식 앞에 붙임)
+    Returns:
+        tuple: (자식 청크 텍스트 목록, 다음 부모로 이어질 context)
+    """
+    section, heading = context
+    children = []
+    current: List[_Unit] = []
+    size = 0
+
+    def flush():
+        if not current:
+            return
+        text = _join(current).strip()
+        prefix = [h for h in (section, heading) if h and not text.startswith(h) and h not in text]
+        children.append("\n".join(prefix + [text]))
+
+    for unit in units:
+        is_title = unit.kind != "text"
+        has_body = any(u.kind == "text" for u in current)
+        if current and has_body and (is_title or size + len(unit.sep) + len(unit.text) > CHILD_MAX_CHARS):
+            flush()
+            current, size = [], 0
+        if unit.kind == "section":
+            section, heading = unit.text, None
+        elif unit.kind == "heading":
+            heading = unit.text
+        if not current:
+            # 이전 청크에서 넘어온 제목은 prefix로 붙이므로 구분자 없이 시작
+            unit = _Unit(unit.text, "", unit.kind, unit.month)
+        current.append(unit)
+        size += len(unit.sep) + len(unit.text)
+    flush()
+    return children, [section, heading]
+
+
+def make_parent_id(source_key: str, text: str) -> str:
+    """출처 키 + 섹션 본문 해시 (같은 섹션은 실행마다 같은 ID)"""
+    return hashlib.sha256(f"{source_key}\n{text}".encode("utf-8")).hexdigest()[:32]
+
+
+def split_document(doc: Document) -> Tuple[List[Document], Dict[str, Tuple[str, str]]]:
+    """
+    문서 하나를 부모 섹션 / 자식 청크로 분할
+    Returns:
+        tuple: (자식 청크 Document 목록, {parent_id: (source_key, 섹션 본문)})
+    """
+    source_key = doc.metadata.get("source_key") or get_source_key(doc.metadata)
+    children = []
+    parents = {}
+    context = [None, None]
+    for parent_units in _pack_parents(list(iter_units(doc.page_content or ""))):
+        texts, context = _pack_children(parent_units, context)
+        parent_id = None
+        if len(texts) > 1:
+            parent_text = _join(parent_units).strip()
+            parent_id = make_parent_id(source_key, parent_text)
+            parents[parent_id] = (source_key, parent_text)
+        for text in texts:
+            metadata = dict(doc.metadata)
+            if parent_id:
+                metadata["parent_id"] = parent_id
+            children.append(Document(page_content=text, metadata=metadata))
+    return children, parents
+
+
+def split_documents(docs: List[Document]) -> Tuple[List[Document], Dict[str, Tuple[str, str]]]:
+    """
+    문서 목록을 구조 기반으로 분할
+    Returns:
+        tuple: (자식 청크 목록, {parent_id: (source_key, 섹션 본문)})
+    """
+    children = []
+    parents = {}
+    for doc in docs:
+        doc_children, doc_parents = split_document(doc)
+        children.extend(doc_children)
+        parents.update(doc_parents)
+    return children, parents
@@ -0,0 +1,393 @@
+"""
+크롤링 상태 저장소 모듈
+crawled_data.json / notice_state.json 대신 SQLite(crawl_state.sqlite3)에 저장
+- boards: 게시판별 watermark (가장 최근에 수집한 글 번호, 글 수, 마지막으로 새 글을 수집한 시각)
+- posts: 게시판별로 수집한 글 번호 ((board_name, post_num) 인덱스)
+- notices: 공지별 본문 해시, 최종 수정일, 청크 ID, 메타데이터, 수집/확인 시각
+  (게시일 date_ts 컬럼 + (board_name, date_ts) 인덱스로 공지 목록 카탈로그 역할도 함, notice_catalog.py)
+  (minhash: 게시판 간 중복 공지 감지용 MinHash 서명, near_dup.py)
+
+저장할 때는 바뀐 행만 트랜잭션 하나로 기록하므로 파일 전체를 다시 쓰지 않고,
+중간에 죽어도 이전 상태가 그대로 남음
+ingest가 migrate=True로 열 때만 기존 JSON 파일을 가져온 뒤 *.json.bak으로 이름을 바꿈
+(rag_api는 get_crawl_state_reader()로 읽기 전용으로 열어 스키마 변경/가져오기를 하지 않음)
+"""
+
+import os
+import json
+import sqlite3
+import threading
+from datetime import datetime
+from typing import Dict, List, Optional, Set
+
+from date_utils import to_timestamp
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+CRAWL_STATE_FILE = os.path.join(BASE_DIR, "crawl_state.sqlite3")
+LEGACY_CRAWLED_DATA_FILE = os.path.join(BASE_DIR, "crawled_data.json")  # 이전 버전의 게시판별 post_num
+LEGACY_NOTICE_STATE_FILE = os.path.join(BASE_DIR, "notice_state.json")  # 이전 버전의 공지 상태
+
+# notices 테이블 컬럼 (source_key 제외, 공지 상태 dict의 키와 같음)
+NOTICE_COLUMNS = (
+    "board_name", "content_hash", "modified", "chunk_ids", "metadata", "fetched_at", "checked_at", "minhash"
+)
+_JSON_COLUMNS = {"chunk_ids", "metadata"}
+
+
+def _post_sort_key(post_num: str) -> tuple:
+    """글 번호 비교용 (숫자 번호 우선, 큰 번호가 최신)"""
+    return (1, int(post_num), "") if post_num.isdigit() else (0, 0, post_num)
+
+
+def _notice_date_ts(metadata: dict, modified: Optional[str] = None) -> Optional[int]:
+    """목록 정렬/기간 필터용 게시일 (메타데이터 date_ts, 없으면 날짜 문자열 변환)"""
+    date_ts = metadata.get("date_ts")
+    if date_ts is not None:
+        return int(date_ts)
+    return to_timestamp(metadata.get("date") or modified)
+
+
+def _notice_row(record: dict) -> tuple:
+    """공지 상태 dict -> notices 행 (source_key 제외, 마지막은 date_ts)"""
+    row = []
+    for column in NOTICE_COLUMNS:
+        value = record.get(column)
+        if column in _JSON_COLUMNS:
+            value = json.dumps(value or ([] if column == "chunk_ids" else {}), ensure_ascii=False, sort_keys=True)
+        row.append(value)
+    row.append(_notice_date_ts(record.get("metadata") or {}, record.get("modified")))
+    return tuple(row)
+
+
+def _notice_record(row: tuple) -> dict:
+    """notices 행 (source_key 제외) -> 공지 상태 dict"""
+    return {
+        column: json.loads(value) if column in _JSON_COLUMNS else value
+        for column, value in zip(NOTICE_COLUMNS, row)
+    }
+
+
+class CrawlStateStore:
+    """크롤링 기록 + 공지 상태 SQLite 저장소"""
+
+    def __init__(self, path: str = CRAWL_STATE_FILE, migrate: bool = False, read_only: bool = False):
+        """
+        Args:
+            path: SQLite 파일 경로
+            migrate: 이전 JSON 파일 가져오기 (ingest만 사용)
+            read_only: 읽기 전용으로 열기 (스키마 생성/변경 없음, 파일이 아직 없으면 빈 저장소로 보고 생긴 뒤 연결)
+        """
+        self.path = path
+        self.read_only = read_only
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        if read_only:
+            self._connected()
+            return
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS meta (
+                key TEXT PRIMARY KEY,
+                value TEXT
+            );
+            CREATE TABLE IF NOT EXISTS boards (
+                board_name TEXT PRIMARY KEY,
+                last_post_num TEXT,
+                post_count INTEGER NOT NULL DEFAULT 0,
+                updated_at TEXT
+            );
+            CREATE TABLE IF NOT EXISTS posts (
+                board_name TEXT NOT NULL,
+                post_num TEXT NOT NULL,
+                first_seen_at TEXT,
+                PRIMARY KEY (board_name, post_num)
+            ) WITHOUT ROWID;
+            CREATE TABLE IF NOT EXISTS notices (
+                source_key TEXT PRIMARY KEY,
+                board_name TEXT NOT NULL,
+                content_hash TEXT NOT NULL,
+                modified TEXT,
+                chunk_ids TEXT NOT NULL,
+                metadata TEXT NOT NULL,
+                fetched_at TEXT,
+                checked_at TEXT,
+                date_ts INTEGER,
+                minhash TEXT
+            );
+            """
+        )
+        self._migrate()
+        self._conn.executescript(
+            """
+            CREATE INDEX IF NOT EXISTS notices_date ON notices (date_ts DESC, source_key);
+            CREATE INDEX IF NOT EXISTS notices_board_date ON notices (board_name, date_ts DESC, source_key);
+            """
+        )
+        self._conn.commit()
+        if migrate:
+            self.import_legacy_json()
+
+    def _connected(self) -> bool:
+        """연결 여부 (읽기 전용은 파일이 생긴 뒤 처음 읽을 때 연결, 아직 없으면 False)"""
+        if self._conn is None and os.path.exists(self.path):
+            self._conn = sqlite3.connect(f"file:{self.path}?mode=ro", uri=True, check_same_thread=False)
+        return self._conn is not None
+
+    def _migrate(self):
+        """
+        이전 저장소에 없는 컬럼 추가
+        - date_ts: 메타데이터로 채움
+        - minhash: 비워 둠 (다음에 수집/변경되는 공지부터 기록)
+        """
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(notices)")}
+        if "minhash" not in columns:
+            with self._conn:
+                self._conn.execute("ALTER TABLE notices ADD COLUMN minhash TEXT")
+        if "date_ts" in columns:
+            return
+        with self._conn:
+            self._conn.execute("ALTER TABLE notices ADD COLUMN date_ts INTEGER")
+            self._conn.execute("DROP INDEX IF EXISTS notices_board_modified")
+            rows = self._conn.execute("SELECT source_key, modified, metadata FROM notices").fetchall()
+            self._conn.executemany(
+                "UPDATE notices SET date_ts = ? WHERE source_key = ?",
+                [(_notice_date_ts(json.loads(metadata), modified), source_key)
+                 for source_key, modified, metadata in rows],
+            )
+
+    # ---------- 이전 JSON 파일 가져오기 ----------
+
+    def import_legacy_json(self):
+        """crawled_data.json / notice_state.json을 한 번만 가져옴 (가져온 파일은 *.json.bak으로 보관)"""
+        if self.read_only:
+            raise ValueError("Cannot import legacy crawl state into a read-only store")
+        with self._lock:
+            if self._conn.execute("SELECT 1 FROM meta WHERE key = 'legacy_imported'").fetchone():
+                return
+
+        crawled_data = {}
+        notice_state = {}
+        try:
+            if os.path.exists(LEGACY_CRAWLED_DATA_FILE):
+                with open(LEGACY_CRAWLED_DATA_FILE, 'r', encoding='utf-8') as f:
+                    crawled_data = {board: set(nums) for board, nums in json.load(f).items()}
+            if os.path.exists(LEGACY_NOTICE_STATE_FILE):
+                with open(LEGACY_NOTICE_STATE_FILE, 'r', encoding='utf-8') as f:
+                    notice_state = json.load(f)
+        except Exception as e:
+            # 깨진 파일은 가져오지 않고 그대로 둠 (다음 실행에서 다시 시도)
+            print(f"⚠️ Error importing legacy crawl state: {e}")
+            return
+
+        with self._lock, self._conn:
+            self._sync_post_nums(crawled_data)
+            self._sync_notices(notice_state)
+            self._conn.execute(
+                "INSERT OR REPLACE INTO meta (key, value) VALUES ('legacy_imported', ?)",
+                (datetime.now().isoformat(timespec="seconds"),),
+            )
+
+        for path in (LEGACY_CRAWLED_DATA_FILE, LEGACY_NOTICE_STATE_FILE):
+            if os.path.exists(path):
+                os.replace(path, f"{path}.bak")
+        if crawled_data or notice_state:
+            print(f"📦 Imported legacy crawl state: {sum(len(n) for n in crawled_data.values())} posts, "
+                  f"{len(notice_state)} notices")
+
+    # ---------- 게시판별 글 번호 ----------
+
+    def load_post_nums(self) -> Dict[str, Set[str]]:
+        """
+        Returns:
+            dict: {"소프트웨어학과": {"909", "908", ...}, "기숙사": {...}, ...}
+        """
+        crawled_data: Dict[str, Set[str]] = {}
+        with self._lock:
+            if not self._connected():
+                return crawled_data
+            for board_name, post_num in self._conn.execute("SELECT board_name, post_num FROM posts"):
+                crawled_data.setdefault(board_name, set()).add(post_num)
+        return crawled_data
+
+    def watermarks(self) -> Dict[str, dict]:
+        """
+        Returns:
+            dict: {board_name: {"last_post_num", "post_count", "updated_at"}}
+        """
+        with self._lock:
+            if not self._connected():
+                return {}
+            rows = self._conn.execute("SELECT board_name, last_post_num, post_count, updated_at FROM boards")
+            return {
+                board_name: {"last_post_num": last_post_num, "post_count": post_count, "updated_at": updated_at}
+                for board_name, last_post_num, post_count, updated_at in rows
+            }
+
+    def save_post_nums(self, crawled_data: Dict[str, Set[str]]) -> Dict[str, int]:
+        """
+        crawled_data와 같아지도록 바뀐 글 번호만 추가/삭제 (트랜잭션 하나)
+        Returns:
+            dict: {"added": 추가한 글 수, "removed": 삭제한 글 수}
+        """
+        with self._lock, self._conn:
+            return self._sync_post_nums(crawled_data)
+
+    def _sync_post_nums(self, crawled_data: Dict[str, Set[str]]) -> Dict[str, int]:
+        now = datetime.now().isoformat(timespec="seconds")
+        existing: Dict[str, Set[str]] = {}
+        for board_name, post_num in self._conn.execute("SELECT board_name, post_num FROM posts"):
+            existing.setdefault(board_name, set()).add(post_num)
+
+        added = removed = 0
+        for board_name in set(existing) | set(crawled_data):
+            new_nums = set(crawled_data.get(board_name, set()))
+            old_nums = existing.get(board_name, set())
+            to_add = new_nums - old_nums
+            to_remove = old_nums - new_nums
+            if not to_add and not to_remove:
+                continue
+
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO posts (board_name, post_num, first_seen_at) VALUES (?, ?, ?)",
+                [(board_name, post_num, now) for post_num in to_add],
+            )
+            self._conn.executemany(
+                "DELETE FROM posts WHERE board_name = ? AND post_num = ?",
+                [(board_name, post_num) for post_num in to_remove],
+            )
+            if new_nums:
+                last_post_num = max(new_nums, key=_post_sort_key)
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO boards (board_name, last_post_num, post_count, updated_at) "
+                    "VALUES (?, ?, ?, ?)",
+                    (board_name, last_post_num, len(new_nums), now),
+                )
+            else:
+                self._conn.execute("DELETE FROM boards WHERE board_name = ?", (board_name,))
+            added += len(to_add)
+            removed += len(to_remove)
+        return {"added": added, "removed": removed}
+
+    def reset_posts(self, board_name: Optional[str] = None):
+        """글 번호 기록 삭제 (다음 실행에서 다시 크롤링, board_name이 없으면 전체 게시판)"""
+        with self._lock, self._conn:
+            if board_name is None:
+                self._conn.execute("DELETE FROM posts")
+                self._conn.execute("DELETE FROM boards")
+            else:
+                self._conn.execute("DELETE FROM posts WHERE board_name = ?", (board_name,))
+                self._conn.execute("DELETE FROM boards WHERE board_name = ?", (board_name,))
+
+    # ---------- 공지 상태 ----------
+
+    def load_notices(self) -> Dict[str, dict]:
+        """
+        Returns:
+            dict: {source_key: {"board_name", "content_hash", "modified", "chunk_ids", "metadata", ...}}
+        """
+        with self._lock:
+            if not self._connected():
+                return {}
+            rows = self._conn.execute(f"SELECT source_key, {', '.join(NOTICE_COLUMNS)} FROM notices").fetchall()
+        return {row[0]: _notice_record(row[1:]) for row in rows}
+
+    def save_notices(self, state: Dict[str, dict]) -> Dict[str, int]:
+        """
+        state와 같아지도록 바뀐 공지만 upsert/삭제 (트랜잭션 하나)
+        Returns:
+            dict: {"updated": 추가/변경한 공지 수, "deleted": 삭제한 공지 수}
+        """
+        with self._lock, self._conn:
+            return self._sync_notices(state)
+
+    def _sync_notices(self, state: Dict[str, dict]) -> Dict[str, int]:
+        columns = ", ".join(NOTICE_COLUMNS + ("date_ts",))
+        existing = {
+            row[0]: tuple(row[1:])
+            for row in self._conn.execute(f"SELECT source_key, {columns} FROM notices")
+        }
+        changed = []
+        for source_key, record in state.items():
+            row = _notice_row(record)
+            if existing.get(source_key) != row:
+                changed.append((source_key, *row))
+        deleted = [(source_key,) for source_key in existing if source_key not in state]
+
+        self._conn.executemany(
+            f"INSERT OR REPLACE INTO notices (source_key, {columns}) "
+            f"VALUES ({', '.join('?' * (len(NOTICE_COLUMNS) + 2))})",
+            changed,
+        )
+        self._conn.executemany("DELETE FROM notices WHERE source_key = ?", deleted)
+        if changed or deleted:
+            # 공지 목록 스냅샷(notice_catalog)이 다시 읽도록 버전 증가
+            self._conn.execute(
+                "INSERT INTO meta (key, value) VALUES ('notices_version', '1') "
+                "ON CONFLICT(key) DO UPDATE SET value = CAST(value AS INTEGER) + 1"
+            )
+        return {"updated": len(changed), "deleted": len(deleted)}
+
+    # ---------- 공지 목록 ----------
+
+    def notices_version(self) -> int:
+        """공지가 바뀔 때마다 증가하는 번호"""
+        with self._lock:
+            if not self._connected():
+                return 0
+            row = self._conn.execute("SELECT value FROM meta WHERE key = 'notices_version'").fetchone()
+        return int(row[0]) if row else 0
+
+    def list_notices(self, limit: Optional[int] = None) -> List[tuple]:
+        """
+        게시일 최신순 공지 ((date_ts, source_key) 인덱스 순서)
+        Returns:
+            list: [(source_key, board_name, date_ts, metadata), ...]
+        """
+        query = "SELECT source_key, board_name, date_ts, metadata FROM notices ORDER BY date_ts DESC, source_key"
+        params = ()
+        if limit is not None:
+            query += " LIMIT ?"
+            params = (limit,)
+        with self._lock:
+            if not self._connected():
+                return []
+            rows = self._conn.execute(query, params).fetchall()
+        return [(source_key, board_name, date_ts, json.loads(metadata))
+                for source_key, board_name, date_ts, metadata in rows]
+
+    def close(self):
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+
+
+_store: Optional[CrawlStateStore] = None
+_reader: Optional[CrawlStateStore] = None
+_store_lock = threading.Lock()
+
+
+def get_crawl_state(migrate: bool = False) -> CrawlStateStore:
+    """
+    프로세스 전체에서 공유하는 크롤링 상태 저장소 (ingest용, 읽기/쓰기)
+    Args:
+        migrate: 이전 JSON 파일이 있으면 가져오기 (ingest 시작 시 한 번)
+    """
+    global _store
+    with _store_lock:
+        if _store is None:
+            _store = CrawlStateStore(CRAWL_STATE_FILE, migrate=migrate)
+        elif migrate:
+            _store.import_legacy_json()
+        return _store
+
+
+def get_crawl_state_reader() -> CrawlStateStore:
+    """프로세스 전체에서 공유하는 읽기 전용 크롤링 상태 저장소 (rag_api용)"""
+    global _reader
+    with _store_lock:
+        if _reader is None:
+            _reader = CrawlStateStore(CRAWL_STATE_FILE, read_only=True)
+        return _reader
@@ -1,3 +1,4 @@
-from .cse_notice import crawl_notices, notices_to_documents
+from .boards import BOARD_SPECS, BoardSpec, Field, get_board_spec
+from .engine import crawl_board, notices_to_documents
 
-__all__ = ['crawl_notices', 'notices_to_documents']
\ No newline at end of file
+__all__ = ['BOARD_SPECS', 'BoardSpec', 'Field', 'get_board_spec', 'crawl_board', 'notices_to_documents']
@@ -0,0 +1,87 @@
+"""
+상세페이지 비동기 동시 요청 모듈
+httpx.AsyncClient로 호스트별 최대 concurrency개의 요청을 동시에 보내고,
+요청 시작은 호스트별 token bucket으로 제한 (결과는 입력 URL 순서 유지)
+"""
+
+import asyncio
+from collections import defaultdict
+from typing import List, NamedTuple, Optional, Union
+from urllib.parse import urlparse
+
+import httpx
+from bs4 import UnicodeDammit
+
+from crawler.rate_limiter import get_host_bucket, DEFAULT_RATE_LIMIT, DEFAULT_BURST
+
+DETAIL_CONCURRENCY = 4  # 호스트별 동시 요청 수
+
+
+class FetchResult(NamedTuple):
+    """응답 결과 (304면 html은 빈 문자열)"""
+    status: int
+    html: str
+    etag: Optional[str]
+    last_modified: Optional[str]
+
+
+def decode_html(content: bytes, charset: Optional[str]) -> str:
+    """charset 헤더가 없으면 meta charset/내용으로 인코딩 추정"""
+    if charset:
+        return content.decode(charset, errors="replace")
+    return UnicodeDammit(content, is_html=True).unicode_markup or ""
+
+
+async def _fetch_all(
+    urls: List[str],
+    headers: dict,
+    request_headers: List[dict],
+    concurrency: int,
+    rate_limit: float,
+    timeout: float
+) -> List[Union[FetchResult, Exception]]:
+    semaphores = defaultdict(lambda: asyncio.Semaphore(max(1, concurrency)))
+    limits = httpx.Limits(max_connections=None, max_keepalive_connections=max(1, concurrency))
+
+    async with httpx.AsyncClient(headers=headers, timeout=timeout, limits=limits, follow_redirects=True) as client:
+        async def fetch(url: str, extra_headers: dict) -> FetchResult:
+            host = urlparse(url).netloc
+            async with semaphores[host]:
+                await get_host_bucket(url, rate_limit, DEFAULT_BURST).acquire_async()
+                response = await client.get(url, headers=extra_headers)
+                if response.status_code == 304:
+                    return FetchResult(304, "", None, None)
+                response.raise_for_status()
+                return FetchResult(
+                    response.status_code,
+                    decode_html(response.content, response.charset_encoding),
+                    response.headers.get("ETag"),
+                    response.headers.get("Last-Modified"),
+                )
+
+        return await asyncio.gather(
+            *(fetch(url, extra) for url, extra in zip(urls, request_headers)),
+            return_exceptions=True,
+        )
+
+
+def fetch_pages(
+    urls: List[str],
+    headers: dict = None,
+    request_headers: List[dict] = None,
+    concurrency: int = DETAIL_CONCURRENCY,
+    rate_limit: float = DEFAULT_RATE_LIMIT,
+    timeout: float = 10
+) -> List[Union[FetchResult, Exception]]:
+    """
+    여러 페이지를 동시에 가져옴 (이벤트 루프가 없는 스레드에서 호출)
+    Args:
+        headers: 모든 요청 공통 헤더
+        request_headers: URL별 추가 헤더 (조건부 GET 등)
+    Returns:
+        list: [FetchResult 또는 Exception, ...] - urls 순서 유지
+    """
+    if not urls:
+        return []
+    request_headers = request_headers or [{} for _ in urls]
+    return asyncio.run(_fetch_all(urls, headers or {}, request_headers, concurrency, rate_limit, timeout))
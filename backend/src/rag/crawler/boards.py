@@ -0,0 +1,176 @@
+"""
+게시판 크롤링 설정 (BoardSpec)
+새 게시판은 여기에 BoardSpec 하나만 추가하면 engine.crawl_board가
+페이지 순회 / 기존 글 발견 시 중단 / 고정 공지 처리 / 상세페이지 수집을 동일하게 처리
+"""
+
+import re
+from dataclasses import dataclass, field
+from functools import cached_property
+from typing import Callable, Dict, Optional, Tuple
+from urllib.parse import urlparse
+
+from crawler.parsing import SelectorStrainer, css_strainer
+
+
+@dataclass(frozen=True)
+class Field:
+    """목록 행(row) 안의 값 위치"""
+    selector: Optional[str] = None  # row 기준 CSS 선택자 (None이면 row 자체)
+    index: int = 0  # 여러 개 매칭될 때 위치 (음수면 뒤에서부터)
+    attr: Optional[str] = None  # 텍스트 대신 읽을 속성 (예: "href")
+
+
+@dataclass(frozen=True)
+class BoardSpec:
+    board_name: str  # crawled_data / notice_state / 메타데이터의 게시판 이름
+    base_url: str
+    list_url: str  # 목록 URL 템플릿 ({base_url}, {limit}, {offset})
+    row_selector: str  # 목록의 글 한 줄
+    title: Field  # 제목 (링크도 같은 요소의 href)
+    body_selectors: Tuple[str, ...]  # 본문 후보 (앞에서부터 우선)
+    fields: Dict[str, Field] = field(default_factory=dict)  # 추가 필드 (number, date, author, category 등)
+    page_size: int = 10
+    id_field: Optional[str] = "number"  # 글 번호로 쓸 fields 키
+    id_prefix: str = ""  # 글 번호 앞의 접두어 제거 (예: "No.")
+    id_query_param: Optional[str] = None  # 링크 쿼리 파라미터에서 글 번호 추출 (예: "articleNo")
+    id_key: str = "post_num"  # Document 메타데이터의 글 번호 키
+    is_fixed: Optional[Callable[[str], bool]] = None  # 글 번호 원문으로 고정 공지 판단
+    body_fallback: str = "empty"  # 본문 요소가 없을 때: "empty" / "full_text"
+    body_marker: Optional[str] = None  # full_text 사용 시 이 문구 뒤만 본문으로 사용
+    parse_detail_meta: Optional[Callable[[str], dict]] = None  # 상세페이지 전체 텍스트에서 추가 메타데이터 추출
+    doc_fields: Tuple[str, ...] = ("title", "date", "post_num", "link")  # Document 메타데이터로 옮길 필드
+    notice_extra: Dict[str, str] = field(default_factory=dict)  # notice에 고정으로 붙일 값
+    fetch_mode: str = "auto"  # http / browser / auto
+    label: str = ""  # 로그 접두어 (예: "[서울] ")
+
+    @property
+    def host(self) -> str:
+        return urlparse(self.base_url).netloc
+
+    @property
+    def body_selector(self) -> str:
+        """본문 후보 전체 (auto 모드에서 본문이 렌더링되었는지 확인용)"""
+        return ", ".join(self.body_selectors)
+
+    @cached_property
+    def list_strainer(self) -> Optional[SelectorStrainer]:
+        """목록 페이지에서 파싱할 부분"""
+        return css_strainer([self.row_selector])
+
+    @cached_property
+    def body_strainer(self) -> Optional[SelectorStrainer]:
+        """상세페이지에서 파싱할 부분 (페이지 전체 텍스트에서 메타데이터를 읽는 게시판은 전체 파싱)"""
+        if self.parse_detail_meta is not None:
+            return None
+        return css_strainer(self.body_selectors)
+
+    def page_url(self, page_num: int) -> str:
+        return self.list_url.format(base_url=self.base_url, limit=self.page_size, offset=page_num * self.page_size)
+
+
+# "[분류] 제목 ... 최종 수정일 : 2025.11.20" 줄
+_SKKU_MODIFIED_RE = re.compile(r"^(?=[^\n]*\[)([^\n\]]*)\][^\n]*?최종 수정일[\s:]*([^\s:]*)", re.MULTILINE)
+# 담당 부서 후보 줄 (처음 나오는 줄)
+_SKKU_DEPARTMENT_RE = re.compile(r"^[^\n]*(?:학과|팀|대학|센터)[^\n]*$", re.MULTILINE)
+
+
+def parse_skku_detail_meta(page_text: str) -> dict:
+    """대표 홈페이지 상세페이지의 [분류] ... 최종 수정일 줄과 담당 부서 추출"""
+    category = None
+    date = None
+    for match in _SKKU_MODIFIED_RE.finditer(page_text):
+        category = match.group(1).lstrip("[").strip()
+        date = match.group(2) or None
+
+    department = _SKKU_DEPARTMENT_RE.search(page_text)
+
+    # 최종 수정일을 게시일로 사용 (modified는 수정 감지용)
+    return {
+        "category": category,
+        "date": date,
+        "modified": date,
+        "department": department.group(0) if department else None,
+    }
+
+
+# 학과/단과대 게시판 (k2web ul 목록) - 학과와 단과대는 BASE_URL만 다름
+_K2WEB_LIST = dict(
+    list_url="{base_url}?mode=list&articleLimit={limit}&article.offset={offset}",
+    row_selector="ul.board-list-wrap > li",
+    title=Field(".board-list-content-title a"),
+    fields={
+        "number": Field(".board-list-content-info ul li", index=0),
+        "author": Field(".board-list-content-info ul li", index=1),
+        "date": Field(".board-list-content-info ul li", index=2),
+    },
+    id_prefix="No.",
+    is_fixed=lambda number: number == "공지",
+    body_selectors=("div.fr-view",),
+    doc_fields=("title", "date", "post_num", "author", "link"),
+)
+
+# 기숙사 게시판 (table 목록) - 서울/수원은 경로와 board_no만 다름
+_DORM_TABLE = dict(
+    list_url="{base_url}&mode=list&pager.offset={offset}",
+    row_selector="table tbody tr",
+    title=Field("td:nth-of-type(3) a"),
+    fields={
+        "number": Field("td", index=0),
+        "category": Field("td", index=1),
+        "date": Field("td", index=-2),  # 마지막에서 두 번째 컬럼이 날짜
+    },
+    is_fixed=lambda number: number == "" or "Image" in number,
+    body_selectors=("div.fr-view", "div.bbs-view-cont", "div.board_view", "div#viewDetail"),
+    body_fallback="full_text",
+    doc_fields=("title", "date", "post_num", "category", "link"),
+)
+
+BOARD_SPECS = [
+    BoardSpec(
+        board_name="소프트웨어학과",
+        base_url="https://cse.skku.edu/cse/notice.do",
+        **_K2WEB_LIST,
+    ),
+    BoardSpec(
+        board_name="소프트웨어융합대학",
+        base_url="https://sw.skku.edu/sw/notice.do",
+        **_K2WEB_LIST,
+    ),
+    BoardSpec(
+        board_name="기숙사_서울",
+        base_url="https://dorm.skku.edu/dorm_seoul/notice/notice_all.jsp?board_no=78",
+        notice_extra={"source": "DORM_SEOUL"},
+        label="[서울] ",
+        **_DORM_TABLE,
+    ),
+    BoardSpec(
+        board_name="기숙사_수원",
+        base_url="https://dorm.skku.edu/dorm_suwon/notice/notice_all.jsp?board_no=16",
+        notice_extra={"source": "DORM_SUWON"},
+        label="[수원] ",
+        **_DORM_TABLE,
+    ),
+    BoardSpec(
+        board_name="학교_대표공지",
+        base_url="https://www.skku.edu/skku/campus/skk_comm/notice01.do",
+        list_url="{base_url}?mode=list&articleLimit={limit}&article.offset={offset}",
+        row_selector="a[href*='articleNo=']",
+        title=Field(),
+        id_field=None,
+        id_query_param="articleNo",
+        id_key="post_id",
+        body_selectors=("div.brd-view-con", "div.bbs-view-cont", "div.board-view-contents", "div.bv_cont"),
+        body_fallback="full_text",
+        body_marker="게시글 내용",
+        parse_detail_meta=parse_skku_detail_meta,
+        doc_fields=("title", "post_id", "link", "category", "date", "modified", "department"),
+    ),
+]
+
+
+def get_board_spec(board_name: str) -> BoardSpec:
+    for spec in BOARD_SPECS:
+        if spec.board_name == board_name:
+            return spec
+    raise KeyError(f"Unknown board: {board_name}")
@@ -0,0 +1,178 @@
+"""
+headless Chrome 풀 모듈
+JavaScript가 필요한 페이지만 브라우저로 가져오므로, 드라이버를 게시판끼리 재사용하고
+N페이지마다 새로 띄워 메모리 사용량을 제한
+
+- chromedriver 경로는 한 번만 찾고 파일에 캐시 (이후 실행은 네트워크 확인 없음)
+- headless + eager page load (DOMContentLoaded까지만 대기)
+- 이미지/CSS/폰트 요청 차단 (Chrome prefs + CDP Network.setBlockedURLs)
+"""
+
+import os
+import atexit
+import threading
+from contextlib import contextmanager
+from typing import List, Optional
+
+from selenium import webdriver
+from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.chrome.service import Service
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))  # src/rag
+DRIVER_PATH_CACHE_FILE = os.path.join(BASE_DIR, "cache", "chromedriver_path.txt")
+POOL_SIZE = 2  # 동시에 띄울 수 있는 브라우저 수
+MAX_PAGES_PER_BROWSER = 50  # 이만큼 페이지를 가져오면 브라우저 재시작
+PAGE_LOAD_TIMEOUT = 30  # 페이지 로딩 타임아웃(초)
+BLOCKED_URL_PATTERNS = [
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.svg", "*.ico", "*.bmp",
+    "*.css", "*.woff", "*.woff2", "*.ttf", "*.otf", "*.eot",
+]
+
+_driver_path: Optional[str] = None
+_driver_path_lock = threading.Lock()
+
+
+def resolve_driver_path() -> str:
+    """
+    chromedriver 경로 (프로세스당 1회만 확인)
+    우선순위: CHROMEDRIVER_PATH 환경변수 > 캐시 파일 > webdriver_manager 설치(결과를 캐시 파일에 저장)
+    """
+    global _driver_path
+    with _driver_path_lock:
+        if _driver_path and os.path.exists(_driver_path):
+            return _driver_path
+
+        path = os.getenv("CHROMEDRIVER_PATH")
+        if not path and os.path.exists(DRIVER_PATH_CACHE_FILE):
+            with open(DRIVER_PATH_CACHE_FILE, 'r', encoding='utf-8') as f:
+                path = f.read().strip()
+            if not os.path.exists(path):
+                path = None
+
+        if not path:
+            from webdriver_manager.chrome import ChromeDriverManager
+            path = ChromeDriverManager().install()
+            os.makedirs(os.path.dirname(DRIVER_PATH_CACHE_FILE), exist_ok=True)
+            with open(DRIVER_PATH_CACHE_FILE, 'w', encoding='utf-8') as f:
+                f.write(path)
+            print(f"💾 Cached chromedriver path: {path}")
+
+        _driver_path = path
+        return path
+
+
+def build_options() -> Options:
+    """headless + eager 로딩 + 이미지/CSS/폰트 차단 옵션"""
+    options = Options()
+    options.add_argument("--headless=new")
+    options.add_argument("--disable-gpu")
+    options.add_argument("--no-sandbox")
+    options.add_argument("--disable-dev-shm-usage")
+    options.add_argument("--disable-extensions")
+    options.add_argument("--blink-settings=imagesEnabled=false")
+    options.page_load_strategy = "eager"
+    options.add_experimental_option("prefs", {
+        "profile.managed_default_content_settings.images": 2,
+        "profile.managed_default_content_settings.stylesheets": 2,
+        "profile.managed_default_content_settings.fonts": 2,
+    })
+    return options
+
+
+def create_driver() -> webdriver.Chrome:
+    """풀에 넣을 새 Chrome 드라이버"""
+    driver = webdriver.Chrome(service=Service(resolve_driver_path()), options=build_options())
+    driver.set_page_load_timeout(PAGE_LOAD_TIMEOUT)
+    try:
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_URL_PATTERNS})
+    except Exception as e:
+        print(f"⚠️ Could not block resources via CDP: {e}")
+    return driver
+
+
+def _safe_quit(driver):
+    """드라이버 종료(예외 무시)"""
+    try:
+        driver.quit()
+    except Exception:
+        pass
+
+
+class BrowserPool:
+    """
+    Chrome 드라이버 풀
+    acquire()로 빌려 쓰고 반납하며, max_pages 페이지를 가져온 드라이버는 반납 시 종료
+    """
+
+    def __init__(self, size: int = POOL_SIZE, max_pages: int = MAX_PAGES_PER_BROWSER):
+        self.size = size
+        self.max_pages = max_pages
+        self.stats = {"launched": 0, "recycled": 0, "pages": 0}
+        self._idle: List[list] = []  # [driver, 가져온 페이지 수]
+        self._slots = threading.BoundedSemaphore(size)
+        self._lock = threading.Lock()
+        self._closed = False
+
+    @contextmanager
+    def acquire(self):
+        """드라이버 1개 대여 (모두 사용 중이면 대기) - with 블록 1회를 1페이지로 계산"""
+        self._slots.acquire()
+        entry = None
+        try:
+            with self._lock:
+                entry = self._idle.pop() if self._idle else None
+            if entry is None:
+                entry = [create_driver(), 0]
+                self.stats["launched"] += 1
+            yield entry[0]
+        except Exception:
+            # 오류가 난 드라이버는 상태를 알 수 없으므로 재사용하지 않음
+            if entry is not None:
+                _safe_quit(entry[0])
+                entry = None
+            raise
+        finally:
+            if entry is not None:
+                entry[1] += 1
+                self._release(entry)
+            self._slots.release()
+
+    def _release(self, entry: list):
+        with self._lock:
+            self.stats["pages"] += 1
+            if self._closed or entry[1] >= self.max_pages:
+                if not self._closed:
+                    self.stats["recycled"] += 1
+                _safe_quit(entry[0])
+            else:
+                self._idle.append(entry)
+
+    def shutdown(self):
+        """대기 중인 드라이버 모두 종료"""
+        with self._lock:
+            self._closed = True
+            idle, self._idle = self._idle, []
+        for driver, _ in idle:
+            _safe_quit(driver)
+
+
+_pool: Optional[BrowserPool] = None
+_pool_lock = threading.Lock()
+
+
+def get_browser_pool() -> BrowserPool:
+    """프로세스 전체에서 공유하는 브라우저 풀 (게시판/재검증 공용)"""
+    global _pool
+    with _pool_lock:
+        if _pool is None or _pool._closed:
+            _pool = BrowserPool()
+            atexit.register(_pool.shutdown)
+        return _pool
+
+
+def shutdown_browser_pool():
+    """공유 브라우저 풀 종료"""
+    with _pool_lock:
+        if _pool is not None:
+            _pool.shutdown()
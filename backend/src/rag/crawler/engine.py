@@ -0,0 +1,211 @@
+"""
+게시판 크롤링 엔진
+boards.BoardSpec 설정 하나로 목록 순회 → 새 글 추출 → 상세페이지 수집 → Document 변환을 처리
+(HTTP 우선 fetch, 상세페이지 동시 요청, HTML 캐시, 브라우저 풀은 PageFetcher가 모든 게시판에 공통 적용)
+"""
+
+from typing import List, Optional, Set
+from urllib.parse import urljoin, urlparse, parse_qs
+
+from langchain_core.documents import Document
+
+from crawler.boards import BoardSpec, Field
+from crawler.fetcher import PageFetcher, DEFAULT_RATE_LIMIT, DETAIL_CONCURRENCY
+
+
+def _read_field(row, spec_field: Field) -> Optional[str]:
+    """row 안에서 Field 위치의 텍스트(또는 속성) 읽기"""
+    if spec_field.selector is None:
+        element = row
+    else:
+        matches = row.select(spec_field.selector)
+        if not matches or not -len(matches) <= spec_field.index < len(matches):
+            return None
+        element = matches[spec_field.index]
+    if spec_field.attr:
+        value = element.get(spec_field.attr)
+        return value.strip() if value else None
+    return element.get_text(strip=True)
+
+
+def _extract_post_num(spec: BoardSpec, values: dict, title: str, link: str) -> tuple:
+    """
+    글 번호와 고정 공지 여부
+    Returns:
+        tuple: (post_num, is_fixed_notice)
+    """
+    if spec.id_query_param:
+        post_num = parse_qs(urlparse(link).query).get(spec.id_query_param, [None])[0]
+        return post_num or link, False
+
+    raw = values.get(spec.id_field) if spec.id_field else None
+    if spec.is_fixed and spec.is_fixed(raw or ""):
+        # 고정 공지는 모든 페이지에 나타나므로 제목+날짜로 고유 식별자 생성
+        return f"NOTICE_{title}_{values.get('date')}", True
+    if raw and spec.id_prefix and raw.startswith(spec.id_prefix):
+        return raw[len(spec.id_prefix):].strip(), False
+    return raw or f"{title}_{values.get('date')}", False
+
+
+def parse_list_page(spec: BoardSpec, soup) -> List[dict]:
+    """
+    목록 페이지에서 글 정보 추출
+    Returns:
+        list: [{"post_num", "title", "link", "is_fixed_notice", "date", ...fields}, ...]
+    """
+    rows = []
+    seen = set()
+    for row in soup.select(spec.row_selector):
+        title_element = row if spec.title.selector is None else row.select_one(spec.title.selector)
+        if title_element is None:
+            continue
+        title = title_element.get_text(strip=True)
+        link = urljoin(spec.base_url, (title_element.get("href") or "").strip())
+
+        values = {name: _read_field(row, spec_field) for name, spec_field in spec.fields.items()}
+        post_num, is_fixed_notice = _extract_post_num(spec, values, title, link)
+        if post_num in seen:
+            continue
+        seen.add(post_num)
+
+        values.pop(spec.id_field, None)
+        rows.append({
+            "post_num": post_num,
+            "title": title,
+            "link": link,
+            "is_fixed_notice": is_fixed_notice,
+            **values,
+        })
+    return rows
+
+
+def parse_body(spec: BoardSpec, soup) -> tuple:
+    """
+    상세페이지에서 본문 + 추가 메타데이터 추출
+    Returns:
+        tuple: (body, meta)
+    """
+    body = None
+    for selector in spec.body_selectors:
+        body_tag = soup.select_one(selector)
+        if body_tag:
+            body = body_tag.get_text(separator="\n", strip=True)
+            break
+
+    # 페이지 전체 텍스트는 필요할 때 한 번만 추출 (본문 대체 + 메타데이터 공용)
+    page_text = None
+    if (body is None and spec.body_fallback == "full_text") or spec.parse_detail_meta:
+        page_text = soup.get_text(separator="\n", strip=True)
+
+    if body is None:
+        body = ""
+        if spec.body_fallback == "full_text":
+            # 본문 요소를 못 찾으면 페이지 전체 텍스트 사용
+            body = page_text
+            if spec.body_marker and spec.body_marker in body:
+                body = body.split(spec.body_marker, 1)[1].strip()
+
+    meta = spec.parse_detail_meta(page_text) if spec.parse_detail_meta else {}
+    return body, meta
+
+
+def crawl_board(
+    spec: BoardSpec,
+    max_pages: int = 30,
+    delay: float = 2,
+    existing_post_nums: Optional[Set[str]] = None,
+    fetch_mode: Optional[str] = None,
+    rate_limit: float = DEFAULT_RATE_LIMIT,
+    concurrency: int = DETAIL_CONCURRENCY
+) -> List[dict]:
+    """
+    게시판 공지사항 크롤링
+    Args:
+        spec: 게시판 설정
+        max_pages: 크롤링할 최대 페이지 수
+        delay: 브라우저로 가져올 때 페이지 로딩 대기 시간(초)
+        existing_post_nums: 이미 크롤링한 글 번호 set (중복 방지, 새로 수집한 번호가 추가됨)
+        fetch_mode: http / browser / auto / cache (None이면 spec.fetch_mode)
+        rate_limit: 호스트별 초당 요청 수 (token bucket)
+        concurrency: 상세페이지 동시 요청 수
+    Returns:
+        list: notice dict 리스트
+    """
+    if existing_post_nums is None:
+        existing_post_nums = set()
+    label = spec.label
+
+    fetcher = PageFetcher(
+        mode=fetch_mode or spec.fetch_mode, delay=delay, rate_limit=rate_limit, concurrency=concurrency
+    )
+    try:
+        notices = []
+        for page_num in range(max_pages):
+            list_url = spec.page_url(page_num)
+            print(f"\n=== {label}Crawling page {page_num + 1}/{max_pages} (offset: {page_num * spec.page_size}) ===")
+            # 첫 페이지만 목록이 비어 있으면 브라우저로 재시도 (이후 빈 페이지는 목록의 끝)
+            soup = fetcher.get_soup(
+                list_url, expect=spec.row_selector, fallback=page_num == 0, parse_only=spec.list_strainer
+            )
+            rows = parse_list_page(spec, soup)
+
+            if not rows:
+                print("No more items found, stopping.")
+                break
+
+            page_notices = []
+            skipped_items = 0
+            found_existing = False
+            for row in rows:
+                # 일반 글에서 기존 글 발견 시 즉시 중단 (고정 공지는 건너뜀)
+                if row["post_num"] in existing_post_nums:
+                    if not row["is_fixed_notice"]:
+                        print(f"  → Found existing post: {row['title']} ({row['post_num']})")
+                        print(f"  → Stopping crawl (all newer posts already collected)")
+                        found_existing = True
+                        break
+                    print(f"  → Skipping fixed notice: {row['title']}")
+                    skipped_items += 1
+                    continue
+                page_notices.append(row)
+
+            print(f"  Total items on page: {len(rows)}, New items: {len(page_notices)}, Skipped: {skipped_items}")
+
+            # 상세 페이지 크롤링 (동시 요청, 순서 유지)
+            soups = fetcher.get_soups(
+                [n["link"] for n in page_notices], expect=spec.body_selector, parse_only=spec.body_strainer
+            )
+            for idx, (notice_info, soup) in enumerate(zip(page_notices, soups), 1):
+                print(f"  [{idx}/{len(page_notices)}] Crawling: {notice_info['title']}")
+                body, meta = parse_body(spec, soup)
+                notice = {**notice_info, "body": body, **spec.notice_extra}
+                notice.update(meta)
+                if spec.id_key != "post_num":
+                    notice[spec.id_key] = notice["post_num"]
+                notices.append(notice)
+                # 현재 세션 내 중복 방지
+                existing_post_nums.add(notice_info["post_num"])
+                print(f"    ✓ Completed ({notice_info['post_num']})")
+
+            if found_existing:
+                print(f"\n=== {label}Crawling stopped (found existing post) ===")
+                print(f"Total new notices crawled: {len(notices)}")
+                return notices
+
+        print(f"\n=== {label}Crawling completed ===")
+        print(f"Total notices crawled: {len(notices)}")
+        return notices
+
+    finally:
+        fetcher.close()
+
+
+def notices_to_documents(spec: BoardSpec, notices: List[dict]) -> List[Document]:
+    """공지사항 리스트를 LangChain Document 객체로 변환"""
+    docs = []
+    for n in notices:
+        metadata = {"board_name": spec.board_name}
+        for key in spec.doc_fields:
+            metadata[key] = n.get(key) or ""
+        docs.append(Document(page_content=n.get("body", ""), metadata=metadata))
+    return docs
@@ -0,0 +1,244 @@
+"""
+페이지 fetcher 모듈
+서버에서 렌더링되는 목록/상세 페이지는 keep-alive requests.Session으로 가져오고,
+JavaScript가 필요한 페이지만 Selenium(Chrome)으로 가져옴
+
+fetch_mode
+- "http": 항상 HTTP
+- "browser": 항상 Chrome
+- "auto": HTTP로 가져온 뒤 기대하는 요소(expect 선택자)가 없으면 해당 페이지만 Chrome으로 재시도
+- "cache": 네트워크 없이 HTML 캐시에서만 읽음 (재파싱용)
+
+HTTP 요청 간격은 호스트별 token bucket(rate_limiter)으로 제한하고,
+상세페이지 여러 개는 get_soups()로 동시에 가져옴 (async_fetcher)
+가져온 HTML은 html_cache에 저장하고, 다음 요청은 ETag/Last-Modified 조건부 GET
+"""
+
+import time
+from typing import List
+
+import requests
+from bs4 import BeautifulSoup, SoupStrainer
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from crawler.async_fetcher import fetch_pages, DETAIL_CONCURRENCY
+from crawler.html_cache import get_html_cache
+from crawler.parsing import parse_html
+from crawler.rate_limiter import get_host_bucket, DEFAULT_RATE_LIMIT, DEFAULT_BURST
+
+FETCH_MODES = ("http", "browser", "auto", "cache")
+DEFAULT_FETCH_MODE = "auto"
+HTTP_TIMEOUT = 10  # 요청 타임아웃(초)
+HTTP_POOL_SIZE = 10  # 호스트별 keep-alive 연결 수
+HTTP_RETRIES = 2  # 연결 오류/5xx 재시도 횟수
+STICKY_FALLBACKS = 3  # 연속으로 이만큼 브라우저 폴백하면 이후 페이지는 바로 브라우저 사용
+USER_AGENT = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+    "(KHTML, like Gecko) Chrome/120.0 Safari/537.36"
+)
+HTTP_HEADERS = {
+    "User-Agent": USER_AGENT,
+    "Accept-Language": "ko-KR,ko;q=0.9,en;q=0.8",
+}
+
+
+def create_session() -> requests.Session:
+    """keep-alive 연결 풀 + 재시도 설정된 requests.Session"""
+    session = requests.Session()
+    retry = Retry(
+        total=HTTP_RETRIES,
+        backoff_factor=0.5,
+        status_forcelist=(500, 502, 503, 504),
+        allowed_methods=("GET", "HEAD"),
+    )
+    adapter = HTTPAdapter(pool_connections=HTTP_POOL_SIZE, pool_maxsize=HTTP_POOL_SIZE, max_retries=retry)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    session.headers.update(HTTP_HEADERS)
+    return session
+
+
+class PageFetcher:
+    """
+    HTTP 우선 페이지 fetcher (필요할 때만 Chrome 실행)
+    delay: 브라우저 페이지 로딩 후 추가 대기 시간(초, JavaScript 렌더링용)
+    rate_limit: HTTP 호스트별 초당 요청 수
+    concurrency: 상세페이지 호스트별 동시 요청 수
+    use_cache: 가져온 HTML을 캐시에 저장하고 조건부 GET 사용
+    """
+
+    def __init__(
+        self,
+        mode: str = DEFAULT_FETCH_MODE,
+        delay: float = 0,
+        timeout: float = HTTP_TIMEOUT,
+        rate_limit: float = DEFAULT_RATE_LIMIT,
+        concurrency: int = DETAIL_CONCURRENCY,
+        use_cache: bool = True
+    ):
+        if mode not in FETCH_MODES:
+            raise ValueError(f"Unknown fetch mode: {mode} (expected one of {FETCH_MODES})")
+        self.mode = mode
+        self.delay = delay
+        self.timeout = timeout
+        self.rate_limit = rate_limit
+        self.concurrency = concurrency
+        self.stats = {"http": 0, "not_modified": 0, "browser": 0, "fallback": 0, "cache": 0, "miss": 0}
+        self._cache = get_html_cache() if use_cache or mode == "cache" else None
+        self._session = None
+        self._consecutive_fallbacks = 0
+        self._browser_selectors = set()  # 브라우저로만 찾을 수 있었던 expect 선택자
+
+    def get_soup(
+        self, url: str, expect: str = None, fallback: bool = True, parse_only: SoupStrainer = None
+    ) -> BeautifulSoup:
+        """
+        페이지를 가져와 BeautifulSoup으로 반환
+        Args:
+            url: 페이지 URL
+            expect: 정상 렌더링된 페이지에 있어야 할 CSS 선택자 (auto 모드 폴백 판단용)
+            fallback: False면 expect가 없어도 브라우저로 재시도하지 않음 (마지막 빈 목록 페이지 등)
+                      단, 이전에 브라우저가 필요했던 expect는 바로 브라우저 사용
+            parse_only: 이 부분만 파싱 (expect 요소가 없으면 전체 파싱)
+        """
+        if self.mode == "cache":
+            return self._get_cached_soup(url, expect, parse_only)
+        if self._use_browser(expect):
+            return self._get_browser_soup(url, expect, parse_only)
+        try:
+            html = self._get_http(url)
+        except requests.RequestException as e:
+            html = e
+        return self._accept_or_fallback(url, html, expect, parse_only, fallback)
+
+    def get_soups(self, urls: List[str], expect: str = None, parse_only: SoupStrainer = None) -> List[BeautifulSoup]:
+        """
+        여러 페이지(상세페이지)를 호스트별 concurrency개씩 동시에 가져옴
+        Returns:
+            list: [BeautifulSoup, ...] - urls 순서 유지
+        """
+        if self.mode == "cache":
+            return [self._get_cached_soup(url, expect, parse_only) for url in urls]
+        if self._use_browser(expect):
+            return [self._get_browser_soup(url, expect, parse_only) for url in urls]
+
+        results = fetch_pages(
+            urls,
+            headers=HTTP_HEADERS,
+            request_headers=[self._conditional_headers(url) for url in urls],
+            concurrency=self.concurrency,
+            rate_limit=self.rate_limit,
+            timeout=self.timeout,
+        )
+        soups = []
+        for url, result in zip(urls, results):
+            if isinstance(result, Exception):
+                html = result
+            else:
+                html = self._handle_response(url, result.status, result.html, result.etag, result.last_modified)
+            soups.append(self._accept_or_fallback(url, html, expect, parse_only))
+        return soups
+
+    def _use_browser(self, expect: str = None) -> bool:
+        return self.mode == "browser" or (
+            self.mode == "auto" and (
+                self._consecutive_fallbacks >= STICKY_FALLBACKS or expect in self._browser_selectors
+            )
+        )
+
+    def _accept_or_fallback(
+        self, url: str, html, expect: str = None, parse_only: SoupStrainer = None, fallback: bool = True
+    ) -> BeautifulSoup:
+        """HTTP 결과가 정상이면 그대로, 실패했거나 expect 요소가 없으면 브라우저로 재시도 (auto 모드)"""
+        if isinstance(html, Exception):
+            if self.mode == "http":
+                raise html
+            print(f"    ↪ HTTP fetch failed ({html}), retrying with browser: {url}")
+        else:
+            soup = parse_html(html, parse_only, expect)
+            if self.mode == "http" or not fallback or expect is None or soup.select_one(expect) is not None:
+                self._consecutive_fallbacks = 0
+                return soup
+            print(f"    ↪ '{expect}' not found over HTTP, retrying with browser: {url}")
+
+        self.stats["fallback"] += 1
+        self._consecutive_fallbacks += 1
+        soup = self._get_browser_soup(url, expect, parse_only)
+        if expect is not None and soup.select_one(expect) is not None:
+            # 브라우저에서만 보이는 요소 -> 같은 expect의 이후 페이지는 바로 브라우저로
+            self._browser_selectors.add(expect)
+        return soup
+
+    def _conditional_headers(self, url: str) -> dict:
+        return self._cache.conditional_headers(url) if self._cache is not None else {}
+
+    def _handle_response(self, url: str, status: int, html: str, etag: str = None, last_modified: str = None) -> str:
+        """304면 캐시 본문 사용, 아니면 캐시에 저장"""
+        self.stats["http"] += 1
+        if status == 304 and self._cache is not None:
+            cached = self._cache.read(url)
+            if cached is not None:
+                self._cache.touch(url)
+                self.stats["not_modified"] += 1
+                return cached
+        if self._cache is not None and html:
+            self._cache.store(url, html, etag=etag, last_modified=last_modified)
+        return html
+
+    def _get_http(self, url: str) -> str:
+        if self._session is None:
+            self._session = create_session()
+        get_host_bucket(url, self.rate_limit, DEFAULT_BURST).acquire()
+        response = self._session.get(url, headers=self._conditional_headers(url), timeout=self.timeout)
+        if response.status_code == 304:
+            return self._handle_response(url, 304, "")
+        response.raise_for_status()
+        # charset 헤더가 없으면 requests가 ISO-8859-1로 가정하므로 본문에서 추정
+        if response.encoding is None or response.encoding.lower() == "iso-8859-1":
+            response.encoding = response.apparent_encoding
+        return self._handle_response(
+            url,
+            response.status_code,
+            response.text,
+            etag=response.headers.get("ETag"),
+            last_modified=response.headers.get("Last-Modified"),
+        )
+
+    def _get_browser_soup(self, url: str, expect: str = None, parse_only: SoupStrainer = None) -> BeautifulSoup:
+        """공유 브라우저 풀의 headless Chrome으로 페이지 가져오기"""
+        from crawler.browser_pool import get_browser_pool
+
+        get_host_bucket(url, self.rate_limit, DEFAULT_BURST).acquire()
+        with get_browser_pool().acquire() as driver:
+            driver.get(url)
+            time.sleep(self.delay)
+            html = driver.page_source
+        self.stats["browser"] += 1
+        if self._cache is not None:
+            self._cache.store(url, html)  # 렌더링 결과는 검증자(ETag 등) 없이 저장
+        return parse_html(html, parse_only, expect)
+
+    def _get_cached_soup(self, url: str, expect: str = None, parse_only: SoupStrainer = None) -> BeautifulSoup:
+        """HTML 캐시에서만 읽기 (없으면 빈 페이지)"""
+        html = self._cache.read(url)
+        if html is None:
+            print(f"    ⚠️ Not in HTML cache: {url}")
+            self.stats["miss"] += 1
+            html = ""
+        else:
+            self.stats["cache"] += 1
+        return parse_html(html, parse_only, expect)
+
+    def close(self):
+        """HTTP 세션 종료 (브라우저는 풀에 남겨 다른 게시판이 재사용)"""
+        if self._session is not None:
+            self._session.close()
+            self._session = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+        return False
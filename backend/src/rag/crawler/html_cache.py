@@ -0,0 +1,135 @@
+"""
+원본 HTML 캐시 모듈
+크롤링한 페이지 HTML을 내용 해시(sha256) 기준으로 gzip 압축해 저장하고,
+URL별 가져온 시각 / ETag / Last-Modified를 SQLite 인덱스에 기록
+
+- 재요청 시 If-None-Match / If-Modified-Since 조건부 GET (304면 캐시 본문 사용)
+- 선택자/메타데이터 파싱을 고친 뒤 `ingest.py --reparse`로 네트워크 없이 다시 파싱
+"""
+
+import os
+import gzip
+import sqlite3
+import hashlib
+import threading
+from datetime import datetime
+from typing import Optional
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))  # src/rag
+HTML_CACHE_DIR = os.path.join(BASE_DIR, "cache", "html")  # objects/<2자리>/<해시>.html.gz + index.sqlite3
+
+
+class HtmlCache:
+    """내용 주소 기반 HTML 캐시 (thread-safe)"""
+
+    def __init__(self, cache_dir: str = HTML_CACHE_DIR):
+        self.cache_dir = cache_dir
+        self.objects_dir = os.path.join(cache_dir, "objects")
+        os.makedirs(self.objects_dir, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(os.path.join(cache_dir, "index.sqlite3"), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS pages (
+                url TEXT PRIMARY KEY,
+                content_hash TEXT NOT NULL,
+                fetched_at TEXT NOT NULL,
+                etag TEXT,
+                last_modified TEXT
+            )
+            """
+        )
+        self._conn.commit()
+
+    def _object_path(self, content_hash: str) -> str:
+        return os.path.join(self.objects_dir, content_hash[:2], f"{content_hash}.html.gz")
+
+    def lookup(self, url: str) -> Optional[dict]:
+        """
+        URL의 캐시 기록
+        Returns:
+            dict: {"url", "content_hash", "fetched_at", "etag", "last_modified"} 또는 None
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT url, content_hash, fetched_at, etag, last_modified FROM pages WHERE url = ?",
+                (url,),
+            ).fetchone()
+        if row is None:
+            return None
+        return dict(zip(("url", "content_hash", "fetched_at", "etag", "last_modified"), row))
+
+    def read(self, url: str) -> Optional[str]:
+        """캐시된 HTML (없으면 None)"""
+        record = self.lookup(url)
+        if record is None:
+            return None
+        try:
+            with gzip.open(self._object_path(record["content_hash"]), 'rt', encoding='utf-8') as f:
+                return f.read()
+        except OSError:
+            return None
+
+    def store(self, url: str, html: str, etag: str = None, last_modified: str = None) -> str:
+        """
+        HTML 저장 (같은 내용은 한 번만 저장)
+        Returns:
+            str: 내용 해시
+        """
+        content_hash = hashlib.sha256(html.encode("utf-8")).hexdigest()
+        path = self._object_path(content_hash)
+        if not os.path.exists(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp_path = f"{path}.{threading.get_ident()}.tmp"
+            with gzip.open(tmp_path, 'wt', encoding='utf-8') as f:
+                f.write(html)
+            os.replace(tmp_path, path)
+
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO pages (url, content_hash, fetched_at, etag, last_modified) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (url, content_hash, datetime.now().isoformat(timespec="seconds"), etag, last_modified),
+            )
+            self._conn.commit()
+        return content_hash
+
+    def touch(self, url: str):
+        """304 응답 시 가져온 시각만 갱신"""
+        with self._lock:
+            self._conn.execute(
+                "UPDATE pages SET fetched_at = ? WHERE url = ?",
+                (datetime.now().isoformat(timespec="seconds"), url),
+            )
+            self._conn.commit()
+
+    def conditional_headers(self, url: str) -> dict:
+        """조건부 GET 헤더 (캐시 본문이 있을 때만)"""
+        record = self.lookup(url)
+        if record is None or not os.path.exists(self._object_path(record["content_hash"])):
+            return {}
+        headers = {}
+        if record["etag"]:
+            headers["If-None-Match"] = record["etag"]
+        if record["last_modified"]:
+            headers["If-Modified-Since"] = record["last_modified"]
+        return headers
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+_cache: Optional[HtmlCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_html_cache() -> HtmlCache:
+    """프로세스 전체에서 공유하는 HTML 캐시"""
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = HtmlCache(HTML_CACHE_DIR)
+        return _cache
@@ -0,0 +1,125 @@
+"""
+HTML 파싱 모듈
+- lxml이 설치되어 있으면 lxml 파서 사용 (없으면 html.parser)
+- SelectorStrainer로 필요한 부분(목록, 본문 div)만 파싱
+  (CSS 선택자의 첫 번째 요소 조건으로 파싱 단계에서 나머지 태그를 버림)
+"""
+
+import re
+from typing import Iterable, List, Optional, Tuple
+
+from bs4 import BeautifulSoup, SoupStrainer
+
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = "lxml"
+except ImportError:
+    HTML_PARSER = "html.parser"
+
+# "div.fr-view", "div#viewDetail", "a[href*='articleNo=']" 같은 단순 선택자만 지원
+_COMPOUND_RE = re.compile(r"^(?P<tag>[a-zA-Z][\w-]*)?(?P<rest>(?:[.#][\w-]+|\[[^\]]+\])*)$")
+_PART_RE = re.compile(r"([.#])([\w-]+)|\[\s*([\w-]+)\s*(?:([*^$~]?=)\s*['\"]?(.*?)['\"]?\s*)?\]")
+_COMBINATOR_RE = re.compile(r"\s*[>+~]\s*|\s+")
+
+
+def _attr_text(value) -> Optional[str]:
+    """파싱 단계의 속성 값 (class가 리스트로 올 수도 있음)"""
+    if isinstance(value, (list, tuple)):
+        return " ".join(value)
+    return value
+
+
+def _attr_matches(value: Optional[str], op: Optional[str], expected: str) -> bool:
+    if value is None:
+        return False
+    if op is None:
+        return True
+    if op == "=":
+        return value == expected
+    if op == "*=":
+        return expected in value
+    if op == "^=":
+        return value.startswith(expected)
+    if op == "$=":
+        return value.endswith(expected)
+    return expected in value.split()  # ~=
+
+
+def _parse_compound(selector: str) -> Optional[Tuple[Optional[str], List[tuple]]]:
+    """
+    선택자의 첫 번째 요소 조건
+    Returns:
+        tuple: (태그 이름, [(속성, 연산자, 값), ...]) 또는 None (지원하지 않는 선택자)
+    """
+    first = _COMBINATOR_RE.split(selector.strip(), maxsplit=1)[0]
+    match = _COMPOUND_RE.match(first)
+    if not first or match is None:
+        return None
+
+    conditions = []
+    for prefix, name, attr, op, value in _PART_RE.findall(match.group("rest")):
+        if prefix == ".":
+            conditions.append(("class", "~=", name))
+        elif prefix == "#":
+            conditions.append(("id", "=", name))
+        else:
+            conditions.append((attr, op or None, value))
+    return (match.group("tag") or "").lower() or None, conditions
+
+
+class SelectorStrainer(SoupStrainer):
+    """
+    CSS 선택자 중 하나의 첫 번째 요소와 맞는 태그(와 그 하위 트리)만 파싱
+    예: "ul.board-list-wrap > li" -> <ul class="board-list-wrap"> 전체만 남김
+    """
+
+    def __init__(self, rules: List[Tuple[Optional[str], List[tuple]]]):
+        super().__init__()
+        self.rules = rules
+
+    def allow_tag_creation(self, nsprefix, name, attrs) -> bool:
+        attrs = attrs or {}
+        for tag, conditions in self.rules:
+            if tag is not None and tag != name:
+                continue
+            if all(_attr_matches(_attr_text(attrs.get(attr)), op, expected) for attr, op, expected in conditions):
+                return True
+        return False
+
+    def allow_string_creation(self, string: str) -> bool:
+        # 선택한 태그 밖의 최상위 문자열은 버림
+        return False
+
+    def __repr__(self) -> str:
+        return f"SelectorStrainer({self.rules!r})"
+
+
+def css_strainer(selectors: Iterable[str]) -> Optional[SelectorStrainer]:
+    """
+    CSS 선택자 목록으로 SelectorStrainer 생성
+    하나라도 지원하지 않는 선택자가 있으면 None (전체 파싱)
+    """
+    rules = []
+    for selector in selectors:
+        for part in selector.split(","):
+            compound = _parse_compound(part)
+            if compound is None:
+                return None
+            rules.append(compound)
+    return SelectorStrainer(rules) if rules else None
+
+
+def make_soup(html: str, parse_only: Optional[SoupStrainer] = None) -> BeautifulSoup:
+    return BeautifulSoup(html, HTML_PARSER, parse_only=parse_only)
+
+
+def parse_html(html: str, parse_only: Optional[SoupStrainer] = None, expect: str = None) -> BeautifulSoup:
+    """
+    parse_only 부분만 파싱하고, 그 안에 expect 요소가 없으면 전체 문서를 다시 파싱
+    (본문 요소가 없어 전체 텍스트를 써야 하는 페이지, 빈 목록 페이지 등)
+    """
+    if parse_only is not None and html:
+        soup = make_soup(html, parse_only)
+        if expect is None or soup.select_one(expect) is not None:
+            return soup
+    return make_soup(html)
@@ -0,0 +1,73 @@
+"""
+호스트별 token bucket rate limiter
+고정 sleep 대신 호스트마다 초당 요청 수(rate)와 순간 허용량(capacity)을 제한
+스레드(게시판별 크롤러)와 asyncio(상세페이지 동시 요청) 양쪽에서 같은 버킷을 공유
+"""
+
+import asyncio
+import threading
+import time
+from typing import Dict
+from urllib.parse import urlparse
+
+DEFAULT_RATE_LIMIT = 2.0  # 호스트별 초당 요청 수
+DEFAULT_BURST = 2  # 호스트별 순간 허용 요청 수
+
+
+class TokenBucket:
+    """thread-safe token bucket (rate <= 0이면 제한 없음)"""
+
+    def __init__(self, rate: float = DEFAULT_RATE_LIMIT, capacity: int = DEFAULT_BURST):
+        self.rate = rate
+        self.capacity = max(1, capacity)
+        self._tokens = float(self.capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """
+        토큰 1개 예약
+        Returns:
+            float: 요청 전에 기다려야 할 시간(초)
+        """
+        if self.rate <= 0:
+            return 0.0
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            return max(0.0, -self._tokens / self.rate)
+
+    def acquire(self):
+        """토큰을 얻을 때까지 대기 (스레드용)"""
+        wait = self.reserve()
+        if wait > 0:
+            time.sleep(wait)
+
+    async def acquire_async(self):
+        """토큰을 얻을 때까지 대기 (asyncio용)"""
+        wait = self.reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+
+_buckets: Dict[str, TokenBucket] = {}
+_buckets_lock = threading.Lock()
+
+
+def get_host_bucket(url: str, rate: float = DEFAULT_RATE_LIMIT, capacity: int = DEFAULT_BURST) -> TokenBucket:
+    """
+    URL의 호스트에 해당하는 버킷 (같은 호스트의 게시판/재검증이 공유)
+    rate/capacity가 바뀌면 기존 버킷 설정을 갱신
+    """
+    host = urlparse(url).netloc
+    with _buckets_lock:
+        bucket = _buckets.get(host)
+        if bucket is None:
+            bucket = _buckets[host] = TokenBucket(rate, capacity)
+        elif bucket.rate != rate or bucket.capacity != max(1, capacity):
+            with bucket._lock:
+                bucket.rate = rate
+                bucket.capacity = max(1, capacity)
+        return bucket
@@ -0,0 +1,60 @@
+"""
+공지 상세페이지 재검증
+이미 수집한 공지의 상세페이지를 다시 가져와 본문/수정 정보를 파싱 (ingest의 수정 공지 재검증용)
+가져오기나 파싱에 실패한 페이지는 None으로 돌려주고 나머지는 계속 처리
+"""
+
+from crawler.fetcher import PageFetcher, DEFAULT_FETCH_MODE
+
+
+def fetch_notice_bodies(parse_func, links, delay=1, fetch_mode=DEFAULT_FETCH_MODE, expect=None, parse_only=None):
+    """
+    이미 수집한 공지의 상세페이지를 다시 가져옴 (수정 여부 재검증용)
+    Args:
+        parse_func: 게시판의 본문 파서 (soup -> (body, meta))
+        links: 상세페이지 URL 리스트
+        delay: 브라우저로 가져올 때 페이지 로딩 대기 시간(초)
+        fetch_mode: http / browser / auto
+        expect: 본문 CSS 선택자 (auto 모드에서 없으면 브라우저로 재시도)
+        parse_only: 상세페이지에서 파싱할 부분 (SoupStrainer)
+    Returns:
+        list: [(body, meta) 또는 None(실패), ...] - links 순서 유지
+    """
+    results = []
+    with PageFetcher(mode=fetch_mode, delay=delay) as fetcher:
+        for link, soup in zip(links, _get_soups(fetcher, links, expect, parse_only)):
+            if soup is None:
+                results.append(None)
+                continue
+            try:
+                result = parse_func(soup)
+            except Exception as e:
+                print(f"    ❌ Failed to parse {link}: {e}")
+                results.append(None)
+                continue
+            # engine.parse_body는 (body, meta), body만 반환하는 파서도 허용
+            if isinstance(result, tuple):
+                results.append(result)
+            else:
+                results.append((result, {}))
+    return results
+
+
+def _get_soups(fetcher, links, expect=None, parse_only=None):
+    """
+    상세페이지를 한 번에 가져오고, 하나라도 가져오기에 실패하면 (http 모드는 예외 발생)
+    링크별로 다시 가져와 실패한 링크만 None으로 반환
+    """
+    try:
+        return fetcher.get_soups(links, expect=expect, parse_only=parse_only)
+    except Exception:
+        pass
+
+    soups = []
+    for link in links:
+        try:
+            soups.append(fetcher.get_soup(link, expect=expect, parse_only=parse_only))
+        except Exception as e:
+            print(f"    ❌ Failed to fetch {link}: {e}")
+            soups.append(None)
+    return soups
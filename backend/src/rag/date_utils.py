@@ -0,0 +1,95 @@
+"""
+날짜 정규화 모듈
+게시판마다 다른 날짜 문자열("2025.11.03", "2025-11-03", "2025" 등)을
+epoch timestamp(초)와 학기 태그("2025-2")로 변환하여 범위 필터/정렬/최신 가중치에 사용
+"""
+
+import re
+from datetime import date, datetime
+from typing import Optional
+
+_FULL_DATE_RE = re.compile(r"(\d{4})\s*[.\-/년]\s*(\d{1,2})\s*[.\-/월]\s*(\d{1,2})")
+_YEAR_RE = re.compile(r"^\s*(\d{4})\s*$")
+_SEMESTER_PATTERN = re.compile(r"(?:(\d{4})학년도\s*(?:및\s*)?)?([12])학기")
+
+
+def parse_date(value) -> Optional[datetime]:
+    """날짜 문자열을 datetime으로 변환 (인식 불가 시 None)"""
+    if value is None:
+        return None
+    if isinstance(value, datetime):
+        return value
+
+    text = str(value)
+    match = _FULL_DATE_RE.search(text)
+    if match:
+        year, month, day = (int(g) for g in match.groups())
+        try:
+            return datetime(year, month, day)
+        except ValueError:
+            return None
+
+    # 연도만 있는 경우 (정적 데이터 "2025") -> 1월 1일
+    match = _YEAR_RE.match(text)
+    if match:
+        return datetime(int(match.group(1)), 1, 1)
+    return None
+
+
+def to_timestamp(value) -> Optional[int]:
+    """날짜 문자열을 epoch timestamp(초)로 변환 (인식 불가 시 None)"""
+    parsed = parse_date(value)
+    return int(parsed.timestamp()) if parsed else None
+
+
+def term_semester(term: int, day: date, year: Optional[int] = None) -> str:
+    """
+    학기 번호 + 기준 날짜 -> 학기 태그
+    연도가 없으면 기준 날짜의 학년도, 단 2학기 기간(9~2월)의 "1학기"는 다가오는 봄학기 (2026.01 "1학기" -> 2026-1)
+    """
+    if year is None:
+        year = day.year if day.month >= 3 else day.year - 1
+        if term == 1 and not 3 <= day.month <= 8:
+            year += 1
+    return f"{year}-{term}"
+
+
+def semester_of(title: str, day: date) -> str:
+    """
+    학기 태그 ("2025-1", "2025-2" = 학년도-학기)
+    제목에 "2026학년도 1학기" / "2학기"가 있으면 그 학기, 없으면 날짜로 판단 (3~8월 1학기, 9~2월 2학기)
+    """
+    match = _SEMESTER_PATTERN.search(title or "")
+    if match:
+        return term_semester(int(match.group(2)), day, int(match.group(1)) if match.group(1) else None)
+    academic_year = day.year if day.month >= 3 else day.year - 1
+    return f"{academic_year}-{1 if 3 <= day.month <= 8 else 2}"
+
+
+def semester_tag(value, title: str = "") -> Optional[str]:
+    """문서 날짜(+ 제목)의 학기 태그 (연도만 있거나 인식 불가 시 None)"""
+    if value is None or not _FULL_DATE_RE.search(str(value)):
+        return None
+    parsed = parse_date(value)
+    return semester_of(title, parsed.date()) if parsed else None
+
+
+def annotate_date_metadata(metadata: dict, overwrite: bool = True) -> bool:
+    """
+    metadata의 date로 date_ts / semester 채우기
+    Args:
+        overwrite: False면 이미 있는 값은 그대로 (기존 청크 backfill)
+    Returns:
+        bool: 값을 바꾸었는지
+    """
+    values = {
+        "date_ts": to_timestamp(metadata.get("date")),
+        "semester": semester_tag(metadata.get("date"), metadata.get("title", "")),
+    }
+    changed = False
+    for key, value in values.items():
+        if value is None or metadata.get(key) == value or (key in metadata and not overwrite):
+            continue
+        metadata[key] = value
+        changed = True
+    return changed
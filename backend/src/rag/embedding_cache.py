@@ -0,0 +1,144 @@
+"""
+임베딩 캐시 모듈
+(모델, 차원, sha256(청크 텍스트)) 키로 임베딩 벡터를 디스크(SQLite)에 저장하여
+전체 재구축(--create) 시에도 처음 보는 텍스트만 OpenAI로 임베딩
+"""
+
+import os
+import sqlite3
+import hashlib
+import threading
+from array import array
+from typing import List, Dict, Optional
+
+from langchain_core.embeddings import Embeddings
+from langchain_openai import OpenAIEmbeddings
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+EMBEDDING_CACHE_FILE = os.path.join(BASE_DIR, "cache", "embeddings.sqlite3")
+EMBEDDING_MODEL = "text-embedding-3-small"
+
+# 모델별 기본 임베딩 차원
+MODEL_DIMENSIONS = {
+    "text-embedding-3-small": 1536,
+    "text-embedding-3-large": 3072,
+    "text-embedding-ada-002": 1536,
+}
+
+# 토큰 수 계산 (tiktoken 없으면 글자 수 기반 근사치)
+try:
+    import tiktoken
+    _ENCODING = tiktoken.get_encoding("cl100k_base")
+except Exception:
+    _ENCODING = None
+
+
+def count_tokens(text: str) -> int:
+    """임베딩 토큰 수 계산"""
+    if _ENCODING is not None:
+        return len(_ENCODING.encode(text, disallowed_special=()))
+    return max(1, len(text) // 2)
+
+
+def text_hash(text: str) -> str:
+    """텍스트 sha256"""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+class CachedEmbeddings(Embeddings):
+    """
+    디스크 캐시를 거치는 OpenAI 임베딩
+    - embed_documents: 캐시 hit은 그대로 반환, miss만 API 호출 후 저장
+    - embed_query: 캐시 없이 바로 API 호출
+    """
+
+    def __init__(
+        self,
+        model: str = EMBEDDING_MODEL,
+        dimensions: Optional[int] = None,
+        cache_path: str = EMBEDDING_CACHE_FILE,
+        embeddings: Optional[Embeddings] = None,
+    ):
+        self.model = model
+        self.dimension = dimensions or MODEL_DIMENSIONS.get(model, 0)
+        # 재시도는 embedding_pipeline의 백오프에서 처리
+        self.embeddings = embeddings or OpenAIEmbeddings(model=model, dimensions=dimensions, max_retries=0)
+        self.stats = {"hits": 0, "misses": 0, "tokens_saved": 0, "tokens_embedded": 0}
+
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(cache_path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS embeddings (
+                model TEXT NOT NULL,
+                dimension INTEGER NOT NULL,
+                text_hash TEXT NOT NULL,
+                vector BLOB NOT NULL,
+                PRIMARY KEY (model, dimension, text_hash)
+            )
+            """
+        )
+        self._conn.commit()
+
+    def _lookup(self, hashes: List[str]) -> Dict[str, List[float]]:
+        """캐시에서 벡터 조회"""
+        found = {}
+        with self._lock:
+            for i in range(0, len(hashes), 500):
+                batch = hashes[i:i + 500]
+                placeholders = ",".join("?" * len(batch))
+                rows = self._conn.execute(
+                    f"SELECT text_hash, vector FROM embeddings "
+                    f"WHERE model = ? AND dimension = ? AND text_hash IN ({placeholders})",
+                    [self.model, self.dimension, *batch],
+                ).fetchall()
+                for h, blob in rows:
+                    found[h] = array("f", blob).tolist()
+        return found
+
+    def _store(self, items: Dict[str, List[float]]):
+        """캐시에 벡터 저장"""
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO embeddings (model, dimension, text_hash, vector) "
+                "VALUES (?, ?, ?, ?)",
+                [(self.model, self.dimension, h, array("f", v).tobytes()) for h, v in items.items()],
+            )
+            self._conn.commit()
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        hashes = [text_hash(t) for t in texts]
+        cached = self._lookup(list(set(hashes)))
+
+        # 캐시에 없는 텍스트만 (중복 제거 후) 임베딩
+        missing = {}
+        for h, t in zip(hashes, texts):
+            if h not in cached and h not in missing:
+                missing[h] = t
+
+        if missing:
+            vectors = self.embeddings.embed_documents(list(missing.values()))
+            new_items = dict(zip(missing.keys(), vectors))
+            self._store(new_items)
+            cached.update(new_items)
+
+        with self._lock:
+            for h, t in zip(hashes, texts):
+                if h in missing:
+                    self.stats["misses"] += 1
+                    self.stats["tokens_embedded"] += count_tokens(t)
+                    missing.pop(h)
+                else:
+                    self.stats["hits"] += 1
+                    self.stats["tokens_saved"] += count_tokens(t)
+
+        return [cached[h] for h in hashes]
+
+    def embed_query(self, text: str) -> List[float]:
+        return self.embeddings.embed_query(text)
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,144 @@
+"""
+임베딩 파이프라인 모듈
+청크를 토큰 수 기준 배치로 묶어 제한된 개수만큼 동시에 임베딩하고,
+배치가 끝날 때마다 벡터스토어에 바로 기록
+- 429 / 5xx 응답은 지수 백오프로 재시도
+- 중간에 실패해도 이미 끝난 배치는 저장되어 있으므로 재실행 시 이어서 진행됨
+"""
+
+import time
+import random
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import List, Dict, Tuple, Optional, Callable
+
+from langchain_core.documents import Document
+
+from embedding_cache import count_tokens
+
+MAX_BATCH_TOKENS = 20000  # 배치당 최대 토큰 수
+MAX_BATCH_SIZE = 256  # 배치당 최대 청크 수
+MAX_CONCURRENCY = 4  # 동시에 임베딩할 배치 수
+MAX_RETRIES = 6
+BASE_RETRY_DELAY = 1.0  # 초
+MAX_RETRY_DELAY = 60.0
+
+RETRYABLE_ERROR_NAMES = {"APIConnectionError", "APITimeoutError", "RateLimitError", "InternalServerError"}
+
+
+def make_token_batches(
+    chunks: List[Document],
+    ids: List[str],
+    max_tokens: int = MAX_BATCH_TOKENS,
+    max_size: int = MAX_BATCH_SIZE,
+) -> List[List[Tuple[str, Document]]]:
+    """
+    청크를 토큰 수 기준으로 배치 분할
+    Returns:
+        list: [[(id, chunk), ...], ...]
+    """
+    batches = []
+    current = []
+    current_tokens = 0
+    for chunk_id, chunk in zip(ids, chunks):
+        tokens = count_tokens(chunk.page_content)
+        if current and (current_tokens + tokens > max_tokens or len(current) >= max_size):
+            batches.append(current)
+            current = []
+            current_tokens = 0
+        current.append((chunk_id, chunk))
+        current_tokens += tokens
+    if current:
+        batches.append(current)
+    return batches
+
+
+def _error_status(error: Exception) -> Optional[int]:
+    """예외에서 HTTP 상태 코드 추출"""
+    status = getattr(error, "status_code", None)
+    if status is None:
+        status = getattr(getattr(error, "response", None), "status_code", None)
+    return status
+
+
+def is_retryable(error: Exception) -> bool:
+    """429 / 5xx / 연결 오류 여부"""
+    status = _error_status(error)
+    if status is not None:
+        return status == 429 or status >= 500
+    return type(error).__name__ in RETRYABLE_ERROR_NAMES
+
+
+def embed_with_backoff(embeddings, texts: List[str], max_retries: int = MAX_RETRIES) -> List[List[float]]:
+    """지수 백오프(+jitter)로 재시도하며 임베딩"""
+    for attempt in range(max_retries + 1):
+        try:
+            return embeddings.embed_documents(texts)
+        except Exception as e:
+            if attempt >= max_retries or not is_retryable(e):
+                raise
+            delay = min(MAX_RETRY_DELAY, BASE_RETRY_DELAY * (2 ** attempt))
+            delay += random.uniform(0, delay / 2)
+            print(f"    ⚠️ Embedding failed ({_error_status(e) or type(e).__name__}), "
+                  f"retrying in {delay:.1f}s ({attempt + 1}/{max_retries})")
+            time.sleep(delay)
+
+
+def embed_and_upsert(
+    vectordb,
+    chunks: List[Document],
+    ids: List[str],
+    max_tokens: int = MAX_BATCH_TOKENS,
+    concurrency: int = MAX_CONCURRENCY,
+    on_batch: Optional[Callable[[int, int], None]] = None,
+) -> Dict[str, int]:
+    """
+    청크를 배치 단위로 동시에 임베딩하고 완료되는 대로 upsert
+    (Chroma 쓰기는 메인 스레드에서만 수행)
+    on_batch: 배치 저장 후 호출 (저장된 청크 수, 전체 청크 수) - 체크포인트 기록용
+    Returns:
+        dict: {"batches": 전체 배치 수, "embedded": 저장된 청크 수, "failed_batches": 실패 배치 수}
+    """
+    batches = make_token_batches(chunks, ids, max_tokens=max_tokens)
+    if not batches:
+        return {"batches": 0, "embedded": 0, "failed_batches": 0}
+
+    embeddings = vectordb.embeddings
+    print(f"  Embedding {len(chunks)} chunks in {len(batches)} batches "
+          f"(≤{max_tokens} tokens, {concurrency} concurrent)")
+
+    embedded = 0
+    done = 0
+    errors = []
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        futures = {
+            executor.submit(embed_with_backoff, embeddings, [c.page_content for _, c in batch]): batch
+            for batch in batches
+        }
+        for future in as_completed(futures):
+            batch = futures[future]
+            done += 1
+            try:
+                vectors = future.result()
+            except Exception as e:
+                errors.append(e)
+                print(f"    ❌ [{done}/{len(batches)}] Batch failed: {e}")
+                continue
+
+            vectordb.upsert(
+                ids=[i for i, _ in batch],
+                embeddings=vectors,
+                documents=[c.page_content for _, c in batch],
+                metadatas=[c.metadata for _, c in batch],
+            )
+            embedded += len(batch)
+            print(f"    ✓ [{done}/{len(batches)}] Batch saved ({embedded}/{len(chunks)} chunks)")
+            if on_batch is not None:
+                on_batch(embedded, len(chunks))
+
+    if errors:
+        raise RuntimeError(
+            f"{len(errors)}/{len(batches)} embedding batches failed "
+            f"({embedded} chunks saved; re-run to continue): {errors[0]}"
+        )
+
+    return {"batches": len(batches), "embedded": embedded, "failed_batches": 0}
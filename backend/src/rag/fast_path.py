@@ -0,0 +1,446 @@
+"""
+정적 데이터 빠른 답변 모듈 (LLM 없이)
+도서관 운영시간, 건물 번호/위치, 학사일정 날짜처럼 static_data에 답이 그대로 있는 질문은
+임베딩 -> 검색 -> GPT 생성 없이 구조화한 표에서 찾아 마크다운 템플릿으로 바로 답변
+- 질문에서 대상(도서관/열람실, 건물, 일정명)을 정확히 찾았을 때만 답변하고,
+  대상이 애매하거나 개인화/설명이 필요한 질문("내 시간표랑 겹쳐?", "어떻게 신청해?")은 None -> 기존 RAG
+- 응답은 기존 SSE 프로토콜 그대로 (sources -> content -> done)
+- 요청 수 / 빠른 답변 수를 프로세스 단위로 집계 (/health의 fast_path)
+"""
+
+import re
+import threading
+from dataclasses import dataclass, field
+from datetime import date
+from typing import Dict, List, Optional, Tuple
+
+from langchain_core.documents import Document
+
+from academic_calendar import CalendarEvent, get_calendar_index, resolve_date_range, semester_of
+from static_data import (
+    ACADEMIC_CALENDAR_2025,
+    BUILDING_INFO_HUMANITIES,
+    BUILDING_INFO_NATURAL_SCIENCE,
+    INFO_LIBRARIES_HUMANITIES,
+    INFO_LIBRARIES_NATURAL_SCIENCE,
+    get_static_documents,
+)
+
+HUMANITIES = "인문사회캠퍼스"
+NATURAL_SCIENCE = "자연과학캠퍼스"
+MAX_QUESTION_CHARS = 60  # 이보다 긴 질문은 여러 가지를 묻는 경우가 많아 RAG로
+MAX_ANSWER_ROWS = 10  # 이보다 많이 걸리면 대상이 애매한 것으로 보고 RAG로
+
+CAMPUS_ALIASES = {
+    HUMANITIES: ("인문사회", "인사캠", "명륜", "인문캠"),
+    NATURAL_SCIENCE: ("자연과학", "자과캠", "율전", "자연캠"),
+}
+LIBRARY_ALIASES = {
+    "중앙학술정보관": ("중앙학술정보관", "중앙도서관", "중도"),
+    "법학도서관": ("법학도서관", "법도"),
+    "경영관": ("경영관",),
+    "삼성학술정보관": ("삼성학술정보관", "디지털도서관", "디도"),
+}
+GENERIC_SPACES = ("열람실", "자료실")  # 도서관 이름 없이는 어느 캠퍼스인지 모르는 공간
+# 일정명 동의어 (질문 표현 -> 학사일정 표현)
+EVENT_SYNONYMS = {"고사": "시험", "졸업식": "학위수여식", "계절학기": "계절수업"}
+
+_SECTION_PATTERN = re.compile(r"^\[(평시|시험기간)(?:\s*\((\d{4}-\d{2}-\d{2})\s*~\s*(\d{4}-\d{2}-\d{2})\))?\]$")
+_BUILDING_PATTERN = re.compile(r"(\d+)번(?:,\s*(\d+)번)?\s*건물(?:\(([^)]*)\))?")
+_BUILDING_NUMBER_PATTERN = re.compile(r"(\d+)\s*번\s*(?:건물|관)")
+_EXPLICIT_SEMESTER_PATTERN = re.compile(r"(?:(\d{4})\s*학년도\s*)?([12])\s*학기")
+_RELATIVE_SEMESTER_PATTERN = re.compile(r"(이번|다음|지난|저번)\s*학기")
+_EVENT_PREFIX_PATTERN = re.compile(
+    r"^(\d{4}학년도\s*(및\s*)?|[12]학기\s*|\d{4}년\s*(\d{1,2}월\s*)?|학사·대학원과정\s*|학사과정\s*|대학원과정\s*)"
+)
+
+_HOURS_INTENT = re.compile(r"운영|몇\s*시|언제까지|열어|여는|열려|닫|문\s*(열|닫)|개방|오픈|시간")
+_BUILDING_INTENT = re.compile(r"몇\s*번|건물|어디|위치|번호|찾아가")
+_DATE_INTENT = re.compile(r"언제|기간|날짜|며칠|몇\s*일|일정|시작|마감|까지")
+_EXAM_PERIOD_WORDS = re.compile(r"시험\s*기간|기말|중간\s*(시험|고사)|시험\s*때")
+# 정적 데이터에 운영시간이 없는 기간 (평시 표로 답하면 틀릴 수 있음 -> RAG로)
+_UNCOVERED_PERIOD_WORDS = re.compile(r"방학|계절\s*(학기|수업)|명절|설날|추석|연휴|공휴일|휴일|크리스마스")
+# 학사일정(2025학년도)에 없을 수 있는 연도 표현
+_YEAR_PATTERN = re.compile(r"(\d{4})\s*년")
+_RELATIVE_YEAR_PATTERN = re.compile(r"내년|작년|재작년|지난\s*해|다음\s*해")
+# 개인화/설명이 필요한 질문은 빠른 답변 대상이 아님
+_DEFER_PATTERN = re.compile(
+    r"내가|나는|나한테|제가|저는|(^|\s)(내|제|나)\s|시간표|캘린더|겹치|추천|왜|어떻게|방법|절차|조건|자격|할까|해야|차이|비교|거기|그거|그럼"
+)
+
+
+def _normalize(text: str) -> str:
+    return re.sub(r"[\s/·,:()+]", "", text.lower())
+
+
+def _campus_of(text: Optional[str]) -> Optional[str]:
+    for campus, aliases in CAMPUS_ALIASES.items():
+        if text and any(alias in text for alias in aliases):
+            return campus
+    return None
+
+
+@dataclass(frozen=True)
+class LibrarySpace:
+    """도서관 공간 하나의 운영시간 (기간별)"""
+    campus: str
+    library: Optional[str]  # 자료실/열람실이 속한 도서관 (PC, 스터디룸 등은 None)
+    name: str  # 표시 이름 ("중앙학술정보관 열람실", "컴넷")
+    keys: Tuple[str, ...]  # 질문에서 찾을 공간 이름 (정규화)
+    period: str  # "평시" / "시험기간"
+    hours: str
+    note: str = ""
+    floor: str = ""
+
+    def format(self) -> str:
+        floor = f" ({self.floor})" if self.floor else ""
+        note = f" · {self.note}" if self.note and self.note != "없음" else ""
+        return f"- **{self.name}**{floor}: **{self.hours}**{note}"
+
+
+@dataclass(frozen=True)
+class Building:
+    """건물 하나 (번호가 없는 광장/운동장 등은 제외)"""
+    campus: str
+    name: str
+    detail: str  # "21번 건물(정보통신대학, 소프트웨어학과), 22번 건물(...)"
+    numbers: Tuple[str, ...]
+    occupants: Tuple[str, ...]  # 괄호 안의 단과대/학과/시설
+
+    def format(self) -> str:
+        return f"- **{self.name}** ({self.campus}): {self.detail}"
+
+
+@dataclass
+class FastAnswer:
+    """빠른 답변 (kind: "library_hours" / "building" / "calendar")"""
+    kind: str
+    text: str
+    docs: List[Document] = field(default_factory=list)  # 출처로 보낼 정적 데이터 문서
+
+
+# ---------- 정적 데이터 -> 표 ----------
+
+def _parse_records(text: str) -> List[Tuple[str, Optional[Tuple[date, date]], Dict[str, str]]]:
+    """도서관 안내 -> (기간, 시험기간 범위, {필드: 값}) 레코드"""
+    records = []
+    period, period_range = "평시", None
+    for block in re.split(r"\n\s*\n", text.strip()):
+        fields = {}
+        for line in block.splitlines():
+            line = line.strip()
+            match = _SECTION_PATTERN.match(line)
+            if match:
+                period = match.group(1)
+                period_range = (
+                    (date.fromisoformat(match.group(2)), date.fromisoformat(match.group(3)))
+                    if match.group(2) else None
+                )
+            elif ": " in line:
+                key, value = line.split(": ", 1)
+                fields[key.strip()] = value.strip()
+        if "운영시간" in fields:
+            records.append((period, period_range, fields))
+    return records
+
+
+def parse_library_hours() -> Tuple[List[LibrarySpace], Dict[str, Tuple[date, date]]]:
+    """
+    도서관 안내 두 개 -> 공간별 운영시간
+    Returns:
+        tuple: (공간 목록, {캠퍼스: 시험기간 범위})
+    """
+    spaces = []
+    exam_periods = {}
+    for period, period_range, fields in _parse_records(INFO_LIBRARIES_HUMANITIES):
+        if period_range:
+            exam_periods[HUMANITIES] = period_range
+        kind, name = fields.get("구분", ""), fields.get("이름", "")
+        if kind == "기타":
+            # "스터디룸, TP룸, 캐럴"은 각각의 이름으로도 찾음
+            keys = tuple(_normalize(n) for n in [name] + name.split(", "))
+            spaces.append(LibrarySpace(HUMANITIES, None, name, keys, period, fields["운영시간"], fields.get("비고", "")))
+        else:
+            library = re.sub(r"\(.*\)", "", name).strip()
+            spaces.append(LibrarySpace(
+                HUMANITIES, library, f"{name} {kind}", (_normalize(kind),), period,
+                fields["운영시간"], fields.get("비고", "")
+            ))
+    for period, period_range, fields in _parse_records(INFO_LIBRARIES_NATURAL_SCIENCE):
+        if period_range:
+            exam_periods[NATURAL_SCIENCE] = period_range
+        name = fields.get("실명", "")
+        spaces.append(LibrarySpace(
+            NATURAL_SCIENCE, "삼성학술정보관", name, (_normalize(name),), period,
+            fields["운영시간"], fields.get("비고", ""), fields.get("층", "")
+        ))
+    return spaces, exam_periods
+
+
+def parse_buildings() -> List[Building]:
+    """건물 안내 두 개 -> 번호가 있는 건물 목록"""
+    buildings = []
+    for campus, text in ((NATURAL_SCIENCE, BUILDING_INFO_NATURAL_SCIENCE), (HUMANITIES, BUILDING_INFO_HUMANITIES)):
+        for line in text.splitlines():
+            line = line.strip()
+            if not line.startswith("- ") or ": " not in line:
+                continue
+            name, detail = (part.strip() for part in line[2:].split(": ", 1))
+            numbers, occupants = [], []
+            for match in _BUILDING_PATTERN.finditer(detail):
+                numbers.extend(n for n in match.group(1, 2) if n)
+                if match.group(3):
+                    occupants.extend(o.strip() for o in match.group(3).split(",") if not o.strip().startswith("주로"))
+            if numbers:
+                buildings.append(Building(campus, name, detail, tuple(numbers), tuple(occupants)))
+    return buildings
+
+
+def _event_tokens(title: str) -> List[Tuple[str, ...]]:
+    """
+    일정명 -> 질문에서 찾을 토큰 목록 (토큰마다 "/"로 나뉜 대안 중 하나만 있으면 됨)
+    "2학기 복학 신청" -> [("복학",), ("신청",)], "2025학년도 2학기 개시일/개강" -> [("개시일", "개강")]
+    """
+    core = re.sub(r"\([^)]*\)", " ", title).strip()
+    while True:
+        stripped = _EVENT_PREFIX_PATTERN.sub("", core).strip()
+        if stripped == core:
+            break
+        core = stripped
+    tokens = [tuple(_normalize(alt) for alt in token.split("/") if _normalize(alt)) for token in core.split()]
+    return [token for token in tokens if token]
+
+
+@dataclass
+class _FastPathIndex:
+    spaces: List[LibrarySpace]
+    exam_periods: Dict[str, Tuple[date, date]]
+    buildings: List[Building]
+    events: List[Tuple[CalendarEvent, List[Tuple[str, ...]]]]
+    docs: Dict[str, Document]  # 정적 데이터 원문 -> Document (출처용)
+
+
+_index: Optional[_FastPathIndex] = None
+_index_lock = threading.Lock()
+
+
+def get_fast_path_index() -> _FastPathIndex:
+    """프로세스 전체에서 공유하는 정적 데이터 표 (처음 호출할 때 1회 파싱)"""
+    global _index
+    with _index_lock:
+        if _index is None:
+            spaces, exam_periods = parse_library_hours()
+            events = [(event, _event_tokens(event.title)) for event in get_calendar_index().events]
+            _index = _FastPathIndex(
+                spaces=spaces,
+                exam_periods=exam_periods,
+                buildings=parse_buildings(),
+                events=events,
+                docs={doc.page_content: doc for doc in get_static_documents()},
+            )
+        return _index
+
+
+# ---------- 질문 -> 답변 ----------
+
+def _answer_library_hours(question: str, normalized: str, today: date, index: _FastPathIndex) -> Optional[FastAnswer]:
+    if _UNCOVERED_PERIOD_WORDS.search(question):
+        return None
+    libraries = {
+        library for library, aliases in LIBRARY_ALIASES.items()
+        if any(_normalize(alias) in normalized for alias in aliases)
+    }
+    scored = []
+    for space in index.spaces:
+        if libraries and space.library not in libraries:
+            continue
+        keys = [key for key in space.keys if key in normalized]
+        if not libraries and all(key in GENERIC_SPACES for key in keys):
+            continue
+        score = max((len(key) for key in keys), default=0)
+        if not score and any(word in normalized and word in space.keys[0] for word in GENERIC_SPACES):
+            score = 1  # "디도 열람실" -> A/B, F/G 열람실
+        scored.append((score, space))
+    if not scored:
+        return None
+    best = max(score for score, _ in scored)
+    matches = [space for score, space in scored if score == best]
+
+    campus = matches[0].campus
+    exam_range = index.exam_periods.get(campus)
+    in_exam = bool(exam_range and exam_range[0] <= today <= exam_range[1])
+    period = "시험기간" if _EXAM_PERIOD_WORDS.search(question) or in_exam else "평시"
+    rows = [space for space in matches if space.period == period and space.campus == campus]
+    if not rows or len(rows) > MAX_ANSWER_ROWS:
+        return None
+
+    title = " / ".join(dict.fromkeys(space.library or space.name for space in rows))
+    period_label = period
+    if period == "시험기간" and exam_range:
+        period_label += f", {exam_range[0].isoformat()} ~ {exam_range[1].isoformat()}"
+    lines = [f"### {title} 운영시간 ({period_label})", ""]
+    lines.extend(space.format() for space in rows)
+    if period == "평시" and exam_range and today <= exam_range[1]:
+        lines += ["", f"시험기간(**{exam_range[0].isoformat()} ~ {exam_range[1].isoformat()}**)에는 운영시간이 달라질 수 있어요."]
+    source = INFO_LIBRARIES_HUMANITIES if campus == HUMANITIES else INFO_LIBRARIES_NATURAL_SCIENCE
+    return FastAnswer("library_hours", "\n".join(lines), [index.docs[source]])
+
+
+def _answer_building(question: str, normalized: str, user_campus: Optional[str], index: _FastPathIndex) -> Optional[FastAnswer]:
+    # 건물 이름 > 건물 번호 > 입주 단과대/학과 순으로 찾음
+    matches = [b for b in index.buildings if _normalize(b.name) in normalized]
+    if matches:
+        longest = max(len(b.name) for b in matches)
+        matches = [b for b in matches if len(b.name) == longest]
+    else:
+        number = _BUILDING_NUMBER_PATTERN.search(question)
+        if number:
+            matches = [b for b in index.buildings if number.group(1) in b.numbers]
+        else:
+            matches = [
+                b for b in index.buildings
+                if any(len(o) >= 3 and _normalize(o) in normalized for o in b.occupants)
+            ]
+    if not matches:
+        return None
+
+    campus = _campus_of(question) or user_campus
+    if len({b.campus for b in matches}) > 1 and campus:
+        matches = [b for b in matches if b.campus == campus] or matches
+    if len(matches) > MAX_ANSWER_ROWS:
+        return None
+
+    lines = ["### 건물 안내", ""]
+    lines.extend(b.format() for b in matches)
+    sources = {NATURAL_SCIENCE: BUILDING_INFO_NATURAL_SCIENCE, HUMANITIES: BUILDING_INFO_HUMANITIES}
+    docs = [index.docs[sources[c]] for c in dict.fromkeys(b.campus for b in matches)]
+    return FastAnswer("building", "\n".join(lines), docs)
+
+
+def _event_status(event: CalendarEvent, today: date) -> str:
+    if event.end < today:
+        return "지난 일정"
+    if event.start <= today:
+        return "진행 중"
+    return f"D-{(event.start - today).days}"
+
+
+def _answer_calendar(question: str, normalized: str, today: date, index: _FastPathIndex) -> Optional[FastAnswer]:
+    # "다음 주", "11월" 같은 기간 질문은 학사일정 행을 넣은 RAG가 답함 (학기 표현만 여기서 처리)
+    if resolve_date_range(_RELATIVE_SEMESTER_PATTERN.sub("", question), today) is not None:
+        return None
+    # "내년/작년 기말시험"은 다른 학년도 일정 -> RAG로
+    if _RELATIVE_YEAR_PATTERN.search(question):
+        return None
+    for word, replacement in EVENT_SYNONYMS.items():
+        normalized = normalized.replace(word, replacement)
+
+    scored = []
+    for event, tokens in index.events:
+        if tokens and all(any(alt in normalized for alt in token) for token in tokens):
+            score = sum(max(len(alt) for alt in token if alt in normalized) for token in tokens)
+            scored.append((score, event))
+    if not scored:
+        return None
+    best = max(score for score, _ in scored)
+    if best < 2:
+        return None
+    matches = [event for score, event in scored if score == best]
+    # "2026년 기말시험": 그 해에 시작하는 일정만 (학사일정에 없으면 RAG로)
+    year = _YEAR_PATTERN.search(question)
+    if year:
+        matches = [e for e in matches if e.start.year == int(year.group(1))]
+        if not matches:
+            return None
+
+    # 학기: 질문에 있으면 그 학기, 없으면 아직 끝나지 않은 가장 가까운 학기 (모두 지났으면 가장 최근 학기)
+    explicit = _EXPLICIT_SEMESTER_PATTERN.search(question)
+    relative = _RELATIVE_SEMESTER_PATTERN.search(question)
+    if relative:
+        year, term = (int(v) for v in semester_of("", today).split("-"))
+        ordinal = year * 2 + term - 1 + {"이번": 0, "다음": 1, "지난": -1, "저번": -1}[relative.group(1)]
+        matches = [e for e in matches if e.semester == f"{ordinal // 2}-{ordinal % 2 + 1}"]
+    elif explicit:
+        matches = [
+            e for e in matches
+            if e.semester.endswith(f"-{explicit.group(2)}")
+            and (not explicit.group(1) or e.semester.startswith(explicit.group(1)))
+        ]
+    if not matches:
+        return None
+    semesters = sorted({e.semester for e in matches})
+    upcoming = sorted({e.semester for e in matches if e.end >= today})
+    if not (explicit or relative or upcoming) and today > get_calendar_index().last:
+        return None  # 학사일정이 지난 학년도 것이면 "다음 기말시험"을 모름 -> 새 공지를 검색하는 RAG로
+    chosen = upcoming[0] if upcoming and not (explicit or relative) else None
+    if chosen is None and not (explicit or relative):
+        chosen = semesters[-1]
+    rows = [e for e in matches if chosen is None or e.semester == chosen]
+    if len(rows) > MAX_ANSWER_ROWS:
+        return None
+
+    lines = ["### 학사일정", ""]
+    for event in rows:
+        period = event.start.isoformat() if event.start == event.end else f"{event.start.isoformat()} ~ {event.end.isoformat()}"
+        lines.append(f"- {event.title}: **{period}** ({_event_status(event, today)})")
+    others = [e for e in matches if e not in rows]
+    if others:
+        lines += ["", "다른 학기: " + ", ".join(f"{e.title} {e.start.isoformat()}" for e in others[:3])]
+    return FastAnswer("calendar", "\n".join(lines), [index.docs[ACADEMIC_CALENDAR_2025]])
+
+
+def answer_fast_path(question: str, user_info: Optional[Dict] = None, today: Optional[date] = None) -> Optional[FastAnswer]:
+    """
+    정적 데이터에서 바로 답할 수 있는 질문이면 답변, 아니면 None (RAG로)
+    도서관 운영시간 > 건물 > 학사일정 순으로 확인
+    """
+    question = (question or "").strip()
+    if not question or len(question) > MAX_QUESTION_CHARS or not re.search(r"[가-힣]", question):
+        return None  # 영어 질문은 번역된 답변이 필요하므로 RAG로
+    if _DEFER_PATTERN.search(question) or question.count("?") > 1:
+        return None
+
+    index = get_fast_path_index()
+    today = today or date.today()
+    normalized = _normalize(question)
+    user_campus = _campus_of((user_info or {}).get("campus"))
+
+    if _HOURS_INTENT.search(question):
+        answer = _answer_library_hours(question, normalized, today, index)
+        if answer:
+            return answer
+    if _BUILDING_INTENT.search(question):
+        answer = _answer_building(question, normalized, user_campus, index)
+        if answer:
+            return answer
+    if _DATE_INTENT.search(question):
+        return _answer_calendar(question, normalized, today, index)
+    return None
+
+
+# ---------- 집계 ----------
+
+_stats = {"total": 0, "served": 0, "by_kind": {}}
+_stats_lock = threading.Lock()
+
+
+def record_request(kind: Optional[str]) -> Dict:
+    """채팅 요청 1건 집계 (kind가 None이면 RAG로 처리한 요청)"""
+    with _stats_lock:
+        _stats["total"] += 1
+        if kind:
+            _stats["served"] += 1
+            _stats["by_kind"][kind] = _stats["by_kind"].get(kind, 0) + 1
+    return get_fast_path_stats()
+
+
+def get_fast_path_stats() -> Dict:
+    """빠른 답변 비율 (서버 시작 이후)"""
+    with _stats_lock:
+        total, served = _stats["total"], _stats["served"]
+        return {
+            "total": total,
+            "served": served,
+            "ratio": round(served / total, 4) if total else 0.0,
+            "by_kind": dict(_stats["by_kind"]),
+        }
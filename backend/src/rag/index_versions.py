@@ -0,0 +1,115 @@
+"""
+벡터스토어 버전 관리 모듈 (blue/green)
+ingest는 chroma_versions/<버전>/ 에 새 인덱스를 만들고 검증한 뒤
+CURRENT 포인터 파일을 원자적으로 교체하여 배포
+rag_api는 포인터가 바뀌면 새 인덱스로 리트리버를 교체 (재시작 불필요)
+"""
+
+import os
+import json
+import shutil
+from datetime import datetime
+from typing import Optional
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+INDEX_ROOT = os.path.join(BASE_DIR, "chroma_versions")  # 버전별 인덱스 디렉토리
+CURRENT_POINTER_FILE = os.path.join(INDEX_ROOT, "CURRENT")  # 현재 서비스 중인 버전
+LEGACY_PERSIST_DIR = os.path.join(BASE_DIR, "chroma_db")  # 버전 관리 도입 전 인덱스
+KEEP_VERSIONS = 3  # 보관할 최근 버전 수 (서비스 중인 버전 포함)
+
+
+def read_pointer() -> Optional[dict]:
+    """
+    CURRENT 포인터 읽기
+    Returns:
+        dict: {"version": ..., "published_at": ...} 또는 None
+    """
+    try:
+        with open(CURRENT_POINTER_FILE, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def get_live_dir() -> Optional[str]:
+    """
+    현재 서비스 중인 인덱스 디렉토리
+    포인터가 없으면 기존 chroma_db 디렉토리 사용
+    """
+    pointer = read_pointer()
+    if pointer:
+        path = os.path.join(INDEX_ROOT, pointer["version"])
+        if os.path.isdir(path):
+            return path
+    if os.path.isdir(LEGACY_PERSIST_DIR):
+        return LEGACY_PERSIST_DIR
+    return None
+
+
+def create_staging_dir(copy_from_live: bool = True) -> str:
+    """
+    새 버전 디렉토리 생성
+    Args:
+        copy_from_live: True면 현재 인덱스를 복사해서 시작 (update), False면 빈 디렉토리 (create)
+    Returns:
+        str: 새 버전 디렉토리 경로
+    """
+    os.makedirs(INDEX_ROOT, exist_ok=True)
+    version = datetime.now().strftime("%Y%m%d-%H%M%S-%f")
+    path = os.path.join(INDEX_ROOT, version)
+
+    live_dir = get_live_dir()
+    if copy_from_live and live_dir:
+        shutil.copytree(live_dir, path)
+    else:
+        os.makedirs(path)
+    return path
+
+
+def publish(path: str):
+    """포인터 파일을 원자적으로 교체하여 path 버전을 서비스에 반영"""
+    pointer = {
+        "version": os.path.basename(os.path.normpath(path)),
+        "published_at": datetime.now().isoformat(timespec="seconds"),
+    }
+    tmp_path = f"{CURRENT_POINTER_FILE}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(pointer, f)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, CURRENT_POINTER_FILE)
+
+
+def discard(path: str):
+    """배포하지 않을 버전 디렉토리 삭제"""
+    shutil.rmtree(path, ignore_errors=True)
+
+
+def cleanup_old_versions(keep: int = KEEP_VERSIONS) -> int:
+    """
+    오래된 버전 디렉토리 삭제 (서비스 중인 버전은 항상 보관)
+    직전 버전들은 아직 열려 있는 rag_api 요청이 있을 수 있어 keep개까지 남겨 둠
+    Returns:
+        int: 삭제한 버전 수
+    """
+    if not os.path.isdir(INDEX_ROOT):
+        return 0
+
+    pointer = read_pointer()
+    live_version = pointer["version"] if pointer else None
+    versions = sorted(
+        name for name in os.listdir(INDEX_ROOT)
+        if os.path.isdir(os.path.join(INDEX_ROOT, name))
+    )
+
+    # 서비스 중인 버전보다 새로운 버전은 진행 중인 ingest일 수 있으므로 제외
+    if live_version in versions:
+        versions = versions[:versions.index(live_version) + 1]
+
+    removed = 0
+    for name in versions[:-keep] if keep > 0 else versions:
+        if name == live_version:
+            continue
+        shutil.rmtree(os.path.join(INDEX_ROOT, name), ignore_errors=True)
+        removed += 1
+    return removed
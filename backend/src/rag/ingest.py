@@ -1,6 +1,9 @@
 ﻿import os
-import json
-from typing import List, Set, Dict, Callable
+import time
+import queue
+from functools import partial
+from datetime import datetime
+from typing import List, Set, Dict, Callable, Iterator, Optional
 from dotenv import load_dotenv
 
 # 환경변수 로드
@@ -16,18 +19,40 @@ if not os.getenv("OPENAI_API_KEY"):
         "OPENAI_API_KEY=your_key_here"
     )
 
-from langchain_community.document_loaders import PyPDFLoader
-from langchain_text_splitters import RecursiveCharacterTextSplitter
-from langchain_openai import OpenAIEmbeddings
-from langchain_community.vectorstores import Chroma
 from langchain_core.documents import Document
 
-# 크롤러 모듈 import
-from crawler.cse_notice import crawl_notices as crawl_cse, notices_to_documents as cse_ntd
-from crawler.sw_notice import crawl_notices as crawl_sw, notices_to_documents as sw_ntd
-from crawler.dorm_seoul import crawl_notices as crawl_dorm_seoul, notices_to_documents as dorm_seoul_ntd
-from crawler.dorm_suwon import crawl_notices as crawl_dorm_suwon, notices_to_documents as dorm_suwon_ntd
-from crawler.skku_notice import crawl_notices as crawl_skku_main, notices_to_documents as skku_main_ntd
+from vector_store import (
+    open_vectorstore, upsert_chunks, dedupe_vectorstore, group_chunk_ids, replace_stale_chunks,
+    replace_source_chunks, update_chunk_metadata, get_source_key, get_existing_ids, ID_BATCH_SIZE
+)
+from vector_shards import ALL_SHARDS, BOARD_FLAG_PREFIX, PDF_SHARD, board_flags, shard_name
+from chunking import split_documents as split_into_sections
+from parent_store import ParentStore, referenced_parent_ids
+from notice_state import (
+    load_notice_state, save_notice_state, record_notice_documents, select_recent_notices, notice_hash,
+    is_notice_document, duplicate_boards
+)
+from near_dup import NearDuplicateIndex, minhash_signature, encode_signature
+from embedding_cache import CachedEmbeddings
+from date_utils import annotate_date_metadata
+from retention import apply_retention, backfill_date_metadata, format_size, is_notice_expired, retention_days
+from index_versions import get_live_dir, create_staging_dir, publish, discard, cleanup_old_versions
+from embedding_pipeline import MAX_BATCH_TOKENS, MAX_CONCURRENCY
+from checkpoint import IngestCheckpoint
+from crawl_state import get_crawl_state
+from notice_catalog import LATEST_NOTICES_COUNT, write_latest_notices
+from pipeline import SourceUnit, SOURCE_QUEUE_SIZE, prefetch, stream_from_threads, iter_doc_windows
+from pdf_source import (
+    PDF_NEW_DIR, PDF_WORKERS, PAGES_AHEAD, load_pdf_manifest, save_pdf_manifest, list_new_pdfs, pdf_record,
+    count_pages, create_pdf_pool, iter_pages
+)
+
+# 크롤러 모듈 import (게시판 설정은 crawler/boards.py)
+from crawler.boards import BOARD_SPECS, BoardSpec
+from crawler.engine import crawl_board, notices_to_documents, parse_body
+from crawler.revalidate import fetch_notice_bodies
+from crawler.fetcher import DEFAULT_FETCH_MODE
+from crawler.browser_pool import shutdown_browser_pool
 
 # 정적 데이터 import
 try:
@@ -38,12 +63,32 @@ except ImportError:
     print("⚠️ static_data.py not found. Skipping static documents.")
 
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))  # src/rag -- cron의 db 생성 위치 통일성을 위함
-PDF_DIR = os.path.join(BASE_DIR, "pdf_doc")
-PDF_NEW_DIR = os.path.join(PDF_DIR, "new")  # 새로운 PDF
-PDF_PROCESSED_DIR = os.path.join(PDF_DIR, "processed")  # 처리 완료 PDF
-PERSIST_DIR = os.path.join(BASE_DIR, "chroma_db")
-CRAWLED_DATA_FILE = os.path.join(BASE_DIR, "crawled_data.json") # 게시판별 post_num 저장
-LATEST_NOTICES_FILE = os.path.join(BASE_DIR, "latest_notices.json") # 최신 공지사항 저장 (전체 통합)
+PDF_UNIT_PAGES = 20  # PDF를 나누어 인덱싱하는 페이지 수 (체크포인트 기록 단위)
+REVALIDATE_LIMIT = 10  # 게시판별로 수정 여부를 다시 확인할 최근 공지 수
+CRAWL_WORKERS = 4  # 동시에 크롤링할 호스트 수 (같은 호스트의 게시판은 순차 실행)
+SMOKE_QUERY = "성균관대학교 학사일정 공지사항"  # 새 인덱스 배포 전 검증용 질의
+
+CRAWL_KWARGS = {"max_pages": 3, "delay": 2}  # 모든 게시판 공통 크롤링 인자
+
+def build_crawler_config(spec: BoardSpec, crawl_kwargs: dict = None) -> dict:
+    """
+    BoardSpec으로 크롤러 설정 생성
+    - host: 같은 서버의 게시판은 동시에 크롤링하지 않도록 묶는 기준
+    - crawl_kwargs.fetch_mode: http(HTTP만) / browser(Chrome만) / auto(HTTP 우선, 필요한 페이지만 Chrome)
+    """
+    return {
+        "board_name": spec.board_name,
+        "host": spec.host,
+        "crawl_func": partial(crawl_board, spec),
+        "notices_to_docs_func": partial(notices_to_documents, spec),
+        "parse_body_func": partial(parse_body, spec),
+        "body_selector": spec.body_selector,
+        "body_strainer": spec.body_strainer,
+        "crawl_kwargs": {**CRAWL_KWARGS, "fetch_mode": spec.fetch_mode, **(crawl_kwargs or {})},
+    }
+
+# 크롤러 설정 리스트 (공지사항)
+NOTICE_CRAWLERS = [build_crawler_config(spec) for spec in BOARD_SPECS]
 
 def clean_text(text: str) -> str:
     """텍스트 인코딩 정리"""
@@ -53,123 +98,137 @@ def clean_text(text: str) -> str:
 
 def load_crawled_data() -> Dict[str, Set[str]]:
     """
-    이미 크롤링한 데이터 로드
+    이미 크롤링한 데이터 로드 (crawl_state.sqlite3)
     Returns:
         dict: {"소프트웨어학과": {"909", "908", ...}, "기숙사": {...}, ...}
     """
-    if os.path.exists(CRAWLED_DATA_FILE):
-        try:
-            with open(CRAWLED_DATA_FILE, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                # list를 set으로 변환
-                return {board: set(nums) for board, nums in data.items()}
-        except Exception as e:
-            print(f"⚠️ Error loading crawled data: {e}")
-            return {}
-    return {}
+    try:
+        return get_crawl_state().load_post_nums()
+    except Exception as e:
+        print(f"⚠️ Error loading crawled data: {e}")
+        return {}
 
 def save_crawled_data(crawled_data: Dict[str, Set[str]]):
     """
-    크롤링한 데이터 저장
+    크롤링한 데이터 저장 (바뀐 글 번호만 트랜잭션 하나로 기록)
     
     Args:
         crawled_data: {"소프트웨어학과": {"909", "908", ...}, ...}
     """
     try:
-        # set을 list로 변환하여 JSON 저장
-        data_to_save = {board: list(nums) for board, nums in crawled_data.items()}
-        
-        with open(CRAWLED_DATA_FILE, 'w', encoding='utf-8') as f:
-            json.dump(data_to_save, f, ensure_ascii=False, indent=2)
-        
+        result = get_crawl_state().save_post_nums(crawled_data)
         total_count = sum(len(nums) for nums in crawled_data.values())
-        print(f"💾 Saved crawled data: {total_count} posts from {len(crawled_data)} boards")
+        print(f"💾 Saved crawled data: {total_count} posts from {len(crawled_data)} boards "
+              f"({result['added']} added, {result['removed']} removed)")
         
     except Exception as e:
         print(f"❌ Error saving crawled data: {e}")
 
-def update_latest_notices(all_notices: List[dict], top_n: int = 6):
+def update_latest_notices(top_n: int = LATEST_NOTICES_COUNT):
     """
     전체 게시판의 최신 공지사항 업데이트 (통합)
+    이번 실행에서 수집한 공지가 아니라 공지 카탈로그 전체 기준 (실행 간에도 항상 최신 top_n개)
     """
     try:
-        # 날짜순 정렬 (최신순) – None이면 '1970-01-01'로 대체
-        sorted_notices = sorted(
-            all_notices,
-            key=lambda x: (x.get('date') or '1970-01-01'),
-            reverse=True,
-        )
-
-        top_notices = []
-        for notice in sorted_notices[:top_n]:
-            top_notices.append({
-                'board_name': notice.get('board_name', ''),
-                'title': notice.get('title', ''),
-                'date': notice.get('date', ''),
-                'post_num': notice.get('post_num', ''),
-                'link': notice.get('link', '')
-            })
-
-        with open(LATEST_NOTICES_FILE, 'w', encoding='utf-8') as f:
-            json.dump(top_notices, f, ensure_ascii=False, indent=2)
+        top_notices = write_latest_notices(top_n)
 
         print(f"\n📌 Updated top {top_n} latest notices (all boards combined)")
         for i, notice in enumerate(top_notices, 1):
-            print(f"  {i}. [{notice['board_name']}] {notice['title']} ({notice['date']})")
+            print(f"  {i}. [{', '.join(notice['source_boards'])}] {notice['title']} ({notice['date']})")
 
     except Exception as e:
         print(f"⚠️ Error updating latest notices: {e}")
 
-def load_pdf_documents() -> List:
+def pdf_page_document(pdf_file: str, path: str, total_pages: int, page: tuple) -> Document:
+    """추출한 페이지 -> Document (PyPDFLoader와 같은 page / page_label / total_pages 메타데이터)"""
+    page_number, text, page_label = page
+    return Document(page_content=clean_text(text), metadata={
+        "source": path,
+        "total_pages": total_pages,
+        "page": page_number,
+        "page_label": page_label,
+        "source_type": "pdf",
+        "filename": pdf_file,
+    })
+
+def iter_pdf_units(
+    checkpoint: IngestCheckpoint,
+    manifest: Dict[str, dict],
+    workers: int = PDF_WORKERS
+) -> Iterator[SourceUnit]:
     """
-    pdf_doc/new/ 폴더의 PDF 파일들을 LangChain Document로 변환
-    처리 후 pdf_doc/processed/ 폴더로 이동
+    pdf_doc/new/의 처리하지 않은 PDF를 PDF_UNIT_PAGES 페이지씩 SourceUnit으로
+    페이지는 프로세스 풀에서 나누어 추출하고, 앞 페이지가 인덱싱되는 동안 다음 페이지를 추출
+    파일은 옮기지 않고, 마지막 페이지 묶음의 extra["pdf_files"]로 넘긴 기록을 배포 후 manifest에 저장
+    Args:
+        manifest: 처리한 PDF 기록 (내용 해시가 같은 PDF는 건너뜀)
+        workers: PDF 추출 프로세스 수
     """
-    # 디렉토리 생성
-    os.makedirs(PDF_NEW_DIR, exist_ok=True)
-    os.makedirs(PDF_PROCESSED_DIR, exist_ok=True)
-    
-    # new 폴더의 PDF 파일 목록
-    pdf_files = [f for f in os.listdir(PDF_NEW_DIR) if f.endswith('.pdf')]
-    
-    if not pdf_files:
-        print(f"No PDF files found in {PDF_NEW_DIR}")
-        return []
-    
     print(f"\n{'='*60}")
     print(f"📄 Loading PDF Documents from {PDF_NEW_DIR}")
     print(f"{'='*60}")
-    print(f"Found {len(pdf_files)} PDF file(s)")
-    
-    all_pdf_docs = []
+    pdf_files = list_new_pdfs(manifest)
+    if not pdf_files:
+        print(f"No new PDF files found in {PDF_NEW_DIR}")
+        return
+    print(f"Found {len(pdf_files)} new PDF file(s) (extracting with {workers} process(es))")
     
-    for pdf_file in pdf_files:
-        pdf_path = os.path.join(PDF_NEW_DIR, pdf_file)
-        
-        try:
-            print(f"\n  Processing: {pdf_file}")
-            pdf_loader = PyPDFLoader(pdf_path)
-            pdf_docs = pdf_loader.load()
-            
-            for d in pdf_docs:
-                d.page_content = clean_text(d.page_content)
-                d.metadata["source_type"] = "pdf"
-                d.metadata["filename"] = pdf_file
-            
-            all_pdf_docs.extend(pdf_docs)
-            print(f"    ✓ Loaded {len(pdf_docs)} pages")
+    with create_pdf_pool(workers) as pool:
+        for pdf_file, sha in pdf_files:
+            path = os.path.join(PDF_NEW_DIR, pdf_file)
+            try:
+                total_pages = count_pages(path)
+            except Exception as e:
+                print(f"    ❌ Error reading {pdf_file}: {e}")
+                continue
+            print(f"\n  Processing: {pdf_file} ({total_pages} pages)")
             
-            # 처리 완료 후 processed 폴더로 이동
-            processed_path = os.path.join(PDF_PROCESSED_DIR, pdf_file)
-            os.rename(pdf_path, processed_path)
-            print(f"    ✓ Moved to {PDF_PROCESSED_DIR}")
+            # 페이지 묶음별 이름 (내용 해시 포함 - 재개 시 같은 이름의 다른 파일과 구분)
+            units = []
+            for start in range(0, total_pages, PDF_UNIT_PAGES):
+                end = min(start + PDF_UNIT_PAGES, total_pages)
+                extra = {"pdf_files": {sha: pdf_record(pdf_file, path, total_pages)}} if end == total_pages else {}
+                units.append((f"pdf:{pdf_file}@{sha[:12]}:{start + 1}-{end}", range(start, end), extra))
             
-        except Exception as e:
-            print(f"    ❌ Error processing {pdf_file}: {e}")
-            continue
-    
-    print(f"\n✅ Total PDF pages loaded: {len(all_pdf_docs)}")
-    return all_pdf_docs
+            # 이전 실행에서 인덱싱이 끝난 묶음의 페이지는 추출하지 않음
+            page_numbers = (n for name, pages, _ in units if not checkpoint.is_indexed(name) for n in pages)
+            pages = iter_pages(pool, path, page_numbers, ahead=workers * PAGES_AHEAD)
+            try:
+                for name, unit_pages, extra in units:
+                    if checkpoint.is_indexed(name):
+                        yield SourceUnit(name, [], extra)
+                        continue
+                    docs = [pdf_page_document(pdf_file, path, total_pages, next(pages)) for _ in unit_pages]
+                    yield SourceUnit(name, docs, extra)
+            except Exception as e:
+                print(f"    ❌ Error processing {pdf_file}: {e}")
+            finally:
+                pages.close()
+
+def load_static_documents() -> List[Document]:
+    """static_data.py의 정적 Document"""
+    print(f"\n{'='*60}")
+    print("📚 Loading Static Documents...")
+    print(f"{'='*60}")
+    static_docs = get_static_documents()
+    for d in static_docs:
+        d.metadata.setdefault("source_type", "static")
+    print(f"✅ Loaded {len(static_docs)} static documents")
+    return static_docs
+
+def restore_unit(checkpoint: IngestCheckpoint, name: str) -> Optional[SourceUnit]:
+    """
+    체크포인트에 기록된 출처 단위 (없으면 None)
+    이미 인덱싱이 끝난 단위는 Document 없이 부가 정보(새 글 번호, 최신 공지용 요약)만 돌려줌
+    """
+    part = checkpoint.load_part(name)
+    if part is None:
+        return None
+    docs, extra = part
+    if checkpoint.is_indexed(name):
+        return SourceUnit(name, [], extra)
+    print(f"⏯️ {name}: {len(docs)} documents restored from checkpoint")
+    return SourceUnit(name, docs, extra)
 
 def process_crawler(
     board_name: str,
@@ -222,7 +281,7 @@ def process_crawler(
         new_post_nums = {n['post_num'] for n in notices}
         
         print(f"✅ Successfully crawled {len(notices)} {board_name} notices")
-        return docs, new_post_nums, notices  # notices도 반환 (최신 공지 업데이트용)
+        return docs, new_post_nums, notices
         
     except Exception as e:
         print(f"❌ Error crawling {board_name} notices: {e}")
@@ -230,209 +289,913 @@ def process_crawler(
         traceback.print_exc()
         return [], set(), []
 
-def load_crawler_documents(crawled_data: Dict[str, Set[str]]) -> tuple[List[Document], Dict[str, Set[str]]]:
+def crawl_host_group(
+    crawler_configs: List[dict],
+    crawled_data: Dict[str, Set[str]],
+    emit: Callable[[SourceUnit], None],
+    checkpoint: Optional[IngestCheckpoint] = None
+):
     """
-    여러 크롤러에서 데이터 수집 및 Document 변환
-    Args:
-        crawled_data: {"소프트웨어학과": {"909", ...}, "기숙사": {...}, ...}
-    Returns:
-        tuple: (all_documents, updated_crawled_data)
+    같은 호스트의 게시판들을 순서대로 크롤링 (호스트별 politeness 유지)
+    게시판이 끝날 때마다 emit으로 넘기고, 새 공지가 있으면 체크포인트에 기록
     """
-    all_docs = []
-    all_notices = []  # 최신 공지 업데이트용
-    updated_data = crawled_data.copy()
-    
-    # 크롤러 설정 리스트 (공지사항)
-    notice_crawlers = [
-        {
-            "board_name": "소프트웨어학과",
-            "crawl_func": crawl_cse,
-            "notices_to_docs_func": cse_ntd,
-            "crawl_kwargs": {
-                "max_pages": 3,
-                "delay": 2
-            }
-        },
-        {
-            "board_name": "소프트웨어융합대학",
-            "crawl_func": crawl_sw,
-            "notices_to_docs_func": sw_ntd,
-            "crawl_kwargs": {
-                "max_pages": 3,
-                "delay": 2
-            }
-        },
-        {
-            "board_name": "기숙사_서울",
-            "crawl_func": crawl_dorm_seoul,
-            "notices_to_docs_func": dorm_seoul_ntd,
-            "crawl_kwargs": {
-                "max_pages": 3,
-                "delay": 2
-            }
-        },
-        {
-            "board_name": "기숙사_수원",
-            "crawl_func": crawl_dorm_suwon,
-            "notices_to_docs_func": dorm_suwon_ntd,
-            "crawl_kwargs": {
-                "max_pages": 3,
-                "delay": 2
-            }
-        },
-        {
-            "board_name": "학교_대표공지",
-            "crawl_func": crawl_skku_main,
-            "notices_to_docs_func": skku_main_ntd,
-            "crawl_kwargs": {
-                "max_pages": 3,
-                "delay": 2
-            }
-        },
-    ]
-    
-    # 각 공지사항 크롤러 실행
-    for crawler_config in notice_crawlers:
+    for crawler_config in crawler_configs:
         board_name = crawler_config["board_name"]
-        existing_nums = updated_data.get(board_name, set())
-        
-        docs, new_nums, notices = process_crawler(
+        docs, new_post_nums, _ = process_crawler(
             board_name=board_name,
             crawl_func=crawler_config["crawl_func"],
             notices_to_docs_func=crawler_config["notices_to_docs_func"],
-            existing_post_nums=existing_nums,
+            existing_post_nums=set(crawled_data.get(board_name, set())),
             crawl_kwargs=crawler_config["crawl_kwargs"]
         )
-        
-        if docs:
-            all_docs.extend(docs)
-            all_notices.extend(notices)
-            # 기존 번호 + 새 번호 합치기
-            updated_data[board_name] = existing_nums | new_nums
+        name = f"board:{board_name}"
+        extra = {"board_name": board_name, "new_post_nums": sorted(new_post_nums)}
+        if checkpoint is not None and docs:
+            checkpoint.save_part(name, docs, extra)
+        emit(SourceUnit(name, docs, extra))
+
+def iter_crawled_boards(
+    crawled_data: Dict[str, Set[str]],
+    workers: int = CRAWL_WORKERS,
+    checkpoint: Optional[IngestCheckpoint] = None
+) -> Iterator[SourceUnit]:
+    """
+    게시판별 크롤링 결과를 끝나는 대로 yield
+    호스트가 다른 게시판은 최대 workers개까지 동시에 크롤링하고,
+    결과를 처리하는 쪽이 밀리면 끝난 게시판을 넘겨주기 전까지 다음 게시판 크롤링이 기다림
+    Args:
+        crawled_data: {"소프트웨어학과": {"909", ...}, "기숙사": {...}, ...} (읽기만 함)
+        workers: 동시에 크롤링할 호스트 수
+        checkpoint: 이전 실행에서 끝난 게시판은 다시 크롤링하지 않고 기록된 결과 사용
+    Yields:
+        SourceUnit: name="board:<게시판>", extra={"board_name", "new_post_nums"}
+    """
+    # 체크포인트에 기록된 게시판 결과
+    host_groups: Dict[str, List[dict]] = {}
+    for crawler_config in NOTICE_CRAWLERS:
+        unit = None
+        if checkpoint is not None:
+            unit = restore_unit(checkpoint, f"board:{crawler_config['board_name']}")
+        if unit is not None:
+            yield unit
+        else:
+            # 호스트별로 게시판 묶기 (NOTICE_CRAWLERS 순서 유지)
+            host_groups.setdefault(crawler_config["host"], []).append(crawler_config)
+    if not host_groups:
+        return
     
-    # 전체 게시판 통합하여 최신 공지 업데이트
-    if all_notices:
-        update_latest_notices(all_notices, top_n=6)
-
-    return all_docs, updated_data
-
-def split_documents(docs: List) -> List:
-    """문서를 작은 청크로 분할"""
-    print(f"\n📄 Splitting documents into chunks...")
-    splitter = RecursiveCharacterTextSplitter(
-        chunk_size=400,
-        chunk_overlap=100,
-    )
-    chunks = splitter.split_documents(docs)
-    print(f"Created {len(chunks)} chunks from {len(docs)} documents")
-    return chunks
+    # workers개 스레드가 남은 호스트 그룹을 하나씩 가져가 크롤링
+    pending_groups = queue.Queue()
+    for configs in host_groups.values():
+        pending_groups.put(configs)
+    
+    def crawl_worker(emit):
+        while True:
+            try:
+                configs = pending_groups.get_nowait()
+            except queue.Empty:
+                return
+            crawl_host_group(configs, crawled_data, emit, checkpoint)
+    
+    start_time = time.perf_counter()
+    worker_count = min(max(1, workers), len(host_groups))
+    # 대기열 크기는 1 (처리 대기 중인 게시판 수는 main의 prefetch 큐에서 제한)
+    yield from stream_from_threads([crawl_worker] * worker_count, maxsize=1)
+    
+    elapsed = time.perf_counter() - start_time
+    print(f"\n⏱️ Crawled {sum(len(c) for c in host_groups.values())} boards on {len(host_groups)} hosts in {elapsed:.1f}s")
+
+def revalidate_board(
+    crawler_config: dict,
+    notice_state: Dict[str, dict],
+    limit: Optional[int] = REVALIDATE_LIMIT,
+    fetch_mode: Optional[str] = None,
+    force: bool = False,
+    records: Optional[List[dict]] = None
+) -> List[Document]:
+    """
+    게시판 최근 공지의 상세페이지를 다시 가져와 수정 여부 확인
+    Args:
+        crawler_config: NOTICE_CRAWLERS 항목
+        notice_state: load_notice_state() 결과 (checked_at 갱신)
+        limit: 확인할 최근 공지 수 (None이면 전체)
+        fetch_mode: 게시판 설정 대신 사용할 fetch 모드 ("cache"면 네트워크 없이 HTML 캐시로 재파싱)
+        force: 본문이 바뀌지 않은 공지도 돌려줌 (샤드 다시 만들기)
+        records: 최근 공지 대신 다시 가져올 공지 ([{"source_key": ..., **record}, ...])
+    Returns:
+        list: 본문이 바뀐 공지의 새 Document 리스트
+    """
+    board_name = crawler_config["board_name"]
+    if records is None:
+        records = select_recent_notices(notice_state, board_name, limit)
+    if not records:
+        return []
+
+    print(f"\n{'='*60}")
+    print(f"🔁 Revalidating {len(records)} {'' if limit is None else 'recent '}{board_name} notices...")
+    print(f"{'='*60}")
+
+    try:
+        results = fetch_notice_bodies(
+            crawler_config["parse_body_func"],
+            [r["metadata"].get("link") for r in records],
+            delay=crawler_config["crawl_kwargs"].get("delay", 1),
+            fetch_mode=fetch_mode or crawler_config["crawl_kwargs"].get("fetch_mode", DEFAULT_FETCH_MODE),
+            expect=crawler_config["body_selector"],
+            parse_only=crawler_config.get("body_strainer")
+        )
+    except Exception as e:
+        print(f"❌ Error revalidating {board_name} notices: {e}")
+        return []
+
+    changed_docs = []
+    now = datetime.now().isoformat(timespec="seconds")
+    for record, result in zip(records, results):
+        if result is None:
+            continue
+        notice_state[record["source_key"]]["checked_at"] = now
+
+        body, meta = result
+        body = clean_text(body)
+        metadata = dict(record["metadata"])
+        if not body or (not force and notice_hash(metadata.get("title"), body) == record["content_hash"]):
+            continue
+
+        # 최종 수정일이 있는 게시판은 날짜도 갱신
+        if meta.get("date"):
+            metadata["date"] = meta["date"]
+            metadata["modified"] = meta["date"]
+        changed_docs.append(Document(page_content=body, metadata=metadata))
+        if not force:
+            print(f"  ✏️ Changed: {metadata.get('title')} ({record['source_key']})")
+
+    print(f"✅ {board_name}: {len(changed_docs)} {'re-fetched' if force else 'changed'} notices")
+    return changed_docs
 
-def build_vectorstore(chunks: List, mode: str = "create"):
+def iter_revalidated_units(
+    checkpoint: IngestCheckpoint,
+    notice_state: Dict[str, dict],
+    limit: Optional[int] = REVALIDATE_LIMIT,
+    fetch_mode: Optional[str] = None,
+    prefix: str = "revalidate",
+    boards: Optional[Set[str]] = None,
+    force: bool = False
+) -> Iterator[SourceUnit]:
     """
-    벡터스토어 생성 또는 업데이트
+    게시판별 재검증 결과 SourceUnit (name="<prefix>:<게시판>", 끝나는 대로 체크포인트에 기록)
     Args:
-        chunks: 문서 청크 리스트
+        boards: 이 게시판만 재검증 (None이면 전체)
+        force: 바뀌지 않은 공지도 다시 인덱싱 (샤드 다시 만들기)
+    """
+    for crawler_config in NOTICE_CRAWLERS:
+        if boards is not None and crawler_config["board_name"] not in boards:
+            continue
+        name = f"{prefix}:{crawler_config['board_name']}"
+        unit = restore_unit(checkpoint, name)
+        if unit is None:
+            docs = revalidate_board(crawler_config, notice_state, limit=limit, fetch_mode=fetch_mode, force=force)
+            checkpoint.save_part(name, docs)
+            unit = SourceUnit(name, docs, {})
+        yield unit
+
+def iter_sources(
+    checkpoint: IngestCheckpoint,
+    crawled_data: Dict[str, Set[str]],
+    notice_state: Dict[str, dict],
+    include_pdf: bool = False,
+    include_crawlers: bool = True,
+    include_static: bool = True,
+    revalidate: bool = True,
+    revalidate_limit: int = REVALIDATE_LIMIT,
+    reparse: bool = False,
+    crawl_workers: int = CRAWL_WORKERS,
+    pdf_manifest: Dict[str, dict] = None,
+    pdf_workers: int = PDF_WORKERS,
+    rebuild_boards: Optional[Set[str]] = None
+) -> Iterator[SourceUnit]:
+    """
+    이번 실행에서 인덱싱할 출처 단위를 순서대로 yield (PDF → 정적 데이터 → 게시판 → 재검증 → 샤드 다시 만들기)
+    Args:
+        crawled_data: 크롤링 기록 (읽기만 함)
+        notice_state: 재검증할 공지 목록 (인덱싱하면서 바뀌는 공지 상태와 별도의 복사본)
+        pdf_manifest: 처리한 PDF 기록 (읽기만 함)
+        rebuild_boards: 샤드를 비운 게시판 (기록된 공지 전체를 다시 가져와 인덱싱)
+    """
+    try:
+        # 1. PDF 로드 (페이지 단위 병렬 추출)
+        if include_pdf:
+            yield from iter_pdf_units(checkpoint, pdf_manifest or {}, workers=pdf_workers)
+        
+        # 2. 정적 데이터 로드 (다시 만들기 쉬우므로 체크포인트에는 인덱싱 여부만 기록)
+        if include_static and STATIC_DATA_AVAILABLE and not checkpoint.is_indexed("static"):
+            yield SourceUnit("static", load_static_documents(), {})
+        
+        # 3. 크롤러 실행
+        if reparse:
+            # 파서를 고친 뒤 캐시된 상세페이지로 전체 공지 재파싱 (바뀐 공지만 청크 교체)
+            yield from iter_revalidated_units(checkpoint, notice_state, limit=None, fetch_mode="cache", prefix="reparse")
+        elif include_crawlers:
+            yield from iter_crawled_boards(crawled_data, workers=crawl_workers, checkpoint=checkpoint)
+            
+            # 4. 최근 공지 수정 여부 재검증 (수정된 공지는 청크 교체)
+            if revalidate:
+                yield from iter_revalidated_units(checkpoint, notice_state, limit=revalidate_limit)
+        
+        # 5. 비운 샤드의 게시판 공지 전체 (바뀌지 않은 상세페이지는 HTML 캐시의 조건부 GET으로 304)
+        if rebuild_boards:
+            yield from iter_revalidated_units(
+                checkpoint, notice_state, limit=None, prefix="rebuild", boards=rebuild_boards, force=True
+            )
+    finally:
+        # 수집이 끝났으므로 공유 브라우저 풀 종료
+        shutdown_browser_pool()
+
+def annotate_dates(docs: List[Document]):
+    """
+    date 문자열을 epoch timestamp(date_ts)와 학기 태그(semester)로 변환하여 메타데이터에 추가
+    (보존 정책/게시일 범위 필터/최신 가중치용, 연도만 있는 정적 데이터는 학기 태그 없음)
+    """
+    for d in docs:
+        annotate_date_metadata(d.metadata)
+
+def run_retention(
+    notice_state: Dict[str, dict],
+    persist_dir: str,
+    vectordb=None,
+    dup_index: Optional[NearDuplicateIndex] = None
+):
+    """
+    보존 정책 적용 후 인덱스 크기 출력
+    만료되어 삭제된 공지는 notice_state와 대표 공지 인덱스에서도 제거 (재검증 대상 제외)
+    만료된 대표 공지에 합쳐진 공지는 자기 게시판 보존 기간이 남았으면 대표 공지로 올림 (promote_duplicates)
+    """
+    print(f"\n{'='*60}")
+    print("🗑️ Applying retention policy...")
+    print(f"{'='*60}")
+
+    if vectordb is None:
+        vectordb = open_vectorstore(persist_dir)
+    result = apply_retention(vectordb, persist_dir)
+
+    for board_name, count in result["deleted"].items():
+        print(f"  - {board_name}: {count} expired chunks deleted")
+    if result["compacted"]:
+        print(f"  - Compacted shards: {', '.join(result['compacted'])}")
+    expired = set(result["expired_source_keys"])
+    for source_key in expired:
+        notice_state.pop(source_key, None)
+        if dup_index is not None:
+            dup_index.remove(source_key)
+    promoted = promote_duplicates(notice_state, expired)
+    if promoted:
+        print(f"  - {len(promoted)} cross-posted notices take over from their expired canonical copy")
+    result["promoted"] = promoted
+
+    print(f"✅ Index size: {format_size(result['size_before'])} → {format_size(result['size_after'])}")
+    return result
+
+def split_documents(docs: List) -> tuple:
+    """
+    문서를 구조 기반으로 분할 (문장/목록 항목/일정 행 경계, chunking.py)
+    Returns:
+        tuple: (임베딩할 자식 청크, {parent_id: (source_key, 섹션 본문)})
+    """
+    chunks, parents = split_into_sections(docs)
+    print(f"Created {len(chunks)} chunks in {len(parents)} sections from {len(docs)} documents")
+    return chunks, parents
+
+def prepare_vectorstore(persist_dir: str, mode: str = "create", rebuild_shards=()) -> tuple:
+    """
+    인덱싱할 벡터스토어 열기
+    임베딩은 디스크 캐시(cache/embeddings.sqlite3)를 거치므로
+    --create 재구축이나 샤드 다시 만들기에도 처음 보는 텍스트만 API로 임베딩됨
+    Args:
+        persist_dir: 벡터스토어 디렉토리 (배포 전 새 버전 디렉토리)
         mode: "create" (새로 만들기) 또는 "update" (기존에 추가)
+        rebuild_shards: update 모드에서 비우고 다시 인덱싱할 샤드
+    Returns:
+        tuple: (vectordb, embeddings, 기존 컬렉션에서 샤드로 옮긴 청크 수)
     """
     print(f"\n🔮 Building vector store...")
-    embeddings = OpenAIEmbeddings(model="text-embedding-3-small")
+    embeddings = CachedEmbeddings()
+    vectordb = open_vectorstore(persist_dir, embeddings)
+    moved = {}
+
+    if mode == "update":
+        print(f"Updating existing vector store at {persist_dir}")
+        # 샤드 도입 전 단일 컬렉션은 샤드로 옮김 (임베딩 재사용)
+        moved = vectordb.migrate_legacy()
+        if moved:
+            print(f"🔀 Moved {sum(moved.values())} chunks from the legacy collection into {len(moved)} shards")
+        for name, count in vectordb.drop_shards(rebuild_shards).items():
+            print(f"♻️ Dropped shard {name} ({count} chunks) for rebuild")
+    else:
+        # 기존 컬렉션 전체 삭제 후 새로 생성
+        print(f"Creating new vector store at {persist_dir}")
+        vectordb.drop_shards(vectordb.collection_names())
+    return vectordb, embeddings, sum(moved.values())
+
+def rebuild_targets(shards) -> dict:
+    """
+    다시 만들 샤드 -> 다시 인덱싱할 출처
+    Returns:
+        dict: {"boards": 공지를 전부 다시 가져올 게시판 set, "static": bool, "pdf": bool}
+    """
+    unknown = sorted(set(shards) - set(ALL_SHARDS))
+    if unknown:
+        raise ValueError(f"Unknown shard(s): {', '.join(unknown)} (available: {', '.join(ALL_SHARDS)})")
+    shards = set(shards)
+    return {
+        "boards": {c["board_name"] for c in NOTICE_CRAWLERS if shard_name({"board_name": c["board_name"]}) in shards},
+        "static": any(name.startswith("static_") for name in shards),
+        "pdf": PDF_SHARD in shards,
+    }
+
+def restore_missing_notice_chunks(vectordb, notice_state: Dict[str, dict], boards: Set[str], live_dir: str) -> int:
+    """
+    다시 만든 샤드에서 상세페이지를 다시 가져오지 못한 공지의 청크를 서비스 중인 인덱스에서 복사 (임베딩 재사용)
+    Returns:
+        int: 복사한 청크 수
+    """
+    chunk_ids = [
+        chunk_id for record in notice_state.values() if record.get("board_name") in boards
+        for chunk_id in record.get("chunk_ids", [])
+    ]
+    existing = get_existing_ids(vectordb, chunk_ids)
+    missing = [chunk_id for chunk_id in chunk_ids if chunk_id not in existing]
+    if not missing or live_dir is None:
+        return 0
+
+    live = open_vectorstore(live_dir)
+    restored = 0
+    for start in range(0, len(missing), ID_BATCH_SIZE):
+        stored = live.get(ids=missing[start:start + ID_BATCH_SIZE], include=["embeddings", "documents", "metadatas"])
+        if stored["ids"]:
+            vectordb.upsert(stored["ids"], stored["embeddings"], stored["documents"], stored["metadatas"])
+            restored += len(stored["ids"])
+    return restored
+
+def print_shard_stats(vectordb):
+    """샤드별 청크 수와 HNSW 인덱스 크기"""
+    stats = vectordb.shard_stats()
+    print(f"\n📦 Shards ({len(stats)}):")
+    for name, stat in stats.items():
+        print(f"  - {name}: {stat['chunks']} chunks, {format_size(stat['bytes'])}")
+
+def canonical_priority(board_name: str, source_key: str) -> tuple:
+    """
+    대표 공지 선택 순서 (작을수록 우선): 보존 기간이 긴 게시판 → 게시판 이름 → source_key
+    게시판을 동시에 크롤링하므로 먼저 인덱싱된 순서가 아니라 이 순서로 정해야 실행마다 같은 공지가 대표 공지가 됨
+    """
+    return (-retention_days(board_name), board_name, source_key)
+
+def collapse_duplicates(
+    vectordb,
+    docs: List[Document],
+    notice_state: Dict[str, dict],
+    dup_index: NearDuplicateIndex
+) -> tuple:
+    """
+    다른 게시판의 대표 공지와 거의 같은 공지는 임베딩하지 않고 대표 공지의 source_boards에 게시판 추가
+    - 대표 공지는 canonical_priority 순서로 선택 (새 공지가 앞서면 기존 대표 공지의 청크를 지우고 새 공지에 합침)
+    - 중복 공지는 청크 없이 공지 상태에 duplicate_of로 기록 (이전에 저장된 청크가 있으면 삭제)
+    - 남은 공지는 대표 공지로 LSH 인덱스에 추가하고, source_boards에 중복 공지의 게시판을 포함
+    Returns:
+        tuple: (인덱싱할 Document, {source_key: 서명}, source_boards를 다시 계산할 대표 공지, 합친 공지 수, 삭제한 청크 수)
+    """
+    kept = []
+    duplicates = []
+    demoted = []
+    signatures = {}
+    touched = set()
+
+    def redirect(old_key: str, new_key: str):
+        # old_key에 합쳐진 공지를 new_key로 옮김 (공지 상태 + 이번 window의 중복 공지)
+        for record in notice_state.values():
+            if record.get("metadata", {}).get("duplicate_of") == old_key:
+                record["metadata"] = {**record["metadata"], "duplicate_of": new_key}
+        for duplicate in duplicates:
+            if duplicate.metadata.get("duplicate_of") == old_key:
+                duplicate.metadata["duplicate_of"] = new_key
+
+    for doc in docs:
+        if not is_notice_document(doc):
+            kept.append(doc)
+            continue
+        source_key = get_source_key(doc.metadata)
+        board_name = doc.metadata.get("board_name", "")
+        previous = notice_state.get(source_key, {}).get("metadata", {}).get("duplicate_of")
+        doc.metadata.pop("duplicate_of", None)
+        
+        signature = minhash_signature(f"{doc.metadata.get('title', '')}\n{doc.page_content}")
+        match = dup_index.find(source_key, board_name, signature) if signature is not None else None
+        if signature is not None:
+            signatures[source_key] = encode_signature(signature)
+        if previous:
+            touched.add(previous)
+        
+        if match is not None:
+            canonical_key, score = match
+            if canonical_priority(board_name, source_key) < canonical_priority(dup_index.boards[canonical_key], canonical_key):
+                # 이 공지가 대표 공지가 되고 기존 대표 공지는 이 공지에 합침
+                print(f"  🔗 {canonical_key} ≈ {source_key} (similarity {score:.2f}), canonical copy moves to {source_key}")
+                dup_index.remove(canonical_key)
+                pending = next((d for d in kept if get_source_key(d.metadata) == canonical_key), None)
+                if pending is not None:
+                    kept.remove(pending)
+                    pending.metadata["duplicate_of"] = source_key
+                    duplicates.append(pending)
+                elif canonical_key in notice_state:
+                    record = notice_state[canonical_key]
+                    metadata = {
+                        k: v for k, v in record["metadata"].items()
+                        if k != "source_boards" and not k.startswith(BOARD_FLAG_PREFIX)
+                    }
+                    record["metadata"] = {**metadata, "duplicate_of": source_key}
+                    demoted.append(canonical_key)
+                redirect(canonical_key, source_key)
+                match = None
+        
+        if match is None:
+            kept.append(doc)
+            if signature is not None:
+                dup_index.add(source_key, board_name, signature)
+            else:
+                dup_index.remove(source_key)
+            continue
+        
+        canonical_key, score = match
+        print(f"  🔗 {source_key} ≈ {canonical_key} (similarity {score:.2f}), not embedded")
+        doc.metadata["duplicate_of"] = canonical_key
+        duplicates.append(doc)
+        touched.add(canonical_key)
+        dup_index.remove(source_key)
+        # 대표 공지였다면 이 공지의 중복 공지도 새 대표 공지로 옮김
+        redirect(source_key, canonical_key)
+    
+    removed = 0
+    if duplicates:
+        no_chunks = {get_source_key(doc.metadata): [] for doc in duplicates}
+        removed = replace_stale_chunks(vectordb, notice_state, no_chunks)
+        record_notice_documents(notice_state, duplicates, no_chunks, signatures)
+    if demoted:
+        # 이전 실행에서 인덱싱한 대표 공지를 합친 경우 저장된 청크 삭제
+        removed += replace_stale_chunks(vectordb, notice_state, {key: [] for key in demoted})
+        for key in demoted:
+            notice_state[key]["chunk_ids"] = []
     
-    if mode == "update" and os.path.exists(PERSIST_DIR):
-        # 기존 벡터스토어에 추가
-        print(f"Updating existing vector store at {PERSIST_DIR}")
-        vectordb = Chroma(
-            embedding_function=embeddings,
-            persist_directory=PERSIST_DIR,
+    boards_by_key = duplicate_boards(notice_state)
+    for doc in kept:
+        if is_notice_document(doc):
+            source_key = get_source_key(doc.metadata)
+            boards = list(dict.fromkeys([doc.metadata.get("board_name", "")] + boards_by_key.get(source_key, [])))
+            doc.metadata["source_boards"] = ",".join(boards)
+            doc.metadata.update(board_flags(boards, doc.metadata))
+            touched.discard(source_key)
+    return kept, signatures, touched, len(duplicates) + len(demoted), removed
+
+def promote_duplicates(notice_state: Dict[str, dict], expired_keys: Set[str]) -> List[str]:
+    """
+    만료된 대표 공지에 합쳐진 공지 처리
+    - 자기 게시판 보존 기간도 지난 공지는 공지 상태에서 제거
+    - 남은 공지 중 canonical_priority가 가장 앞선 공지를 대표 공지로 올리고(pending_reindex, 다시 인덱싱), 나머지는 그 공지에 합침
+    (공지 상태에서 지우면 크롤링 기록에 번호가 남아 다시 수집되지 않으므로 보존 기간이 남은 공지는 지우지 않음)
+    Returns:
+        list: 대표 공지가 된 공지 source_key
+    """
+    now = datetime.now()
+    survivors: Dict[str, List[str]] = {}
+    for source_key, record in list(notice_state.items()):
+        canonical_key = record.get("metadata", {}).get("duplicate_of")
+        if canonical_key not in expired_keys:
+            continue
+        if is_notice_expired(record["metadata"], record.get("board_name", ""), now):
+            notice_state.pop(source_key)
+        else:
+            survivors.setdefault(canonical_key, []).append(source_key)
+
+    promoted = []
+    for keys in survivors.values():
+        keys.sort(key=lambda key: canonical_priority(notice_state[key].get("board_name", ""), key))
+        new_key = keys[0]
+        record = notice_state[new_key]
+        metadata = {k: v for k, v in record["metadata"].items() if k != "duplicate_of"}
+        notice_state[new_key] = {**record, "metadata": metadata, "pending_reindex": True}
+        for key in keys[1:]:
+            notice_state[key]["metadata"] = {**notice_state[key]["metadata"], "duplicate_of": new_key}
+        promoted.append(new_key)
+    return promoted
+
+def reindex_pending_notices(
+    vectordb,
+    notice_state: Dict[str, dict],
+    checkpoint: IngestCheckpoint,
+    dup_index: NearDuplicateIndex,
+    parent_store: ParentStore,
+    batch_tokens: int = MAX_BATCH_TOKENS,
+    embed_workers: int = MAX_CONCURRENCY
+) -> Dict[str, int]:
+    """
+    대표 공지로 올라간 공지(pending_reindex)의 상세페이지를 다시 가져와 인덱싱
+    가져오지 못한 공지는 표시가 남아 다음 실행에서 다시 시도
+    Returns:
+        dict: index_source_unit 결과 합계
+    """
+    totals = dict.fromkeys(("documents", "chunks", "new", "unchanged", "replaced", "duplicates"), 0)
+    for crawler_config in NOTICE_CRAWLERS:
+        board_name = crawler_config["board_name"]
+        records = [
+            {"source_key": source_key, **record} for source_key, record in notice_state.items()
+            if record.get("pending_reindex") and record.get("board_name") == board_name
+        ]
+        if not records:
+            continue
+        docs = revalidate_board(crawler_config, notice_state, limit=None, force=True, records=records)
+        if not docs:
+            continue
+        unit_totals = index_source_unit(
+            vectordb, SourceUnit(f"promote:{board_name}", docs, {}), notice_state, checkpoint, dup_index, parent_store,
+            batch_tokens=batch_tokens, embed_workers=embed_workers
         )
-        vectordb.add_documents(chunks)
-    else:
-        # 새로 생성
-        print(f"Creating new vector store at {PERSIST_DIR}")
-        vectordb = Chroma.from_documents(
-            documents=chunks,
-            embedding=embeddings,
-            persist_directory=PERSIST_DIR,
+        for key, value in unit_totals.items():
+            totals[key] += value
+    return totals
+
+def refresh_source_boards(vectordb, notice_state: Dict[str, dict], canonical_keys) -> int:
+    """
+    대표 공지의 source_boards / 게시판 플래그(board:<게시판>) 메타데이터를 공지 상태 기준으로 다시 계산하여
+    저장된 청크에 반영 (재임베딩 없음)
+    Returns:
+        int: 메타데이터를 바꾼 청크 수
+    """
+    boards_by_key = duplicate_boards(notice_state)
+    updated = 0
+    for source_key in canonical_keys:
+        record = notice_state.get(source_key)
+        if not record or not record.get("chunk_ids"):
+            continue
+        boards = list(dict.fromkeys([record.get("board_name", "")] + boards_by_key.get(source_key, [])))
+        values = {"source_boards": ",".join(boards), **board_flags(boards, record["metadata"])}
+        if all(record["metadata"].get(key) == value for key, value in values.items()):
+            continue
+        record["metadata"] = {**record["metadata"], **values}
+        updated += update_chunk_metadata(vectordb, record["chunk_ids"], values)
+    return updated
+
+def index_source_unit(
+    vectordb,
+    unit: SourceUnit,
+    notice_state: Dict[str, dict],
+    checkpoint: IngestCheckpoint,
+    dup_index: NearDuplicateIndex,
+    parent_store: ParentStore,
+    batch_tokens: int = MAX_BATCH_TOKENS,
+    embed_workers: int = MAX_CONCURRENCY
+) -> Dict[str, int]:
+    """
+    출처 단위 하나를 window별로 중복 공지 합치기 → 날짜 정규화 → 청크 분할 → 임베딩/upsert → 이전 청크 교체
+    청크마다 출처 키 + 본문 해시 기반 ID를 부여하여 upsert하므로
+    내용이 바뀌지 않은 청크는 다시 임베딩되거나 중복 저장되지 않음
+    Args:
+        notice_state: 공지 상태 (새 공지 / 바뀐 공지 기록)
+        checkpoint: 임베딩 배치가 저장될 때마다 진행 상황 기록
+        dup_index: 대표 공지 MinHash LSH 인덱스 (다른 게시판의 같은 공지는 임베딩하지 않음)
+        parent_store: 부모 섹션 저장소 (자식 청크보다 먼저 저장하여 검색된 청크의 섹션이 항상 있음)
+        batch_tokens: 임베딩 배치당 최대 토큰 수 (window는 동시에 임베딩할 배치 수만큼)
+        embed_workers: 동시에 임베딩할 배치 수
+    Returns:
+        dict: {"documents", "chunks", "new", "unchanged", "replaced", "duplicates"}
+    """
+    totals = dict.fromkeys(("documents", "chunks", "new", "unchanged", "replaced", "duplicates"), 0)
+    for docs in iter_doc_windows(unit.docs, max_tokens=batch_tokens * embed_workers):
+        totals["documents"] += len(docs)
+        docs, signatures, touched, duplicates, removed = collapse_duplicates(vectordb, docs, notice_state, dup_index)
+        totals["duplicates"] += duplicates
+        totals["replaced"] += removed
+        
+        annotate_dates(docs)
+        chunks, parents = split_documents(docs)
+        parent_store.put_many(parents)
+        
+        embedded_before = checkpoint.manifest.get("embedded_chunks", 0)
+        stats = upsert_chunks(
+            vectordb, chunks, max_tokens=batch_tokens, concurrency=embed_workers,
+            on_batch=lambda embedded, total: checkpoint.record_batch(embedded_before + embedded)
         )
-    
-    vectordb.persist()
-    print(f"✅ Vector store saved to: {PERSIST_DIR}")
-    return vectordb
+        
+        # 수정된 공지의 이전 청크 삭제 (새 청크 upsert 후 삭제하므로 공지가 비는 순간 없음)
+        chunk_ids_by_key = group_chunk_ids(chunks)
+        totals["replaced"] += replace_stale_chunks(vectordb, notice_state, chunk_ids_by_key)
+        # 정적 데이터/PDF는 공지 상태가 없으므로 같은 출처 키의 저장된 청크와 비교하여 교체
+        static_keys = {get_source_key(doc.metadata) for doc in docs if not is_notice_document(doc)}
+        totals["replaced"] += replace_source_chunks(
+            vectordb, {key: ids for key, ids in chunk_ids_by_key.items() if key in static_keys}
+        )
+        record_notice_documents(notice_state, docs, chunk_ids_by_key, signatures)
+        refresh_source_boards(vectordb, notice_state, touched)
+        
+        totals["chunks"] += len(chunks)
+        totals["new"] += stats["new"]
+        totals["unchanged"] += stats["unchanged"]
+    return totals
+
+def validate_index(persist_dir: str) -> bool:
+    """새 인덱스 배포 전 검증 (문서 수 + 검증용 질의 결과 확인)"""
+    try:
+        vectordb = open_vectorstore(persist_dir, CachedEmbeddings())
+        counts = vectordb.count_by_shard()
+        count = sum(counts.values())
+        results = vectordb.similarity_search(SMOKE_QUERY, k=1) if count else []
+    except Exception as e:
+        print(f"❌ Index validation error: {e}")
+        return False
+
+    print(f"\n🩺 Smoke query: {count} chunks in {sum(1 for c in counts.values() if c)} shards, "
+          f"{len(results)} result(s) for '{SMOKE_QUERY}'")
+    return count > 0 and len(results) > 0
+
+def publish_index(persist_dir: str):
+    """검증 후 새 인덱스 배포 + 오래된 버전 정리 (실패 시 새 버전 폐기, 서비스 중인 인덱스 유지)"""
+    if not validate_index(persist_dir):
+        discard(persist_dir)
+        raise RuntimeError(f"Index validation failed, keeping current index: {get_live_dir()}")
+
+    publish(persist_dir)
+    removed = cleanup_old_versions()
+    print(f"🚀 Published index version: {persist_dir}")
+    if removed:
+        print(f"  - Removed {removed} old version(s)")
+
+def dedupe_existing_vectorstore():
+    """기존 벡터스토어의 중복 청크 정리 (1회성, 복사본에서 정리 후 배포)"""
+    if get_live_dir() is None:
+        print(f"⚠️ Vector store not found")
+        return
+
+    persist_dir = create_staging_dir(copy_from_live=True)
+    print(f"\n🧹 Deduplicating vector store at {persist_dir}...")
+    try:
+        vectordb = open_vectorstore(persist_dir)
+        vectordb.migrate_legacy()
+        stats = dedupe_vectorstore(vectordb)
+        print(f"  - Total chunks: {stats['total']}")
+        print(f"  - Kept: {stats['kept']} (re-keyed: {stats['rekeyed']})")
+        print(f"  - Deleted duplicates: {stats['deleted']}")
+        publish_index(persist_dir)
+    except Exception:
+        discard(persist_dir)
+        raise
+    print(f"✅ Deduplication completed")
 
 def main(
     include_pdf: bool = False,
     include_crawlers: bool = True,
     include_static: bool = True,
-    update_mode: bool = True
+    update_mode: bool = True,
+    batch_tokens: int = MAX_BATCH_TOKENS,
+    embed_workers: int = MAX_CONCURRENCY,
+    revalidate: bool = True,
+    revalidate_limit: int = REVALIDATE_LIMIT,
+    retention: bool = True,
+    crawl_workers: int = CRAWL_WORKERS,
+    reparse: bool = False,
+    resume: bool = False,
+    pdf_workers: int = PDF_WORKERS,
+    rebuild_shards: Optional[List[str]] = None
 ):
     """
     메인 실행 함수
+    출처 단위(PDF 1개, 게시판 1개 등)로 수집이 끝나는 대로 분할/임베딩하여 새 인덱스 버전에 upsert
+    (수집은 백그라운드에서 계속되고, 임베딩이 밀리면 SOURCE_QUEUE_SIZE개에서 기다림)
     Args:
         include_pdf: PDF 문서 포함 여부
         include_crawlers: 크롤러 실행 여부
         include_static: 정적 데이터 포함 여부
         update_mode: True면 기존 DB에 추가, False면 새로 생성
+        batch_tokens: 임베딩 배치당 최대 토큰 수
+        embed_workers: 동시에 임베딩할 배치 수
+        revalidate: 최근 공지 수정 여부 재검증 여부
+        revalidate_limit: 게시판별 재검증할 최근 공지 수
+        retention: 보존 정책(만료 청크 삭제 + 압축) 적용 여부
+        crawl_workers: 동시에 크롤링할 호스트 수
+        reparse: 크롤링 대신 HTML 캐시에서 모든 공지 본문을 다시 파싱 (네트워크 없음)
+        resume: 이전 실행의 체크포인트에서 이어서 실행 (옵션도 이전 실행 그대로 사용)
+        pdf_workers: PDF 페이지를 추출할 프로세스 수
+        rebuild_shards: 새 버전에서 비우고 출처에서 다시 인덱싱할 샤드 (vector_shards.py, update 모드만)
     """
     print(f"\n{'='*60}")
     print("🚀 Starting SKKU RAG Ingest Pipeline")
     print(f"{'='*60}")
     
-    all_docs = []
+    # 크롤링 상태 저장소 (이전 JSON 파일은 ingest에서만 가져옴, rag_api는 읽기 전용)
+    get_crawl_state(migrate=True)
+    
+    # 0. 체크포인트 (출처 단위로 결과를 기록하여 중간에 죽어도 --resume으로 이어서 실행)
+    options = {
+        "include_pdf": include_pdf,
+        "include_crawlers": include_crawlers,
+        "include_static": include_static,
+        "update_mode": update_mode,
+        "revalidate": revalidate,
+        "revalidate_limit": revalidate_limit,
+        "retention": retention,
+        "reparse": reparse,
+        "rebuild_shards": sorted(set(rebuild_shards or [])) if update_mode else [],
+    }
+    if rebuild_shards and not update_mode:
+        print("\n⚠️ --rebuild-shard is ignored with --create (every shard is rebuilt)")
+    checkpoint = IngestCheckpoint.load() if resume else None
+    if checkpoint is not None:
+        options = checkpoint.options
+        print(f"\n⏯️ Resuming run started at {checkpoint.manifest['started_at']} (stage: {checkpoint.stage})")
+    else:
+        if resume:
+            print("\n⚠️ No checkpoint to resume from, starting a new run")
+        checkpoint = IngestCheckpoint.start(options)
+    mode = "update" if options["update_mode"] else "create"
+    rebuild = rebuild_targets(options.get("rebuild_shards", []))
     
-    # 1. 기존 크롤링 데이터 로드
+    # 1. 기존 크롤링 데이터 로드 (크롤링 상태 저장소는 배포가 끝난 뒤에만 바뀌므로 재개 시에도 그대로)
     crawled_data = load_crawled_data()
-    if not update_mode:
+    notice_state = load_notice_state()
+    pdf_manifest = load_pdf_manifest() if options["include_pdf"] or rebuild["pdf"] else {}
+    if not options["update_mode"]:
         print("\n🧹 create 모드이므로 기존 crawled_data 기록을 무시하고 전체 재크롤링합니다.")
         crawled_data = {}
+        notice_state = {}
+        pdf_manifest = {}
+    saved_crawled_data = crawled_data
     total_existing = sum(len(nums) for nums in crawled_data.values())
+    watermarks = get_crawl_state().watermarks()
     print(f"\n📋 Loaded existing crawled data:")
     for board, nums in crawled_data.items():
-        print(f"  - {board}: {len(nums)} posts")
+        last_post_num = watermarks.get(board, {}).get("last_post_num")
+        print(f"  - {board}: {len(nums)} posts (latest: {last_post_num})")
     print(f"  Total: {total_existing} posts")
     
-    # 2. PDF 로드
-    if include_pdf:
-        docs_pdf = load_pdf_documents()
-        all_docs.extend(docs_pdf)
-    
-    # 3. 정적 데이터 로드
-    if include_static and STATIC_DATA_AVAILABLE:
-        print(f"\n{'='*60}")
-        print("📚 Loading Static Documents...")
-        print(f"{'='*60}")
-        static_docs = get_static_documents()
-        all_docs.extend(static_docs)
-        print(f"✅ Loaded {len(static_docs)} static documents")
-    
-    # 4. 크롤러 실행
-    if include_crawlers:
-        docs_crawler, updated_data = load_crawler_documents(crawled_data)
-        all_docs.extend(docs_crawler)
+    totals = dict.fromkeys(("documents", "chunks", "new", "unchanged", "replaced", "duplicates"), 0)
+    if checkpoint.stage == "published":
+        # 배포는 끝났고 크롤링 기록/공지 상태 저장 전에 멈춘 경우
+        updated_data, notice_state = checkpoint.load_state()
+        processed_pdfs = checkpoint.load_pdf_files()
+        persist_dir = get_live_dir()
+    else:
+        # 2. 새 버전 디렉토리 준비 (서비스 중인 인덱스는 배포 전까지 건드리지 않음)
+        #    재개 시 이전 실행의 디렉토리를 그대로 사용 -> 인덱싱이 끝난 출처 단위는 다시 처리하지 않음
+        persist_dir = checkpoint.staging_dir
+        resumed_index = persist_dir is not None
+        if resumed_index:
+            print(f"\n⏯️ Resuming index version at {persist_dir} "
+                  f"({len(checkpoint.manifest['indexed'])} sources, "
+                  f"{checkpoint.manifest.get('embedded_chunks', 0)} chunks embedded before)")
+            restored = checkpoint.load_state()
+            if restored is not None:
+                crawled_data, notice_state = restored
+        else:
+            persist_dir = create_staging_dir(copy_from_live=options["update_mode"])
+            checkpoint.start_indexing(persist_dir)
+            print(f"\n📦 Building index version at {persist_dir}")
+        updated_data = dict(crawled_data)
+        processed_pdfs = {}
+        # 게시판 간 중복 공지 감지용 대표 공지 인덱스 (이전 실행에서 인덱싱한 공지 포함)
+        dup_index = NearDuplicateIndex.from_notice_state(notice_state)
         
-        # 데이터가 업데이트되었으면 저장
-        if updated_data != crawled_data:
-            save_crawled_data(updated_data)
-    
-    # 5. 문서가 없으면 종료
-    if not all_docs:
-        print(f"\n⚠️ No new documents to process. Exiting.")
-        return
-    
-    print(f"\n📚 Total new documents loaded: {len(all_docs)}")
+        start_time = time.perf_counter()
+        first_indexed = None
+        changed = resumed_index or mode == "create" or bool(options.get("rebuild_shards"))
+        # 3. 출처 수집은 백그라운드 스레드에서 진행 (재검증은 인덱싱 중 바뀌지 않는 공지 상태 복사본 사용)
+        sources = prefetch(iter_sources(
+            checkpoint,
+            crawled_data,
+            dict(notice_state),
+            include_pdf=options["include_pdf"] or rebuild["pdf"],
+            include_crawlers=options["include_crawlers"],
+            include_static=options["include_static"] or rebuild["static"],
+            revalidate=options["revalidate"],
+            revalidate_limit=options["revalidate_limit"],
+            reparse=options["reparse"],
+            crawl_workers=crawl_workers,
+            # PDF 샤드를 다시 만들면 처리한 PDF도 다시 추출
+            pdf_manifest={} if rebuild["pdf"] else pdf_manifest,
+            pdf_workers=pdf_workers,
+            rebuild_boards=rebuild["boards"]
+        ), maxsize=SOURCE_QUEUE_SIZE)
+        try:
+            # 4. 벡터스토어 준비 (재개한 디렉토리는 비우지 않고 이어서 upsert)
+            vectordb, embeddings, migrated = prepare_vectorstore(
+                persist_dir,
+                mode="update" if resumed_index else mode,
+                rebuild_shards=() if resumed_index else options.get("rebuild_shards", [])
+            )
+            parent_store = ParentStore(persist_dir)
+            
+            # 5. 출처 단위가 도착하는 대로 날짜 정규화 → 분할 → 임베딩/upsert → 이전 청크 교체
+            for unit in sources:
+                if unit.docs:
+                    print(f"\n📥 Indexing {unit.name}: {len(unit.docs)} documents")
+                    unit_totals = index_source_unit(
+                        vectordb, unit, notice_state, checkpoint, dup_index, parent_store,
+                        batch_tokens=batch_tokens, embed_workers=embed_workers
+                    )
+                    for key, value in unit_totals.items():
+                        totals[key] += value
+                    if first_indexed is None and unit_totals["chunks"]:
+                        first_indexed = time.perf_counter() - start_time
+                        print(f"⏱️ First chunks searchable in staging index after {first_indexed:.1f}s")
+                
+                # 기존 번호 + 새 번호 합치기
+                board_name = unit.extra.get("board_name")
+                if unit.extra.get("new_post_nums"):
+                    updated_data[board_name] = updated_data.get(board_name, set()) | set(unit.extra["new_post_nums"])
+                # 마지막 페이지까지 인덱싱한 PDF
+                processed_pdfs.update(unit.extra.get("pdf_files", {}))
+                checkpoint.mark_indexed(unit.name, updated_data, notice_state, processed_pdfs)
+            
+            changed = changed or migrated > 0 or totals["new"] > 0 or totals["replaced"] > 0 or totals["duplicates"] > 0
+            if totals["documents"]:
+                print(f"\n📚 Indexed {totals['documents']} new documents in {time.perf_counter() - start_time:.1f}s")
+                print(f"  - New chunks embedded: {totals['new']}")
+                print(f"  - Unchanged chunks skipped: {totals['unchanged']}")
+                print(f"  - Cross-posted notices merged (not embedded): {totals['duplicates']}")
+                print(f"  - Embedding cache hits: {embeddings.stats['hits']} (misses: {embeddings.stats['misses']})")
+                print(f"  - Tokens saved by cache: {embeddings.stats['tokens_saved']} "
+                      f"(embedded: {embeddings.stats['tokens_embedded']})")
+            else:
+                print(f"\n⚠️ No new documents to process.")
+            if rebuild["boards"]:
+                restored = restore_missing_notice_chunks(vectordb, notice_state, rebuild["boards"], get_live_dir())
+                if restored:
+                    print(f"♻️ Copied {restored} chunks of notices that could not be re-fetched from the live index")
+            # 날짜 정규화 도입 전에 저장된 청크에 date_ts / semester 채우기 (없는 청크만, 재임베딩 없음)
+            backfilled = backfill_date_metadata(vectordb)
+            if backfilled:
+                print(f"📅 Added date_ts/semester metadata to {backfilled} existing chunks")
+                changed = True
+            # 게시판 플래그 도입 전에 저장된 공지 청크에 board:<게시판> 채우기 (바뀐 공지만, 재임베딩 없음)
+            flagged = refresh_source_boards(vectordb, notice_state, list(notice_state))
+            if flagged:
+                print(f"🏷️ Added board flags to {flagged} existing notice chunks")
+                changed = True
+            vectordb.persist()
+            
+            # 6. 보존 정책 적용 (만료 청크 삭제 + 압축)
+            if options["retention"]:
+                result = run_retention(notice_state, persist_dir, vectordb, dup_index)
+                changed = changed or bool(result["deleted"])
+                vectordb = result["vectordb"]
+            
+            # 만료된 대표 공지 대신 대표 공지가 된 공지 다시 인덱싱 (이전 실행에서 가져오지 못한 공지 포함)
+            promoted = reindex_pending_notices(
+                vectordb, notice_state, checkpoint, dup_index, parent_store,
+                batch_tokens=batch_tokens, embed_workers=embed_workers
+            )
+            if promoted["documents"]:
+                print(f"🔝 Re-indexed {promoted['documents']} notices promoted to canonical copy ({promoted['new']} new chunks)")
+                changed = True
+            
+            # 교체/만료된 청크만 가리키던 부모 섹션 삭제
+            pruned = parent_store.prune(referenced_parent_ids(vectordb))
+            parent_store.close()
+            if pruned:
+                print(f"🧹 Removed {pruned} unreferenced parent sections")
+            print_shard_stats(vectordb)
+            
+            # 7. 검증 후 배포 (포인터 파일 교체 -> rag_api가 새 인덱스로 전환)
+            if changed:
+                publish_index(persist_dir)
+            else:
+                discard(persist_dir)
+                persist_dir = get_live_dir()
+                print(f"\n✅ Index unchanged, keeping current version: {persist_dir}")
+        except Exception:
+            # 스테이징 디렉토리는 남겨 두고 --resume에서 이어서 사용 (검증 실패 시에는 publish_index가 폐기)
+            print(f"\n💾 Checkpoint kept at stage '{checkpoint.stage}', run with --resume to continue")
+            raise
+        finally:
+            sources.close()
+        checkpoint.mark_published(updated_data, notice_state, processed_pdfs)
     
-    # 6. 청크 분할
-    chunks = split_documents(all_docs)
+    # 8. 배포가 끝난 뒤에 크롤링 기록/공지 상태/처리한 PDF 저장
+    if updated_data != saved_crawled_data:
+        save_crawled_data(updated_data)
+    save_notice_state(notice_state)
+    if processed_pdfs or not options["update_mode"]:
+        save_pdf_manifest({**pdf_manifest, **processed_pdfs})
+        print(f"💾 Recorded {len(processed_pdfs)} processed PDF(s) in manifest")
     
-    # 7. 벡터스토어 생성/업데이트
-    mode = "update" if update_mode else "create"
-    build_vectorstore(chunks, mode=mode)
+    # 9. 전체 게시판 통합하여 최신 공지 업데이트 (공지 카탈로그 기준)
+    update_latest_notices()
+    checkpoint.clear()
     
     print(f"\n{'='*60}")
     print("✨ Ingest pipeline completed successfully!")
     print(f"{'='*60}")
     print(f"📊 Summary:")
-    print(f"  - New documents: {len(all_docs)}")
-    print(f"  - Chunks: {len(chunks)}")
-    print(f"  - Vector DB: {PERSIST_DIR}")
+    print(f"  - New documents: {totals['documents']}")
+    print(f"  - Chunks: {totals['chunks']}")
+    print(f"  - Stale chunks replaced: {totals['replaced']}")
+    print(f"  - Cross-posted notices merged: {totals['duplicates']}")
+    print(f"  - Vector DB: {persist_dir}")
     print(f"  - Mode: {mode}")
     print(f"\n💡 You can now run chatbot.py to test the RAG system!")
 
@@ -444,12 +1207,38 @@ if __name__ == "__main__":
     parser.add_argument("--no-crawl", action="store_true", help="Skip crawling")
     parser.add_argument("--no-static", action="store_true", help="Skip static documents")
     parser.add_argument("--create", action="store_true", help="Create new DB (default: update)")
+    parser.add_argument("--dedupe", action="store_true", help="Remove duplicate chunks from existing DB and exit")
+    parser.add_argument("--batch-tokens", type=int, default=MAX_BATCH_TOKENS, help="Max tokens per embedding batch")
+    parser.add_argument("--embed-workers", type=int, default=MAX_CONCURRENCY, help="Concurrent embedding batches")
+    parser.add_argument("--no-revalidate", action="store_true", help="Skip re-checking recent notices for edits")
+    parser.add_argument("--revalidate-limit", type=int, default=REVALIDATE_LIMIT, help="Recent notices to re-check per board")
+    parser.add_argument("--no-retention", action="store_true", help="Skip deleting expired chunks and compaction")
+    parser.add_argument("--crawl-workers", type=int, default=CRAWL_WORKERS, help="Hosts to crawl concurrently")
+    parser.add_argument("--reparse", action="store_true", help="Re-parse all notices from the HTML cache (no crawling)")
+    parser.add_argument("--resume", action="store_true", help="Continue the last interrupted run from its checkpoint")
+    parser.add_argument("--pdf-workers", type=int, default=PDF_WORKERS, help="Processes for PDF page extraction")
+    parser.add_argument("--rebuild-shard", action="append", choices=ALL_SHARDS, metavar="SHARD",
+                        help=f"Drop and re-index one shard (repeatable): {', '.join(ALL_SHARDS)}")
     
     args = parser.parse_args()
     
+    if args.dedupe:
+        dedupe_existing_vectorstore()
+        raise SystemExit(0)
+    
     main(
         include_pdf=args.pdf,
         include_crawlers=not args.no_crawl,
         include_static=not args.no_static,
-        update_mode=not args.create
+        update_mode=not args.create,
+        batch_tokens=args.batch_tokens,
+        embed_workers=args.embed_workers,
+        revalidate=not args.no_revalidate,
+        revalidate_limit=args.revalidate_limit,
+        retention=not args.no_retention,
+        crawl_workers=args.crawl_workers,
+        reparse=args.reparse,
+        resume=args.resume,
+        pdf_workers=args.pdf_workers,
+        rebuild_shards=args.rebuild_shard
     )
\ No newline at end of file
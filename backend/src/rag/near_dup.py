@@ -0,0 +1,130 @@
+"""
+게시판 간 중복 공지 감지 모듈
+소프트웨어학과 / 소프트웨어융합대학 / 학교 대표공지처럼 같은 공지가 여러 게시판에 올라오는 경우
+MinHash + LSH로 거의 같은 공지를 찾아 대표 공지 하나만 임베딩 (대표 공지 선택은 ingest.canonical_priority)
+- 공지 제목 + 본문을 정규화한 뒤 문자 n-gram(shingle) 집합의 MinHash 서명 계산
+- 서명을 band로 나누어 같은 band 값을 가진 공지만 후보로 보고, 추정 Jaccard 유사도로 확인
+- 서명은 공지 상태(minhash)에 기록하여 이전 실행에서 인덱싱한 공지와도 비교
+"""
+
+import re
+import zlib
+import base64
+import unicodedata
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+NUM_PERM = 128  # MinHash 서명 길이
+LSH_BANDS = 32  # band 수 (band당 NUM_PERM / LSH_BANDS개 값)
+SHINGLE_SIZE = 5  # 문자 n-gram 길이 (공백 제거 후)
+DUP_THRESHOLD = 0.8  # 이 이상 추정 유사도면 중복 공지
+MIN_DEDUP_CHARS = 100  # 이보다 짧은 공지("첨부파일 참조" 등)는 중복으로 합치지 않음
+
+_MERSENNE_PRIME = (1 << 31) - 1
+_rng = np.random.RandomState(20240901)  # 실행마다 같은 서명이 나오도록 고정
+_PERM_A = _rng.randint(1, _MERSENNE_PRIME, size=NUM_PERM).astype(np.uint64)
+_PERM_B = _rng.randint(0, _MERSENNE_PRIME, size=NUM_PERM).astype(np.uint64)
+_ROWS = NUM_PERM // LSH_BANDS
+
+_SPACE_PATTERN = re.compile(r"\s+")
+
+
+def normalize_text(text: str) -> str:
+    """비교용 정규화 (NFKC, 소문자, 공백 제거 - 게시판마다 다른 줄바꿈/띄어쓰기 무시)"""
+    return _SPACE_PATTERN.sub("", unicodedata.normalize("NFKC", text or "").lower())
+
+
+def minhash_signature(text: str) -> Optional[np.ndarray]:
+    """
+    MinHash 서명 (정규화 후 MIN_DEDUP_CHARS보다 짧으면 None)
+    """
+    text = normalize_text(text)
+    if len(text) < MIN_DEDUP_CHARS:
+        return None
+    shingles = {text[i:i + SHINGLE_SIZE] for i in range(len(text) - SHINGLE_SIZE + 1)}
+    hashes = np.fromiter(
+        (zlib.crc32(s.encode("utf-8")) % _MERSENNE_PRIME for s in shingles),
+        dtype=np.uint64, count=len(shingles),
+    )
+    # (a * h + b) mod p 를 permutation마다 계산하여 최솟값
+    values = (np.outer(_PERM_A, hashes) + _PERM_B[:, None]) % _MERSENNE_PRIME
+    return values.min(axis=1).astype(np.uint32)
+
+
+def encode_signature(signature: np.ndarray) -> str:
+    """서명 -> 공지 상태에 저장할 문자열"""
+    return base64.b64encode(signature.astype("<u4").tobytes()).decode("ascii")
+
+
+def decode_signature(value: str) -> np.ndarray:
+    return np.frombuffer(base64.b64decode(value), dtype="<u4").astype(np.uint32)
+
+
+def similarity(a: np.ndarray, b: np.ndarray) -> float:
+    """추정 Jaccard 유사도 (같은 위치 값이 같은 비율)"""
+    return float(np.mean(a == b))
+
+
+def _band_keys(signature: np.ndarray) -> List[Tuple[int, bytes]]:
+    return [(band, signature[band * _ROWS:(band + 1) * _ROWS].tobytes()) for band in range(LSH_BANDS)]
+
+
+class NearDuplicateIndex:
+    """대표 공지의 MinHash 서명 LSH 인덱스"""
+
+    def __init__(self, threshold: float = DUP_THRESHOLD):
+        self.threshold = threshold
+        self.signatures: Dict[str, np.ndarray] = {}
+        self.boards: Dict[str, str] = {}
+        self.buckets: Dict[Tuple[int, bytes], List[str]] = {}
+
+    @classmethod
+    def from_notice_state(cls, notice_state: Dict[str, dict], threshold: float = DUP_THRESHOLD) -> "NearDuplicateIndex":
+        """공지 상태에서 서명이 있는 대표 공지(다른 공지의 중복이 아닌 공지)로 인덱스 생성"""
+        index = cls(threshold)
+        for source_key, record in notice_state.items():
+            if record.get("minhash") and not record.get("metadata", {}).get("duplicate_of"):
+                index.add(source_key, record.get("board_name", ""), decode_signature(record["minhash"]))
+        return index
+
+    def __len__(self) -> int:
+        return len(self.signatures)
+
+    def add(self, source_key: str, board_name: str, signature: np.ndarray):
+        """대표 공지 추가 (같은 공지를 다시 추가하면 이전 서명 교체)"""
+        self.remove(source_key)
+        self.signatures[source_key] = signature
+        self.boards[source_key] = board_name
+        for key in _band_keys(signature):
+            self.buckets.setdefault(key, []).append(source_key)
+
+    def remove(self, source_key: str):
+        signature = self.signatures.pop(source_key, None)
+        if signature is None:
+            return
+        self.boards.pop(source_key, None)
+        for key in _band_keys(signature):
+            bucket = self.buckets.get(key)
+            if bucket and source_key in bucket:
+                bucket.remove(source_key)
+                if not bucket:
+                    del self.buckets[key]
+
+    def find(self, source_key: str, board_name: str, signature: np.ndarray) -> Optional[Tuple[str, float]]:
+        """
+        다른 게시판의 대표 공지 중 가장 비슷한 공지 (같은 게시판의 재공지는 합치지 않음)
+        Returns:
+            tuple: (대표 공지 source_key, 추정 유사도) 또는 None
+        """
+        candidates = set()
+        for key in _band_keys(signature):
+            candidates.update(self.buckets.get(key, ()))
+        best = None
+        for candidate in sorted(candidates):
+            if candidate == source_key or self.boards.get(candidate) == board_name:
+                continue
+            score = similarity(signature, self.signatures[candidate])
+            if score >= self.threshold and (best is None or score > best[1]):
+                best = (candidate, score)
+        return best
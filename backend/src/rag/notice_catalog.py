@@ -0,0 +1,204 @@
+"""
+공지 목록 카탈로그 모듈
+ingest가 크롤링 상태 저장소(crawl_state.sqlite3)의 notices 테이블에 기록한 공지를
+게시일 최신순 목록으로 제공
+- rag_api의 /notices: 메모리 스냅샷에서 게시판/제목/기간 필터 + cursor 페이지네이션
+  (공지가 바뀌면 저장소의 notices_version이 올라가고, 다음 요청에서 스냅샷을 다시 읽음)
+- latest_notices.json: 매 실행 후 전체 카탈로그 기준 최신 N개로 다시 생성
+- 여러 게시판에 올라와 하나로 합친 공지(ingest.collapse_duplicates)는 게시판을 지정하지 않은 목록에서
+  대표 공지 한 줄(source_boards)로만 보이고, 게시판을 지정하면 그 게시판의 공지로 보임
+"""
+
+import os
+import json
+import base64
+import heapq
+import threading
+from bisect import bisect_right
+from typing import Dict, List, Optional
+
+from crawl_state import CrawlStateStore, get_crawl_state, get_crawl_state_reader
+from date_utils import to_timestamp
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+LATEST_NOTICES_FILE = os.path.join(BASE_DIR, "latest_notices.json")  # 최신 공지사항 (Node 메인 페이지용)
+LATEST_NOTICES_COUNT = 6
+DEFAULT_PAGE_SIZE = 20
+MAX_PAGE_SIZE = 100
+
+# 목록에 포함할 메타데이터 (본문 제외)
+NOTICE_FIELDS = ("title", "date", "post_num", "link", "category", "department", "author")
+
+DAY_SECONDS = 24 * 60 * 60
+
+
+def notice_summary(source_key: str, board_name: str, date_ts: Optional[int], metadata: dict) -> dict:
+    """목록용 공지 요약"""
+    summary = {"id": source_key, "board_name": board_name, "date_ts": date_ts}
+    for field in NOTICE_FIELDS:
+        value = metadata.get(field)
+        if field == "post_num" and not value:
+            value = metadata.get("post_id")
+        if value or field in ("title", "date", "post_num", "link"):
+            summary[field] = value or ""
+    if metadata.get("source_boards"):
+        summary["source_boards"] = metadata["source_boards"].split(",")
+    if metadata.get("duplicate_of"):
+        summary["duplicate_of"] = metadata["duplicate_of"]
+    return summary
+
+
+def _sort_key(item: dict) -> tuple:
+    """게시일 최신순 (날짜 없는 공지는 마지막), 같은 날짜는 id 순서 (crawl_state.list_notices와 같은 순서)"""
+    return (-(item["date_ts"] or 0), item["id"])
+
+
+def encode_cursor(item: dict) -> str:
+    raw = json.dumps([item["date_ts"], item["id"]], ensure_ascii=False)
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple:
+    """cursor -> 정렬 키 (잘못된 cursor는 ValueError)"""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode("utf-8")
+        date_ts, source_key = json.loads(raw)
+        return _sort_key({"date_ts": date_ts, "id": str(source_key)})
+    except Exception as e:
+        raise ValueError(f"Invalid cursor: {cursor}") from e
+
+
+class NoticeSnapshot:
+    """한 시점의 공지 목록 (정렬 키 + 게시판별 목록을 미리 만들어 둠)"""
+
+    def __init__(self, version: int, items: List[dict]):
+        self.version = version
+        items = sorted(items, key=_sort_key)
+        # 게시판을 지정하지 않은 목록은 다른 게시판 공지에 합쳐진 공지(duplicate_of) 제외
+        self.items = [item for item in items if not item.get("duplicate_of")]
+        self.keys = [_sort_key(item) for item in self.items]
+        self.boards: Dict[str, tuple] = {}
+        for item in items:
+            board_items, board_keys = self.boards.setdefault(item["board_name"], ([], []))
+            board_items.append(item)
+            board_keys.append(_sort_key(item))
+
+    @staticmethod
+    def _iter_after(items: List[dict], keys: List[tuple], start_key: Optional[tuple]):
+        """정렬 키가 start_key보다 뒤인 공지부터 (이진 탐색)"""
+        start = bisect_right(keys, start_key) if start_key is not None else 0
+        return (items[i] for i in range(start, len(items)))
+
+    def page(
+        self,
+        boards: Optional[List[str]] = None,
+        query: Optional[str] = None,
+        date_from: Optional[str] = None,
+        date_to: Optional[str] = None,
+        limit: int = DEFAULT_PAGE_SIZE,
+        cursor: Optional[str] = None
+    ) -> dict:
+        """
+        필터에 맞는 공지 한 페이지
+        Args:
+            boards: 게시판 이름 (여러 개면 합쳐서 최신순, 없으면 합쳐진 공지는 대표 공지 한 줄로)
+            query: 제목에 포함된 문자열
+            date_from / date_to: 게시일 범위 ("2025-11-01" 등, 양 끝 포함)
+            limit: 페이지 크기 (최대 MAX_PAGE_SIZE)
+            cursor: 이전 페이지의 next_cursor
+        Returns:
+            dict: {"notices": [...], "next_cursor": str 또는 None, "version": int}
+        """
+        limit = max(1, min(limit, MAX_PAGE_SIZE))
+        start_key = decode_cursor(cursor) if cursor else None
+
+        # 기간 필터: 정렬 키가 게시일 최신순이므로 date_to 이전부터 시작해 date_from보다 오래되면 중단
+        from_ts = to_timestamp(date_from) if date_from else None
+        to_ts = to_timestamp(date_to) if date_to else None
+        if (date_from and from_ts is None) or (date_to and to_ts is None):
+            raise ValueError("Dates must look like YYYY-MM-DD")
+        if to_ts is not None:
+            to_key = (-(to_ts + DAY_SECONDS - 1), "")
+            start_key = max(start_key, to_key) if start_key is not None else to_key
+
+        if boards:
+            sources = [
+                self._iter_after(*self.boards[board], start_key) for board in dict.fromkeys(boards) if board in self.boards
+            ]
+            candidates = heapq.merge(*sources, key=_sort_key)
+        else:
+            candidates = self._iter_after(self.items, self.keys, start_key)
+
+        query = query.lower() if query else None
+        notices = []
+        has_more = False
+        for item in candidates:
+            if from_ts is not None and (item["date_ts"] is None or item["date_ts"] < from_ts):
+                break
+            if query and query not in item["title"].lower():
+                continue
+            if len(notices) == limit:
+                has_more = True
+                break
+            notices.append(item)
+
+        return {
+            "notices": notices,
+            "next_cursor": encode_cursor(notices[-1]) if has_more else None,
+            "version": self.version,
+        }
+
+
+class NoticeCatalog:
+    """크롤링 상태 저장소의 공지 목록 스냅샷 (공지가 바뀌었을 때만 다시 읽음)"""
+
+    def __init__(self, store: Optional[CrawlStateStore] = None):
+        self.store = store or get_crawl_state_reader()
+        self._snapshot: Optional[NoticeSnapshot] = None
+        self._lock = threading.Lock()
+
+    def snapshot(self) -> NoticeSnapshot:
+        version = self.store.notices_version()
+        snapshot = self._snapshot
+        if snapshot is not None and snapshot.version == version:
+            return snapshot
+        with self._lock:
+            if self._snapshot is None or self._snapshot.version != version:
+                items = [notice_summary(*row) for row in self.store.list_notices()]
+                self._snapshot = NoticeSnapshot(version, items)
+                print(f"📋 Loaded notice catalog: {len(items)} notices (version {version})")
+            return self._snapshot
+
+
+_catalog: Optional[NoticeCatalog] = None
+_catalog_lock = threading.Lock()
+
+
+def get_notice_catalog() -> NoticeCatalog:
+    """프로세스 전체에서 공유하는 공지 목록 카탈로그"""
+    global _catalog
+    with _catalog_lock:
+        if _catalog is None:
+            _catalog = NoticeCatalog()
+        return _catalog
+
+
+def write_latest_notices(top_n: int = LATEST_NOTICES_COUNT, path: str = None) -> List[dict]:
+    """
+    전체 카탈로그 기준 최신 공지 top_n개를 latest_notices.json에 저장
+    (여러 게시판에 올라온 공지는 대표 공지 한 줄 + source_boards, 게시판을 지정하지 않은 /notices와 같은 목록)
+    (임시 파일에 쓴 뒤 교체하므로 Node 서버가 읽는 도중에 반쯤 쓴 파일을 보지 않음)
+    """
+    path = path or LATEST_NOTICES_FILE
+    snapshot = NoticeSnapshot(0, [notice_summary(*row) for row in get_crawl_state().list_notices()])
+    top_notices = []
+    for summary in snapshot.page(limit=top_n)["notices"]:
+        notice = {key: summary[key] for key in ("board_name", "title", "date", "post_num", "link")}
+        notice["source_boards"] = summary.get("source_boards", [summary["board_name"]])
+        top_notices.append(notice)
+
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(top_notices, f, ensure_ascii=False, indent=2)
+    os.replace(tmp_path, path)
+    return top_notices
@@ -0,0 +1,117 @@
+"""
+공지사항 상태 관리 모듈
+공지별 본문 해시, 최종 수정일, 청크 ID를 크롤링 상태 저장소(crawl_state.py)에 기록하여
+수정된 공지를 감지하고 해당 공지의 청크만 교체할 수 있도록 함
+"""
+
+import hashlib
+from datetime import datetime
+from typing import List, Dict
+
+from langchain_core.documents import Document
+
+from vector_store import get_source_key
+from crawl_state import get_crawl_state
+from date_utils import to_timestamp
+
+
+def notice_hash(title: str, body: str) -> str:
+    """공지 제목 + 본문 sha256"""
+    return hashlib.sha256(f"{title or ''}\n{body or ''}".encode("utf-8")).hexdigest()
+
+
+def is_notice_document(doc: Document) -> bool:
+    """크롤러에서 온 공지사항 Document 여부"""
+    return str(doc.metadata.get("source_type", "")).endswith("_notice")
+
+
+def load_notice_state() -> Dict[str, dict]:
+    """
+    공지 상태 로드
+    Returns:
+        dict: {source_key: {"board_name", "content_hash", "modified", "chunk_ids", "metadata", "minhash", ...}}
+    """
+    try:
+        return get_crawl_state().load_notices()
+    except Exception as e:
+        print(f"⚠️ Error loading notice state: {e}")
+    return {}
+
+
+def save_notice_state(state: Dict[str, dict]):
+    """공지 상태 저장 (바뀐 공지만 트랜잭션 하나로 기록하여 중간에 죽어도 이전 상태 유지)"""
+    try:
+        result = get_crawl_state().save_notices(state)
+        print(f"💾 Saved notice state: {len(state)} notices "
+              f"({result['updated']} updated, {result['deleted']} deleted)")
+    except Exception as e:
+        print(f"❌ Error saving notice state: {e}")
+
+
+def record_notice_documents(
+    state: Dict[str, dict],
+    docs: List[Document],
+    chunk_ids_by_key: Dict[str, List[str]],
+    signatures: Dict[str, str] = None
+):
+    """
+    새로 수집하거나 변경된 공지 Document를 상태에 기록
+    Args:
+        state: load_notice_state() 결과 (직접 갱신)
+        docs: 공지 Document 리스트 (본문 전체)
+        chunk_ids_by_key: {source_key: [청크 ID, ...]} (다른 게시판 공지의 중복이면 빈 리스트)
+        signatures: {source_key: MinHash 서명} (near_dup.py, 짧은 공지는 없음)
+    """
+    now = datetime.now().isoformat(timespec="seconds")
+    for doc in docs:
+        if not is_notice_document(doc):
+            continue
+        source_key = get_source_key(doc.metadata)
+        state[source_key] = {
+            "board_name": doc.metadata.get("board_name", ""),
+            "content_hash": notice_hash(doc.metadata.get("title"), doc.page_content),
+            "modified": doc.metadata.get("modified") or doc.metadata.get("date"),
+            "chunk_ids": chunk_ids_by_key.get(source_key, []),
+            "metadata": doc.metadata,
+            "fetched_at": now,
+            "checked_at": now,
+            "minhash": (signatures or {}).get(source_key),
+        }
+
+
+def duplicate_boards(state: Dict[str, dict]) -> Dict[str, List[str]]:
+    """
+    대표 공지별로 중복으로 합쳐진 공지의 게시판
+    Returns:
+        dict: {대표 공지 source_key: [게시판, ...]}
+    """
+    boards: Dict[str, List[str]] = {}
+    for record in state.values():
+        canonical_key = record.get("metadata", {}).get("duplicate_of")
+        if canonical_key:
+            board_list = boards.setdefault(canonical_key, [])
+            if record.get("board_name") not in board_list:
+                board_list.append(record.get("board_name"))
+    return boards
+
+
+def select_recent_notices(state: Dict[str, dict], board_name: str, limit: int) -> List[dict]:
+    """
+    게시판의 최근 공지 limit개 선택 (재검증 대상)
+    Returns:
+        list: [{"source_key": ..., **record}, ...]
+    """
+    def sort_key(item):
+        # 게시판마다 날짜 형식이 달라 문자열이 아니라 epoch 초로 비교 (날짜 없으면 맨 뒤)
+        source_key, record = item
+        metadata = record["metadata"]
+        post_num = str(metadata.get("post_num") or metadata.get("post_id") or "")
+        date_ts = to_timestamp(metadata.get("date"))
+        return (
+            date_ts if date_ts is not None else float("-inf"),
+            int(post_num) if post_num.isdigit() else 0,
+        )
+
+    records = [(k, r) for k, r in state.items() if r.get("board_name") == board_name]
+    records.sort(key=sort_key, reverse=True)
+    return [{"source_key": k, **r} for k, r in records[:limit]]
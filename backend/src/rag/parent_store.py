@@ -0,0 +1,174 @@
+"""
+부모 섹션 저장소 모듈
+구조 기반 분할(chunking.py)의 자식 청크는 벡터스토어에서 검색하고,
+프롬프트에는 자식이 속한 부모 섹션 전체를 넣음 (여러 조각 대신 한 섹션)
+- 부모 본문은 인덱스 버전 디렉토리의 parents.sqlite3에 저장
+  -> 버전 복사(update)/배포/폐기/--resume을 벡터스토어와 함께 따라감
+- parent_id가 없는 청크(부모가 자식 하나뿐인 섹션, 이전 분할 방식으로 만든 청크)는 청크 그대로 사용
+- 검색한 자식 청크는 부모로 묶기 전에 최신 가중치로 다시 정렬 (recency.py)
+"""
+
+import os
+import sqlite3
+import threading
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from langchain_core.documents import Document
+
+from recency import RECENCY_HALF_LIFE_DAYS, RECENCY_WEIGHT, rerank_by_recency
+
+PARENTS_FILE = "parents.sqlite3"
+CHILD_FETCH_K = 12  # 부모로 묶기 전에 검색할 자식 청크 수
+MAX_CONTEXT_DOCS = 4  # 프롬프트에 넣을 최대 문서(부모 섹션) 수
+MAX_CONTEXT_CHARS = 2000  # 프롬프트에 넣을 문서 본문 합계 상한 (넘으면 부모 대신 자식 청크만, 기존 400자 청크 5개 수준)
+ID_BATCH_SIZE = 500
+
+
+class ParentStore:
+    """parent_id -> (source_key, 섹션 본문)"""
+
+    def __init__(self, persist_dir: str):
+        self.path = os.path.join(persist_dir, PARENTS_FILE)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS parents (
+                parent_id TEXT PRIMARY KEY,
+                source_key TEXT NOT NULL,
+                text TEXT NOT NULL
+            )
+            """
+        )
+        self._conn.commit()
+
+    def put_many(self, parents: Dict[str, Tuple[str, str]]) -> int:
+        """부모 섹션 저장 (같은 ID는 내용도 같으므로 이미 있으면 그대로)"""
+        if not parents:
+            return 0
+        with self._lock:
+            before = self._conn.total_changes
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO parents (parent_id, source_key, text) VALUES (?, ?, ?)",
+                [(parent_id, source_key, text) for parent_id, (source_key, text) in parents.items()],
+            )
+            self._conn.commit()
+            return self._conn.total_changes - before
+
+    def get_many(self, parent_ids: Iterable[str]) -> Dict[str, str]:
+        """parent_id -> 섹션 본문 (없는 ID는 빠짐)"""
+        parent_ids = list(dict.fromkeys(parent_ids))
+        found = {}
+        with self._lock:
+            for start in range(0, len(parent_ids), ID_BATCH_SIZE):
+                batch = parent_ids[start:start + ID_BATCH_SIZE]
+                rows = self._conn.execute(
+                    f"SELECT parent_id, text FROM parents WHERE parent_id IN ({','.join('?' * len(batch))})", batch
+                )
+                found.update(rows)
+        return found
+
+    def prune(self, referenced_ids: Iterable[str]) -> int:
+        """청크가 더 이상 가리키지 않는 부모 삭제 (내용이 바뀐 공지, 만료된 공지의 이전 섹션)"""
+        referenced = set(referenced_ids)
+        with self._lock:
+            stale = [
+                (parent_id,) for (parent_id,) in self._conn.execute("SELECT parent_id FROM parents")
+                if parent_id not in referenced
+            ]
+            self._conn.executemany("DELETE FROM parents WHERE parent_id = ?", stale)
+            self._conn.commit()
+        return len(stale)
+
+    def count(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM parents").fetchone()[0]
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+def referenced_parent_ids(vectordb) -> set:
+    """벡터스토어 청크 메타데이터의 parent_id 전체"""
+    metadatas = vectordb.get(include=["metadatas"])["metadatas"]
+    return {m["parent_id"] for m in metadatas if m and m.get("parent_id")}
+
+
+def expand_to_parents(
+    children: List[Document],
+    parent_texts: Dict[str, str],
+    max_docs: int = MAX_CONTEXT_DOCS,
+    max_chars: int = MAX_CONTEXT_CHARS
+) -> List[Document]:
+    """
+    검색된 자식 청크(유사도 순) -> 부모 섹션 Document
+    - 같은 부모의 자식은 가장 먼저 나온 자리에 한 번만
+    - 부모를 넣으면 max_chars를 넘는 경우 자식 청크 본문만 넣음 (첫 문서는 항상 부모)
+    """
+    docs = []
+    seen = set()
+    total = 0
+    for child in children:
+        parent_id = child.metadata.get("parent_id")
+        if parent_id:
+            if parent_id in seen:
+                continue
+            seen.add(parent_id)
+
+        text = parent_texts.get(parent_id) if parent_id else None
+        if text is None or (docs and total + len(text) > max_chars):
+            text = child.page_content
+        docs.append(Document(page_content=text, metadata=child.metadata))
+        total += len(text)
+        if len(docs) >= max_docs:
+            break
+    return docs
+
+
+class ParentSectionRetriever:
+    """
+    자식 청크로 검색하고 부모 섹션을 돌려주는 retriever (invoke만 지원)
+    recency_weight / recency_half_life_days: 공지 최신 가중치 (recency_weight=0이면 유사도 순서 그대로)
+    """
+
+    def __init__(
+        self,
+        vectordb,
+        parent_store: Optional[ParentStore],
+        fetch_k: int = CHILD_FETCH_K,
+        max_docs: int = MAX_CONTEXT_DOCS,
+        max_chars: int = MAX_CONTEXT_CHARS,
+        recency_weight: float = RECENCY_WEIGHT,
+        recency_half_life_days: float = RECENCY_HALF_LIFE_DAYS
+    ):
+        self.vectordb = vectordb
+        self.parent_store = parent_store
+        self.fetch_k = fetch_k
+        self.max_docs = max_docs
+        self.max_chars = max_chars
+        self.recency_weight = recency_weight
+        self.recency_half_life_days = recency_half_life_days
+
+    def invoke(
+        self,
+        query: str,
+        filter: Optional[Dict] = None,
+        embedding: Optional[List[float]] = None,
+        now_ts: Optional[float] = None
+    ) -> List[Document]:
+        """
+        Args:
+            filter: Chroma 메타데이터 조건 (예: {"board_name": {"$in": [...]}}, 게시일 범위, query_router.py)
+            embedding: 이미 만든 질문 임베딩 (있으면 다시 임베딩하지 않음)
+            now_ts: 최신 가중치 기준 시각 (epoch 초, 기본 현재)
+        """
+        if embedding is None:
+            embedding = self.vectordb.embeddings.embed_query(query)
+        scored = self.vectordb.similarity_search_by_vector_with_score(embedding, k=self.fetch_k, filter=filter)
+        children = rerank_by_recency(
+            scored, now_ts=now_ts, half_life_days=self.recency_half_life_days, weight=self.recency_weight
+        )
+        parent_ids = [c.metadata["parent_id"] for c in children if c.metadata.get("parent_id")]
+        parent_texts = self.parent_store.get_many(parent_ids) if self.parent_store and parent_ids else {}
+        return expand_to_parents(children, parent_texts, max_docs=self.max_docs, max_chars=self.max_chars)
@@ -0,0 +1,170 @@
+"""
+PDF 문서 추출 모듈
+pdf_doc/new/에 넣은 PDF를 페이지 단위로 프로세스 풀에서 나누어 텍스트 추출
+- 페이지는 순서대로 돌려주되, 동시에 추출 중인 페이지 수를 제한하여
+  분할/임베딩이 밀리면 추출도 기다림 (파일 전체 페이지를 메모리에 올리지 않음)
+- 처리한 PDF는 내용 해시(sha256)로 manifest.json에 기록하여,
+  같은 내용의 PDF를 다른 이름으로 다시 올려도 다시 임베딩하지 않음 (processed/ 폴더 이동 대신)
+"""
+
+import os
+import json
+import hashlib
+import multiprocessing
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from pypdf import PdfReader
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+PDF_DIR = os.path.join(BASE_DIR, "pdf_doc")
+PDF_NEW_DIR = os.path.join(PDF_DIR, "new")  # 처리할 PDF를 넣는 폴더
+LEGACY_PDF_PROCESSED_DIR = os.path.join(PDF_DIR, "processed")  # 이전 버전에서 처리 완료 PDF를 옮기던 폴더
+PDF_MANIFEST_FILE = os.path.join(PDF_DIR, "manifest.json")  # 처리한 PDF 내용 해시 기록
+
+PDF_WORKERS = max(1, min(4, os.cpu_count() or 1))  # PDF 추출 프로세스 수
+PAGES_AHEAD = 4  # worker당 미리 추출해 둘 최대 페이지 수
+
+# worker 프로세스에서 마지막으로 연 PDF (같은 파일의 페이지가 이어서 들어오므로 한 개만 유지)
+_reader_cache: Dict[str, Tuple[float, PdfReader]] = {}
+
+
+def file_sha256(path: str) -> str:
+    """파일 내용 해시 (파일 이름과 무관)"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def count_pages(path: str) -> int:
+    return len(PdfReader(path).pages)
+
+
+def _open_reader(path: str) -> PdfReader:
+    mtime = os.path.getmtime(path)
+    cached = _reader_cache.get(path)
+    if cached is None or cached[0] != mtime:
+        _reader_cache.clear()
+        _reader_cache[path] = cached = (mtime, PdfReader(path))
+    return cached[1]
+
+
+def extract_page(path: str, page_number: int) -> Tuple[int, str, str]:
+    """
+    페이지 하나의 텍스트 추출 (worker 프로세스에서 실행)
+    PyPDFLoader와 같은 방식으로 추출하므로 기존 청크 ID가 그대로 유지됨
+    Returns:
+        tuple: (page_number, text, page_label)
+    """
+    reader = _open_reader(path)
+    text = reader.pages[page_number].extract_text(extraction_mode="plain")
+    return page_number, text.strip(), reader.page_labels[page_number]
+
+
+def create_pdf_pool(workers: int = PDF_WORKERS) -> ProcessPoolExecutor:
+    """
+    PDF 추출용 프로세스 풀
+    ingest는 수집을 백그라운드 스레드에서 하므로 fork 대신 spawn 사용
+    (worker는 시작할 때 실행 스크립트를 한 번 다시 import함 - main 실행은 __main__ 검사로 막힘)
+    """
+    return ProcessPoolExecutor(max_workers=max(1, workers), mp_context=multiprocessing.get_context("spawn"))
+
+
+def iter_pages(
+    pool: ProcessPoolExecutor,
+    path: str,
+    page_numbers: Iterable[int],
+    ahead: int = PDF_WORKERS * PAGES_AHEAD
+) -> Iterator[Tuple[int, str, str]]:
+    """
+    페이지를 풀에 나누어 추출하고 페이지 순서대로 yield
+    Args:
+        ahead: 동시에 추출 중이거나 꺼내기를 기다리는 최대 페이지 수 (worker 수 × PAGES_AHEAD)
+    """
+    page_numbers = iter(page_numbers)
+    pending = deque()
+    try:
+        for page_number in page_numbers:
+            pending.append(pool.submit(extract_page, path, page_number))
+            if len(pending) >= ahead:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+    finally:
+        for future in pending:
+            future.cancel()
+
+
+# ---------- 처리한 PDF manifest ----------
+
+def load_pdf_manifest(path: str = None) -> Dict[str, dict]:
+    """
+    처리한 PDF 기록
+    manifest가 없으면 이전 버전의 processed/ 폴더에 있는 PDF를 처리한 것으로 가져옴
+    Returns:
+        dict: {sha256: {"filename", "pages", "size", "processed_at"}}
+    """
+    path = path or PDF_MANIFEST_FILE
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except FileNotFoundError:
+        pass
+
+    manifest = {}
+    if os.path.isdir(LEGACY_PDF_PROCESSED_DIR):
+        for filename in sorted(os.listdir(LEGACY_PDF_PROCESSED_DIR)):
+            if not filename.endswith('.pdf'):
+                continue
+            file_path = os.path.join(LEGACY_PDF_PROCESSED_DIR, filename)
+            manifest[file_sha256(file_path)] = pdf_record(filename, file_path)
+        if manifest:
+            save_pdf_manifest(manifest, path)
+            print(f"📥 Imported {len(manifest)} processed PDF(s) from {LEGACY_PDF_PROCESSED_DIR}")
+    return manifest
+
+
+def save_pdf_manifest(manifest: Dict[str, dict], path: str = None):
+    """임시 파일에 쓴 뒤 교체"""
+    path = path or PDF_MANIFEST_FILE
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2, sort_keys=True)
+    os.replace(tmp_path, path)
+
+
+def pdf_record(filename: str, path: str, pages: Optional[int] = None) -> dict:
+    return {
+        "filename": filename,
+        "pages": pages,
+        "size": os.path.getsize(path),
+        "processed_at": datetime.now().isoformat(timespec="seconds"),
+    }
+
+
+def list_new_pdfs(manifest: Dict[str, dict]) -> List[Tuple[str, str]]:
+    """
+    pdf_doc/new/에서 아직 처리하지 않은 PDF (내용 해시 기준 중복 제외)
+    Returns:
+        list: [(filename, sha256), ...] (파일 이름 순)
+    """
+    os.makedirs(PDF_NEW_DIR, exist_ok=True)
+    pending = []
+    seen = {}
+    for filename in sorted(f for f in os.listdir(PDF_NEW_DIR) if f.endswith('.pdf')):
+        sha = file_sha256(os.path.join(PDF_NEW_DIR, filename))
+        if sha in manifest:
+            if manifest[sha]["filename"] != filename:
+                print(f"  ⏭️ {filename}: same content as already processed {manifest[sha]['filename']}")
+            continue
+        if sha in seen:
+            print(f"  ⏭️ {filename}: same content as {seen[sha]}")
+            continue
+        seen[sha] = filename
+        pending.append((filename, sha))
+    return pending
@@ -0,0 +1,132 @@
+"""
+스트리밍 ingest 파이프라인 모듈
+출처(PDF 1개, 게시판 1개 등) 단위로 수집 → 정리 → 분할 → 임베딩 → upsert를 이어서 처리
+- 수집은 백그라운드 스레드에서 진행하고, 크기가 정해진 큐로 연결하여
+  임베딩이 밀리면 수집이 기다림 (backpressure, 메모리에는 최대 큐 크기만큼의 출처만 남음)
+- 출처의 Document는 토큰 수 기준 window로 나누어 처리하므로
+  전체 Document / 전체 청크 리스트를 한 번에 만들지 않음
+"""
+
+import queue
+import threading
+from typing import Callable, Iterable, Iterator, List, NamedTuple
+
+from langchain_core.documents import Document
+
+from embedding_cache import count_tokens
+from embedding_pipeline import MAX_BATCH_TOKENS, MAX_CONCURRENCY
+
+SOURCE_QUEUE_SIZE = 4  # 처리를 기다리는 출처 단위 최대 개수
+WINDOW_TOKENS = MAX_BATCH_TOKENS * MAX_CONCURRENCY  # window당 최대 토큰 수 (동시 임베딩 배치를 채우는 양)
+PUT_TIMEOUT = 0.5  # 큐가 가득 찼을 때 중단 여부를 확인하는 간격(초)
+
+_DONE = object()
+
+
+class SourceUnit(NamedTuple):
+    """
+    수집 단위 하나의 결과
+    - name: 체크포인트에 기록되는 이름 (예: "board:소프트웨어학과", "pdf:학칙.pdf")
+    - docs: 인덱싱할 Document (이미 인덱싱된 단위면 빈 리스트)
+    - extra: 부가 정보 (게시판이면 new_post_nums, notices)
+    """
+    name: str
+    docs: List[Document]
+    extra: dict
+
+
+class _ProducerError(NamedTuple):
+    error: BaseException
+
+
+class _StreamClosed(BaseException):
+    """소비 쪽이 멈춰 producer를 중단시킴 (producer의 except Exception에 잡히지 않도록 BaseException)"""
+
+
+def _put(items: queue.Queue, item, stop: threading.Event) -> bool:
+    """큐가 빌 때까지 기다리며 넣기 (소비 쪽이 중단되면 False)"""
+    while not stop.is_set():
+        try:
+            items.put(item, timeout=PUT_TIMEOUT)
+            return True
+        except queue.Full:
+            continue
+    return False
+
+
+def stream_from_threads(producers: List[Callable[[Callable], None]], maxsize: int = SOURCE_QUEUE_SIZE) -> Iterator:
+    """
+    producer 함수들을 각각 스레드에서 실행하고, emit으로 넘긴 결과를 도착 순서대로 yield
+    Args:
+        producers: emit(item)을 인자로 받는 함수 리스트
+        maxsize: 큐 크기 (가득 차면 producer의 emit이 기다림)
+    producer에서 난 예외는 소비 쪽으로 다시 발생하고,
+    소비 쪽이 중간에 멈추면(예외, close) 남은 producer는 다음 emit에서 멈춤
+    """
+    items: queue.Queue = queue.Queue(maxsize=max(1, maxsize))
+    stop = threading.Event()
+
+    def emit(item):
+        if not _put(items, item, stop):
+            raise _StreamClosed()
+
+    def run(producer):
+        try:
+            producer(emit)
+        except _StreamClosed:
+            return
+        except BaseException as e:
+            _put(items, _ProducerError(e), stop)
+            return
+        _put(items, _DONE, stop)
+
+    threads = [threading.Thread(target=run, args=(producer,), daemon=True) for producer in producers]
+    for thread in threads:
+        thread.start()
+
+    try:
+        remaining = len(threads)
+        while remaining:
+            item = items.get()
+            if item is _DONE:
+                remaining -= 1
+            elif isinstance(item, _ProducerError):
+                raise item.error
+            else:
+                yield item
+    finally:
+        stop.set()
+
+
+def prefetch(iterable: Iterable, maxsize: int = SOURCE_QUEUE_SIZE) -> Iterator:
+    """iterable을 백그라운드 스레드에서 미리 maxsize개까지 꺼내 두는 generator"""
+    def produce(emit):
+        iterator = iter(iterable)
+        try:
+            for item in iterator:
+                emit(item)
+        finally:
+            close = getattr(iterator, "close", None)
+            if close is not None:
+                close()
+
+    return stream_from_threads([produce], maxsize)
+
+
+def iter_doc_windows(docs: List[Document], max_tokens: int = WINDOW_TOKENS) -> Iterator[List[Document]]:
+    """
+    Document를 토큰 수 기준 window로 나눔 (Document 하나는 나누지 않음)
+    한 공지의 청크가 같은 window에 있어야 이전 청크 교체가 한 번에 처리됨
+    """
+    window = []
+    window_tokens = 0
+    for doc in docs:
+        tokens = count_tokens(doc.page_content)
+        if window and window_tokens + tokens > max_tokens:
+            yield window
+            window = []
+            window_tokens = 0
+        window.append(doc)
+        window_tokens += tokens
+    if window:
+        yield window
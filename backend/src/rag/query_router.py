@@ -0,0 +1,241 @@
+"""
+질문 라우터 모듈 (LLM 호출 없음)
+질문마다 검색 범위를 정해 필요 없는 임베딩/검색을 건너뛰거나 검색 대상을 좁힘
+- none: 검색 없이 이전 대화/사용자 정보로 답변 ("영어로 다시 말해줘", 인사, "오늘 내 수업 뭐야?")
+- calendar: 학사일정 인덱스 행만 사용 ("다음 주 일정") - academic_calendar.py
+- static: 건물/도서관 정적 데이터만 검색 ("공학관 어디야?", "도서관 운영시간")
+- notices: 질문에 나온 게시판 공지만 검색 ("소프트웨어학과 공지", "기숙사 공지")
+- full: 전체 검색 (기존 동작)
+
+1단계 키워드 규칙으로 정하고, 규칙에 걸리지 않으면 2단계로 질문 임베딩과 경로별 예시 질문 중심(centroid)의
+코사인 유사도를 비교 (차이가 CENTROID_MARGIN 이상일 때만 static/calendar로 좁힘)
+질문 임베딩은 검색에 그대로 재사용하므로 2단계는 API 호출을 늘리지 않음
+공지를 검색하는 경로(notices/full)는 질문의 게시일 표현("지난달 공지", "이번 학기 공지")을 검색 필터에 추가 (recency.py)
+"""
+
+import re
+import time
+import threading
+from dataclasses import dataclass, field
+from datetime import date
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from academic_calendar import CALENDAR_BOARD, lookup_calendar
+from recency import PostedRange, combine_filters, resolve_posted_range
+from vector_shards import board_flag
+
+ROUTE_NONE = "none"
+ROUTE_CALENDAR = "calendar"
+ROUTE_STATIC = "static"
+ROUTE_NOTICES = "notices"
+ROUTE_FULL = "full"
+ROUTES = (ROUTE_NONE, ROUTE_CALENDAR, ROUTE_STATIC, ROUTE_NOTICES, ROUTE_FULL)
+
+STATIC_BOARDS = ("건물정보", "중앙도서관", "삼성학술정보관")
+CENTROID_MARGIN = 0.05  # 1등 경로와 2등 경로의 유사도 차이가 이보다 작으면 full
+CENTROID_RETRY_SECONDS = 300  # 예시 질문 임베딩에 실패하면 이 시간 동안 키워드 규칙만 사용
+
+# 게시판 별칭 (질문 표현 -> board_name)
+BOARD_ALIASES = {
+    "소프트웨어학과": ("소프트웨어학과", "소프트웨어과", "소웨과"),
+    "소프트웨어융합대학": ("소프트웨어융합대학", "소프트웨어융합", "소융대"),
+    "기숙사_서울": ("서울 기숙사", "서울기숙사", "명륜 기숙사", "인사캠 기숙사", "명륜학사"),
+    "기숙사_수원": ("수원 기숙사", "수원기숙사", "율전 기숙사", "자과캠 기숙사", "봉룡학사"),
+    "학교_대표공지": ("대표공지", "대표 공지", "학교 공지", "학교공지", "전체 공지"),
+}
+DORM_BOARDS = ("기숙사_서울", "기숙사_수원")
+
+# 경로별 예시 질문 (centroid 계산용) - none은 잘못 고르면 검색 없이 답하게 되므로 키워드 규칙으로만 정함
+CENTROID_EXAMPLES = {
+    ROUTE_CALENDAR: [
+        "수강신청 기간이 언제야?", "기말고사 일정 알려줘", "방학은 언제 시작해?", "성적 공시일이 언제야?",
+        "휴학 신청 마감일", "졸업식 날짜 알려줘", "등록금 납부 기간", "개강일이 언제야?",
+    ],
+    ROUTE_STATIC: [
+        "공학관 위치가 어디야?", "도서관 운영시간 알려줘", "열람실 몇 시까지 열어?", "학생회관 몇 번 건물이야?",
+        "스터디룸 운영 시간", "약학관 어디 있어?", "시험기간 도서관 운영시간", "경영대학 건물이 어디야?",
+    ],
+    ROUTE_FULL: [
+        "장학금 공지 있어?", "교환학생 모집 공지 알려줘", "기숙사 입사 신청 안내", "인턴십 모집 공고",
+        "특강 신청 방법", "졸업 요건 알려줘", "복수전공 신청 자격", "학과 행사 안내",
+    ],
+}
+
+# 이전 답변을 다시 쓰는 후속 요청
+_FOLLOWUP_PATTERN = re.compile(
+    r"(영어|한국어|영문|일본어|중국어)로|번역|다시\s*(말|설명|정리|써|알려)|요약|짧게|간단히|쉽게\s*(말|설명)|표로|"
+    r"위\s*(내용|답변)|방금|앞에서|그게\s*무슨"
+)
+# 메시지 전체가 인사/맞장구일 때만 ("하이브리드 강의 공지", "고마워 휴학 신청 기간은?"은 질문)
+_GREETING_PATTERN = re.compile(
+    r"^(안녕\S*|하이|hi|hello|ㅎㅇ|고마워\S*|고맙\S*|감사\S*|땡큐|thanks|thank you|반가워\S*|수고\S*|잘\s*자|좋아\S*|ㅇㅋ|오케이|ok)"
+    r"[\s!.~ㅎㅋ^]*$", re.I
+)
+GREETING_MAX_CHARS = 15
+# 시스템 프롬프트의 시간표/캘린더로 답하는 질문
+_PERSONAL_PATTERN = re.compile(
+    r"(내|제|나의|저의)\s*(시간표|수업|강의|일정|캘린더)|(오늘|내일|모레|이번\s*주|[월화수목금토일]요일)\s*(수업|강의)|공강"
+)
+# 개인 질문이라도 학교 자료가 필요한 말이 있으면 검색
+_ACADEMIC_PATTERN = re.compile(r"시험|학사|신청|등록|장학|공지|마감|개강|종강|방학|휴학|복학|수강|졸업|성적|기숙사|도서관|건물")
+_STATIC_PATTERN = re.compile(r"건물|몇\s*번\s*관|도서관|열람실|학술정보관|중도|디도|자료실|스터디룸|운영\s*시간|위치|어디\s*있")
+_NOTICE_PATTERN = re.compile(r"공지|게시판|올라온|모집|공고|안내문")
+# 학사일정 행만으로 답하는 "기간 전체" 질문 ("다음 주 일정", "이번 달에 뭐 있어?")
+_GENERAL_SCHEDULE_PATTERN = re.compile(r"일정|스케줄|뭐\s*있|무슨\s*일|행사\s*있")
+# 학사일정에 없는 주제 (공지 검색 필요)
+_TOPIC_PATTERN = re.compile(r"장학|기숙사|특강|채용|인턴|교환|봉사|공모|대회|설명회|세미나|프로그램|동아리|축제|학생회")
+
+
+@dataclass
+class Route:
+    """라우팅 결과"""
+    name: str
+    reason: str  # "followup", "greeting", "personal", "calendar", "board", "static", "centroid", "default"
+    boards: Tuple[str, ...] = ()  # 검색을 제한할 board_name (비어 있으면 제한 없음)
+    calendar: Optional[tuple] = None  # lookup_calendar 결과 (기간, 일정)
+    embedding: Optional[List[float]] = field(default=None, repr=False)  # centroid 단계에서 만든 질문 임베딩 (검색에 재사용)
+    posted: Optional[PostedRange] = None  # 질문의 게시일 조건 (notices/full 경로만)
+
+    @property
+    def retrieves(self) -> bool:
+        """벡터 검색을 하는 경로인지"""
+        return self.name not in (ROUTE_NONE, ROUTE_CALENDAR) or (self.name == ROUTE_CALENDAR and self.calendar is None)
+
+    @property
+    def search_filter(self) -> Optional[Dict]:
+        boards = {"board_name": {"$in": list(self.boards)}} if self.boards else None
+        if boards and self.name == ROUTE_NOTICES:
+            # 다른 게시판의 대표 공지로 합쳐진 공지도 포함 (대표 공지 청크의 board:<게시판> 플래그)
+            boards = {"$or": [boards] + [{board_flag(board): True} for board in self.boards]}
+        return combine_filters(boards, self.posted.where if self.posted else None)
+
+
+def match_boards(question: str) -> Tuple[str, ...]:
+    """질문에 나온 게시판 ("기숙사"만 있으면 서울/수원 둘 다)"""
+    boards = [board for board, aliases in BOARD_ALIASES.items() if any(alias in question for alias in aliases)]
+    if not any(board in DORM_BOARDS for board in boards) and "기숙사" in question and _NOTICE_PATTERN.search(question):
+        boards.extend(DORM_BOARDS)
+    return tuple(boards)
+
+
+def route_by_keywords(question: str, history: List[Dict], today: date) -> Optional[Route]:
+    """1단계: 키워드 규칙 (정하지 못하면 None)"""
+    text = question.strip()
+    if history and _FOLLOWUP_PATTERN.search(text) and not _NOTICE_PATTERN.search(text):
+        return Route(ROUTE_NONE, "followup")
+    if (
+        len(text) <= GREETING_MAX_CHARS and _GREETING_PATTERN.search(text)
+        and not (_ACADEMIC_PATTERN.search(text) or _NOTICE_PATTERN.search(text) or _STATIC_PATTERN.search(text))
+    ):
+        return Route(ROUTE_NONE, "greeting")
+    if _PERSONAL_PATTERN.search(text) and not _ACADEMIC_PATTERN.search(text):
+        return Route(ROUTE_NONE, "personal")
+
+    boards = match_boards(text)
+    calendar_hit = lookup_calendar(text, today)
+    if boards:
+        return Route(ROUTE_NOTICES, "board", boards, calendar_hit)
+    if (
+        calendar_hit and _GENERAL_SCHEDULE_PATTERN.search(text)
+        and not _NOTICE_PATTERN.search(text) and not _TOPIC_PATTERN.search(text)
+    ):
+        return Route(ROUTE_CALENDAR, "calendar", calendar=calendar_hit)
+    if _STATIC_PATTERN.search(text) and not _NOTICE_PATTERN.search(text):
+        return Route(ROUTE_STATIC, "static", STATIC_BOARDS)
+    if calendar_hit:
+        return Route(ROUTE_FULL, "calendar", calendar=calendar_hit)
+    return None
+
+
+class QueryRouter:
+    """키워드 규칙 + 예시 질문 centroid 라우터"""
+
+    def __init__(self, embeddings=None):
+        self.embeddings = embeddings
+        self._centroids: Optional[Dict[str, np.ndarray]] = None
+        self._failed_at = 0.0
+        self._lock = threading.Lock()
+
+    def _get_centroids(self) -> Optional[Dict[str, np.ndarray]]:
+        """경로별 예시 질문 임베딩 평균 (정규화) - 처음 1회 계산, 디스크 캐시가 있으면 API 호출 없음"""
+        if self.embeddings is None:
+            return None
+        with self._lock:
+            if self._centroids is None and time.time() - self._failed_at >= CENTROID_RETRY_SECONDS:
+                try:
+                    centroids = {}
+                    for route, examples in CENTROID_EXAMPLES.items():
+                        vectors = np.asarray(self.embeddings.embed_documents(examples), dtype=float)
+                        vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+                        centroid = vectors.mean(axis=0)
+                        centroids[route] = centroid / np.linalg.norm(centroid)
+                    self._centroids = centroids
+                except Exception as e:
+                    self._failed_at = time.time()
+                    print(f"[WARN] Router centroids unavailable, keyword rules only: {e}")
+            return self._centroids
+
+    def route(self, question: str, history: Optional[List[Dict]] = None, today: Optional[date] = None) -> Route:
+        today = today or date.today()
+        route = self._route(question, history or [], today)
+        if route.name in (ROUTE_NOTICES, ROUTE_FULL):
+            route.posted = resolve_posted_range(question, today)
+        return route
+
+    def _route(self, question: str, history: List[Dict], today: date) -> Route:
+        route = route_by_keywords(question, history, today)
+        if route is not None:
+            return route
+
+        centroids = self._get_centroids()
+        if not centroids:
+            return Route(ROUTE_FULL, "default")
+        embedding = self.embeddings.embed_query(question)
+        query = np.asarray(embedding, dtype=float)
+        query /= np.linalg.norm(query) or 1.0
+        scores = sorted(((float(query @ c), name) for name, c in centroids.items()), reverse=True)
+        (best_score, best), (second_score, _) = scores[0], scores[1]
+        if best == ROUTE_FULL or best_score - second_score < CENTROID_MARGIN:
+            return Route(ROUTE_FULL, "default", embedding=embedding)
+        boards = STATIC_BOARDS if best == ROUTE_STATIC else (CALENDAR_BOARD,)
+        return Route(best, "centroid", boards, embedding=embedding)
+
+
+# ---------- 경로별 검색 시간 집계 ----------
+
+_route_stats: Dict[str, Dict[str, float]] = {}
+_route_stats_lock = threading.Lock()
+
+
+def record_route(route: Route, retrieval_ms: float):
+    """경로별 요청 수 / 검색 단계(임베딩 + 검색 + context 생성) 시간 누적"""
+    with _route_stats_lock:
+        stats = _route_stats.setdefault(route.name, {"count": 0, "total_ms": 0.0})
+        stats["count"] += 1
+        stats["total_ms"] += retrieval_ms
+
+
+def get_router_stats() -> Dict:
+    """
+    경로별 평균 검색 시간과 full 대비 절약한 시간 (서버 시작 이후)
+    Returns:
+        dict: {경로: {"count", "avg_ms", "saved_ms"}} - saved_ms는 full 평균이 있을 때만
+    """
+    with _route_stats_lock:
+        stats = {name: dict(values) for name, values in _route_stats.items()}
+    full = stats.get(ROUTE_FULL)
+    full_avg = full["total_ms"] / full["count"] if full else None
+    report = {}
+    for name in ROUTES:
+        if name not in stats:
+            continue
+        count = stats[name]["count"]
+        avg = stats[name]["total_ms"] / count
+        report[name] = {
+            "count": count,
+            "avg_ms": round(avg, 1),
+            "saved_ms": round((full_avg - avg) * count, 1) if full_avg is not None and name != ROUTE_FULL else None,
+        }
+    return report
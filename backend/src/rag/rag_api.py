@@ -1,10 +1,14 @@
-from fastapi import FastAPI, HTTPException, Header
+from fastapi import FastAPI, HTTPException, Header, Query
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 import json
 from typing import List, Dict, Optional, AsyncGenerator
-from rag_engine import generate_rag_response_stream, translate_response, generate_bookmark_title, extract_schedule_from_dialog
+from rag_engine import generate_rag_response_stream, translate_response, generate_bookmark_title, extract_schedule_from_dialog, get_vectorstore
+from index_versions import get_live_dir, read_pointer
+from notice_catalog import get_notice_catalog, DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
+from fast_path import get_fast_path_stats
+from query_router import get_router_stats
 import mysql.connector
 from mysql.connector import Error
 import os
@@ -292,9 +296,8 @@ async def translate(req: TranslateRequest):
 @app.get("/health")
 async def health_check():
     """헬스 체크"""
-    import os
-    
-    db_exists = os.path.exists("chroma_db")
+    db_exists = get_live_dir() is not None
+    pointer = read_pointer()
     
     # DB 연결 테스트
     try:
@@ -304,15 +307,57 @@ async def health_check():
     except:
         db_status = "disconnected"
     
+    # 샤드별 크기 (청크 수, HNSW 인덱스 bytes)
+    try:
+        shards = get_vectorstore().shard_stats() if db_exists else {}
+    except Exception:
+        shards = None
+    
     return {
         "status": "healthy",
         "vector_db": "ready" if db_exists else "not_found",
+        "vector_db_version": pointer["version"] if pointer else None,
+        "shards": shards,
         "mysql_db": db_status,
+        "fast_path": get_fast_path_stats(),
+        "router": get_router_stats(),
         "message": "All systems operational" if db_exists and db_status == "connected" 
                    else "Please check database connections"
     }
 
 
+@app.get("/notices")
+async def list_notices(
+    board: Optional[List[str]] = Query(None),
+    q: Optional[str] = None,
+    date_from: Optional[str] = None,
+    date_to: Optional[str] = None,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None
+):
+    """
+    공지 목록 (게시일 최신순, ingest가 만든 공지 카탈로그의 메모리 스냅샷)
+    
+    Query:
+        board: 게시판 이름 (여러 번 지정 가능)
+        q: 제목 검색어
+        date_from / date_to: 게시일 범위 (YYYY-MM-DD, 양 끝 포함)
+        limit: 페이지 크기
+        cursor: 이전 응답의 next_cursor
+    """
+    try:
+        return get_notice_catalog().snapshot().page(
+            boards=board,
+            query=q,
+            date_from=date_from,
+            date_to=date_to,
+            limit=limit,
+            cursor=cursor
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
 @app.post("/bookmark/title")
 async def bookmark_title(req: BookmarkTitleRequest):
     """북마크 제목 생성 API"""
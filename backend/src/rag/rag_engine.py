@@ -1,15 +1,22 @@
-import os
 import json
-from typing import List, Dict, Optional, AsyncGenerator
+import time
+import threading
+from typing import List, Dict, Optional, AsyncGenerator, Tuple
 from dotenv import load_dotenv
 from langchain_openai import OpenAIEmbeddings, ChatOpenAI
-from langchain_community.vectorstores import Chroma
 from langchain_core.messages import SystemMessage, HumanMessage, AIMessage
-from datetime import datetime
+from datetime import datetime, date
+
+from fast_path import answer_fast_path, record_request
+from query_router import QueryRouter, ROUTE_NONE, record_route
+from academic_calendar import CALENDAR_BOARD, CALENDAR_TITLE, format_calendar_rows
+from embedding_cache import CachedEmbeddings
+from index_versions import get_live_dir
+from parent_store import ParentStore, ParentSectionRetriever
+from vector_store import open_vectorstore
+from vector_shards import ShardedVectorStore
 
 load_dotenv()
-BASE_DIR = os.path.dirname(os.path.abspath(__file__))
-PERSIST_DIR = os.path.join(BASE_DIR, "chroma_db")
 today = datetime.now().strftime("%Y-%m-%d")
 
 def clean_text(text: str) -> str:
@@ -19,13 +26,57 @@ def clean_text(text: str) -> str:
     return text.encode("utf-8", "ignore").decode("utf-8", "ignore")
 
 
+# 서비스 중인 인덱스 (ingest가 새 버전을 배포하면 다음 요청에서 교체)
+_index = None  # (벡터스토어, 같은 버전 디렉토리의 부모 섹션 저장소) - 항상 함께 교체
+_vectordb_dir = None
+_vectordb_lock = threading.Lock()
+_router = None
+_router_lock = threading.Lock()
+
+
+def get_index() -> Tuple[ShardedVectorStore, ParentStore]:
+    """
+    서비스 중인 인덱스 버전의 (벡터스토어, 부모 섹션 저장소)
+    CURRENT 포인터가 다른 버전을 가리키면 새 버전을 열어 둘을 함께 교체 (한 잠금 안에서 읽고 바꾸므로
+    배포 중에도 다른 버전의 벡터스토어와 부모 섹션 저장소가 짝지어지지 않음)
+    진행 중인 스트리밍 요청은 이미 받은 문서로 계속 진행되므로 끊기지 않음
+    """
+    global _index, _vectordb_dir
+
+    live_dir = get_live_dir()
+    if live_dir is None:
+        raise RuntimeError("Vector DB not found. Run ingest.py first to build the DB.")
+
+    with _vectordb_lock:
+        if live_dir != _vectordb_dir:
+            vectordb = open_vectorstore(live_dir, OpenAIEmbeddings(model="text-embedding-3-small"))
+            _index = (vectordb, ParentStore(live_dir))
+            _vectordb_dir = live_dir
+            print(f"[INFO] Vector DB loaded: {live_dir}")
+        return _index
+
+
+def get_vectorstore() -> ShardedVectorStore:
+    """공유 벡터스토어 반환 (출처/캠퍼스별 샤드 컬렉션, 검색 필터에 해당하는 샤드만 검색)"""
+    return get_index()[0]
+
+
 def get_retriever(score_threshold: float = 0.5):
-    """벡터 DB에서 리트리버 생성"""
-    vectordb = Chroma(
-        persist_directory=PERSIST_DIR,
-        embedding_function=OpenAIEmbeddings(model="text-embedding-3-small"),
-    )
-    return vectordb.as_retriever(search_kwargs={"k": 5})
+    """
+    벡터 DB에서 리트리버 생성
+    작은 청크로 검색한 뒤 청크가 속한 섹션 전체를 돌려줌 (parent_store.py)
+    """
+    vectordb, parent_store = get_index()
+    return ParentSectionRetriever(vectordb, parent_store)
+
+
+def get_query_router() -> QueryRouter:
+    """공유 질문 라우터 (예시 질문 임베딩은 embeddings.sqlite3 캐시 사용)"""
+    global _router
+    with _router_lock:
+        if _router is None:
+            _router = QueryRouter(CachedEmbeddings())
+        return _router
 
 
 def format_timetable(timetable: List[Dict]) -> str:
@@ -51,7 +102,9 @@ def format_docs_with_metadata(docs: List) -> str:
     context_parts = []
     
     for i, doc in enumerate(docs, 1):
-        board = doc.metadata.get('board_name', '출처불명')
+        # 여러 게시판에 같은 내용으로 올라온 공지는 하나로 합쳐 저장됨 (source_boards)
+        board = doc.metadata.get('source_boards') or doc.metadata.get('board_name', '출처불명')
+        board = board.replace(",", ", ")
         title = doc.metadata.get('title', '제목없음')
         date = doc.metadata.get('date', '날짜불명')
         content = clean_text(doc.page_content)
@@ -76,7 +129,8 @@ def extract_sources(docs: List) -> List[Dict]:
             "board_name": doc.metadata.get('board_name', '출처불명'),
             "title": doc.metadata.get('title', '제목없음'),
             "date": doc.metadata.get('date', ''),
-            "post_num": doc.metadata.get('post_num', '')
+            "post_num": doc.metadata.get('post_num', ''),
+            "source_boards": [b for b in doc.metadata.get('source_boards', '').split(",") if b]
         })
     
     return sources
@@ -181,18 +235,50 @@ async def generate_rag_response_stream(
     """
     
     try:
+        # 0. 정적 데이터로 바로 답할 수 있는 질문은 검색/LLM 없이 답변 (fast_path.py)
+        started = time.perf_counter()
+        fast_answer = answer_fast_path(question, user_info, date.today())
+        stats = record_request(fast_answer.kind if fast_answer else None)
+        if fast_answer:
+            print(
+                f"[INFO] Fast path ({fast_answer.kind}) {(time.perf_counter() - started) * 1000:.1f}ms"
+                f" - served {stats['served']}/{stats['total']} ({stats['ratio']:.1%})"
+            )
+            yield {"type": "sources", "sources": extract_sources(fast_answer.docs)}
+            yield {"type": "content", "content": fast_answer.text}
+            yield {"type": "done"}
+            return
+
         # LLM 초기화 (streaming=True 필수)
         llm = ChatOpenAI(model="gpt-4o-mini", temperature=0.1, streaming=True)
         
-        # 1. 문서 검색
-        retriever = get_retriever(score_threshold=0.5)
-        docs = retriever.invoke(question)
+        # 1. 문서 검색 (query_router.py가 검색 생략 / 학사일정 행만 / 게시판 제한을 정함)
+        started = time.perf_counter()
+        route = get_query_router().route(question, history, date.today())
+        docs = []
+        if route.retrieves:
+            retriever = get_retriever(score_threshold=0.5)
+            docs = retriever.invoke(question, filter=route.search_filter, embedding=route.embedding)
+
+        # "다음 주 일정"처럼 날짜가 있는 질문은 학사일정 인덱스에서 해당 기간 행만 찾아 넣음
+        # (벡터 검색으로 찾은 학사일정 청크는 대신 빠짐)
+        calendar_hit = route.calendar
+        if calendar_hit:
+            docs = [d for d in docs if d.metadata.get("board_name") != CALENDAR_BOARD]
         #DEBUG
         print("[DEBUG] retrieved titles:", [(d.metadata.get("board_name"), d.metadata.get("title"), d.metadata.get("post_num")) for d in docs])
 
         
         # 2. 출처 정보 먼저 전송
         sources = extract_sources(docs)
+        if calendar_hit:
+            sources.insert(0, {
+                "board_name": CALENDAR_BOARD,
+                "title": CALENDAR_TITLE,
+                "date": "2025",
+                "post_num": "STATIC_CALENDAR_2025",
+                "source_boards": []
+            })
         yield {
             "type": "sources",
             "sources": sources
@@ -200,6 +286,15 @@ async def generate_rag_response_stream(
         
         # 3. Context 생성
         context_text = format_docs_with_metadata(docs)
+        if calendar_hit:
+            rows = format_calendar_rows(*calendar_hit)
+            context_text = f"{rows}\n\n{context_text}" if docs else rows
+
+        retrieval_ms = (time.perf_counter() - started) * 1000
+        record_route(route, retrieval_ms)
+        boards = f", boards={','.join(route.boards)}" if route.boards else ""
+        posted = f", posted={route.posted.label}" if route.posted else ""
+        print(f"[INFO] Route: {route.name} ({route.reason}{boards}{posted}) retrieval {retrieval_ms:.1f}ms")
         
         # 4. 시스템 프롬프트 생성 (DB 정보 활용)
         system_msg = create_system_prompt(user_info, timetable, calendar or [])
@@ -215,7 +310,14 @@ async def generate_rag_response_stream(
                 messages.append(AIMessage(content=msg["content"]))
         
         # 현재 질문 + Context
-        current_msg = f"""[참고 문서]
+        if route.name == ROUTE_NONE:
+            # 후속 요청/인사/시간표 질문은 참고 문서 없이 이전 대화와 사용자 정보로 답변
+            current_msg = f"""[질문]
+{question}
+
+이전 대화와 사용자 정보를 바탕으로 답변해줘."""
+        else:
+            current_msg = f"""[참고 문서]
 {context_text}
 
 [질문]
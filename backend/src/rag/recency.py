@@ -0,0 +1,171 @@
+"""
+게시일 기준 검색 모듈
+- 공지 질문의 게시일 표현("최근 2주", "지난달", "이번 학기", "2025년 3월")을
+  date_ts 범위 / 학기 태그(semester) 조건으로 바꿔 검색 필터에 추가 (query_router.py)
+- 검색된 청크를 유사도 × 최신 가중치로 다시 정렬하여 k를 늘리지 않고도 최근 공지가 앞에 오도록 함 (parent_store.py)
+  - 최신 가중치는 반감기(RECENCY_HALF_LIFE_DAYS)마다 절반, 공지만 적용 (정적 데이터/PDF는 날짜와 무관하게 그대로)
+"""
+
+import re
+import time
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from typing import Dict, List, Optional, Tuple
+
+from langchain_core.documents import Document
+
+from date_utils import semester_of, term_semester
+
+RECENCY_HALF_LIFE_DAYS = 180.0  # 게시 후 이 기간이 지나면 최신 가중치 절반
+RECENCY_WEIGHT = 0.3  # 최종 점수에서 최신 가중치 비중 (0이면 유사도 순서 그대로)
+
+# 게시일을 묻는 질문 (공지 질문에만 범위 필터 적용 - "다음 주 일정"은 학사일정 인덱스가 처리)
+_POSTED_PATTERN = re.compile(r"공지|게시|올라온|올라왔|공고|새\s*글|소식")
+_RECENT_PATTERN = re.compile(r"(?:최근|지난)\s*(\d+)\s*(일|주|개월|달)")
+_DAY_PATTERN = re.compile(r"오늘|어제")
+_WEEK_PATTERN = re.compile(r"(이번|금|지난|저번)\s*주")
+_MONTH_PATTERN = re.compile(r"(이번|지난|저번)\s*달")
+_YEAR_MONTH_PATTERN = re.compile(r"(?:(\d{4})\s*년\s*)?(\d{1,2})\s*월")
+_SEMESTER_PATTERN = re.compile(r"(?:(\d{4})\s*학년도\s*)?([12])\s*학기")
+_RELATIVE_SEMESTER_PATTERN = re.compile(r"(이번|지난|저번)\s*학기")
+_YEAR_PATTERN = re.compile(r"(\d{4})\s*년|올해|작년|지난\s*해")
+
+_PERIOD_DAYS = {"일": 1, "주": 7, "개월": 30, "달": 30}
+
+
+@dataclass(frozen=True)
+class PostedRange:
+    """게시일 조건 (학기 태그가 있으면 학기로, 없으면 start~end 날짜로 필터)"""
+    start: Optional[date]
+    end: Optional[date]
+    label: str  # 로그 표시용 (예: "지난달")
+    semester: Optional[str] = None  # "2025-2"
+
+    @property
+    def where(self) -> Dict:
+        """Chroma 메타데이터 조건"""
+        if self.semester:
+            return {"semester": self.semester}
+        conditions = []
+        if self.start:
+            conditions.append({"date_ts": {"$gte": day_timestamp(self.start)}})
+        if self.end:
+            conditions.append({"date_ts": {"$lt": day_timestamp(self.end + timedelta(days=1))}})
+        return conditions[0] if len(conditions) == 1 else {"$and": conditions}
+
+
+def day_timestamp(day: date) -> int:
+    """날짜 0시의 epoch 초 (date_utils.to_timestamp와 같은 기준)"""
+    return int(datetime(day.year, day.month, day.day).timestamp())
+
+
+def _month_bounds(year: int, month: int) -> Tuple[date, date]:
+    first = date(year, month, 1)
+    following = date(year + month // 12, month % 12 + 1, 1)
+    return first, following - timedelta(days=1)
+
+
+def _shift_semester(semester: str, offset: int) -> str:
+    year, term = (int(v) for v in semester.split("-"))
+    ordinal = year * 2 + term - 1 + offset
+    return f"{ordinal // 2}-{ordinal % 2 + 1}"
+
+
+def resolve_posted_range(question: str, today: date) -> Optional[PostedRange]:
+    """
+    공지 질문의 게시일 표현 -> 게시일 조건 (공지 질문이 아니거나 표현이 없으면 None)
+    앞에 나온 규칙이 우선: 최근 N일 > 오늘/어제 > 주 > 달 > 월 > 학기 > 연도
+    "최근 공지"처럼 기간이 없으면 필터 없이 최신 가중치로만 정렬
+    """
+    if not _POSTED_PATTERN.search(question):
+        return None
+
+    match = _RECENT_PATTERN.search(question)
+    if match:
+        days = int(match.group(1)) * _PERIOD_DAYS[match.group(2)]
+        return PostedRange(today - timedelta(days=days), today, match.group(0))
+
+    match = _DAY_PATTERN.search(question)
+    if match:
+        day = today if match.group(0) == "오늘" else today - timedelta(days=1)
+        return PostedRange(day, day, match.group(0))
+
+    match = _WEEK_PATTERN.search(question)
+    if match:
+        monday = today - timedelta(days=today.weekday())
+        if match.group(1) in ("지난", "저번"):
+            monday -= timedelta(weeks=1)
+        return PostedRange(monday, monday + timedelta(days=6), match.group(0))
+
+    match = _MONTH_PATTERN.search(question)
+    if match:
+        year, month = today.year, today.month
+        if match.group(1) != "이번":
+            year, month = (year, month - 1) if month > 1 else (year - 1, 12)
+        return PostedRange(*_month_bounds(year, month), match.group(0))
+
+    match = _YEAR_MONTH_PATTERN.search(question)
+    if match and 1 <= int(match.group(2)) <= 12:
+        month = int(match.group(2))
+        # 연도가 없으면 지나간 가장 가까운 달 (10월에 "12월 공지" -> 작년 12월)
+        year = int(match.group(1)) if match.group(1) else today.year - (month > today.month)
+        return PostedRange(*_month_bounds(year, month), f"{year}년 {month}월")
+
+    match = _SEMESTER_PATTERN.search(question)
+    if match:
+        semester = term_semester(int(match.group(2)), today, int(match.group(1)) if match.group(1) else None)
+        return PostedRange(None, None, f"{semester} 학기", semester)
+
+    match = _RELATIVE_SEMESTER_PATTERN.search(question)
+    if match:
+        semester = _shift_semester(semester_of("", today), 0 if match.group(1) == "이번" else -1)
+        return PostedRange(None, None, f"{match.group(0)} ({semester})", semester)
+
+    match = _YEAR_PATTERN.search(question)
+    if match:
+        if match.group(1):
+            year = int(match.group(1))
+        else:
+            year = today.year if match.group(0) == "올해" else today.year - 1
+        return PostedRange(date(year, 1, 1), date(year, 12, 31), f"{year}년")
+    return None
+
+
+def combine_filters(*filters: Optional[Dict]) -> Optional[Dict]:
+    """Chroma 조건을 $and로 합침 (None은 무시)"""
+    filters = [f for f in filters if f]
+    if not filters:
+        return None
+    return filters[0] if len(filters) == 1 else {"$and": filters}
+
+
+def recency_factor(date_ts: Optional[int], now_ts: float, half_life_days: float = RECENCY_HALF_LIFE_DAYS) -> float:
+    """게시 후 지난 기간의 최신 가중치 (오늘 1.0, 반감기마다 절반, 날짜 없으면 1.0)"""
+    if date_ts is None or half_life_days <= 0:
+        return 1.0
+    age_days = max(0.0, (now_ts - date_ts) / 86400)
+    return 0.5 ** (age_days / half_life_days)
+
+
+def rerank_by_recency(
+    scored: List[Tuple[Document, float]],
+    now_ts: Optional[float] = None,
+    half_life_days: float = RECENCY_HALF_LIFE_DAYS,
+    weight: float = RECENCY_WEIGHT
+) -> List[Document]:
+    """
+    (청크, 거리) -> 유사도 × (1 - weight + weight × 최신 가중치) 순서의 청크
+    거리는 Chroma 기본 거리(제곱 L2)이고, 정규화된 임베딩(OpenAI)에서는 유사도 = 1 - 거리 / 2
+    공지가 아닌 청크(정적 데이터, PDF)는 최신 가중치 1.0
+    """
+    if weight <= 0:
+        return [doc for doc, _ in scored]
+    now_ts = time.time() if now_ts is None else now_ts
+
+    def score(pair):
+        doc, distance = pair
+        is_notice = str(doc.metadata.get("source_type", "")).endswith("_notice")
+        factor = recency_factor(doc.metadata.get("date_ts"), now_ts, half_life_days) if is_notice else 1.0
+        return (1 - distance / 2) * (1 - weight + weight * factor)
+
+    return [doc for doc, _ in sorted(scored, key=score, reverse=True)]
@@ -0,0 +1,249 @@
+"""
+인덱스 보존 정책 모듈
+게시판별 보존 규칙에 따라 오래된 청크를 date_ts(epoch 초) 메타데이터 기준으로 삭제하고,
+삭제가 많은 샤드만 컬렉션 재구성 + SQLite VACUUM으로 벡터스토어 용량을 회수
+"""
+
+import os
+import shutil
+import sqlite3
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Set
+
+from date_utils import annotate_date_metadata, to_timestamp
+from vector_shards import ShardedVectorStore, shard_name
+from vector_store import get_source_key, ID_BATCH_SIZE
+
+# 게시판별 보존 규칙
+# - max_age_days: 날짜가 N일보다 오래된 청크 삭제
+# - superseded: 같은 게시판에 더 최신 날짜의 문서가 들어오면 이전 문서 삭제
+RETENTION_RULES = {
+    "기숙사_서울": {"max_age_days": 183},
+    "기숙사_수원": {"max_age_days": 183},
+    "소프트웨어학과": {"max_age_days": 365},
+    "소프트웨어융합대학": {"max_age_days": 365},
+    "학교_대표공지": {"max_age_days": 365},
+    "학사일정": {"policy": "superseded"},
+}
+
+COMPACT_MIN_DELETED_RATIO = 0.1  # 샤드의 삭제 비율이 이 이상이면 그 샤드 컬렉션 재구성
+
+
+def retention_days(board_name: str, rules: Optional[Dict[str, dict]] = None) -> float:
+    """게시판 공지의 보존 기간 (일, 기간 규칙이 없는 게시판은 무한)"""
+    rule = (rules or RETENTION_RULES).get(board_name, {})
+    return float(rule.get("max_age_days", float("inf")))
+
+
+def is_notice_expired(metadata: dict, board_name: str, now: Optional[datetime] = None) -> bool:
+    """공지 게시일이 게시판 보존 기간을 넘었는지 (청크가 없는 중복 공지용, 날짜가 없으면 False)"""
+    date_ts = metadata.get("date_ts")
+    if date_ts is None:
+        date_ts = to_timestamp(metadata.get("date"))
+    days = retention_days(board_name)
+    if date_ts is None or days == float("inf"):
+        return False
+    return date_ts < int(((now or datetime.now()) - timedelta(days=days)).timestamp())
+
+
+def get_dir_size(path: str) -> int:
+    """디렉토리 전체 크기 (bytes)"""
+    total = 0
+    for root, _, files in os.walk(path):
+        for name in files:
+            try:
+                total += os.path.getsize(os.path.join(root, name))
+            except OSError:
+                pass
+    return total
+
+
+def format_size(num_bytes: int) -> str:
+    """bytes -> 사람이 읽기 쉬운 단위"""
+    size = float(num_bytes)
+    for unit in ["B", "KB", "MB", "GB"]:
+        if size < 1024 or unit == "GB":
+            return f"{size:.1f}{unit}"
+        size /= 1024
+
+
+def backfill_date_metadata(vectordb: ShardedVectorStore, board_name: Optional[str] = None) -> int:
+    """
+    date_ts / semester가 없는 기존 청크에 date 문자열로부터 값 채우기 (재임베딩 없음)
+    Args:
+        board_name: 이 게시판 청크만 (None이면 전체)
+    Returns:
+        int: 메타데이터를 바꾼 청크 수
+    """
+    where = {"board_name": board_name} if board_name else None
+    data = vectordb.get(where=where, include=["metadatas"])
+    ids = []
+    metadatas = []
+    for chunk_id, metadata in zip(data["ids"], data["metadatas"]):
+        if metadata is None:
+            continue
+        metadata = dict(metadata)
+        if not annotate_date_metadata(metadata, overwrite=False):
+            continue
+        ids.append(chunk_id)
+        metadatas.append(metadata)
+
+    for start in range(0, len(ids), ID_BATCH_SIZE):
+        vectordb.update(
+            ids=ids[start:start + ID_BATCH_SIZE],
+            metadatas=metadatas[start:start + ID_BATCH_SIZE],
+        )
+    return len(ids)
+
+
+def find_expired_chunks(vectordb: ShardedVectorStore, board_name: str, rule: dict, now: datetime) -> Dict[str, str]:
+    """
+    규칙에 따라 만료된 청크 조회
+    Returns:
+        dict: {청크 ID: source_key}
+    """
+    if "max_age_days" in rule:
+        cutoff = int((now - timedelta(days=rule["max_age_days"])).timestamp())
+        data = vectordb.get(
+            where={"$and": [{"board_name": board_name}, {"date_ts": {"$lt": cutoff}}]},
+            include=["metadatas"],
+        )
+    elif rule.get("policy") == "superseded":
+        data = vectordb.get(where={"board_name": board_name}, include=["metadatas"])
+        latest = max((m.get("date_ts", 0) for m in data["metadatas"] if m), default=0)
+        expired = [
+            (i, m) for i, m in zip(data["ids"], data["metadatas"])
+            if m and m.get("date_ts") is not None and m["date_ts"] < latest
+        ]
+        data = {"ids": [i for i, _ in expired], "metadatas": [m for _, m in expired]}
+    else:
+        return {}
+
+    return {
+        chunk_id: (metadata or {}).get("source_key") or get_source_key(metadata or {})
+        for chunk_id, metadata in zip(data["ids"], data["metadatas"])
+    }
+
+
+def compact_shard(vectordb: ShardedVectorStore, name: str):
+    """
+    샤드 컬렉션을 새로 만들어 남은 레코드를 옮긴 뒤(임베딩 재사용) 이름을 바꿔 교체
+    삭제만으로는 줄지 않는 HNSW 인덱스 파일 용량을 회수 (다른 샤드는 그대로)
+    """
+    client = vectordb._client
+    old = client.get_collection(name)
+    temp_name = f"{name}_compact"
+
+    try:
+        client.delete_collection(temp_name)
+    except Exception:
+        pass
+    temp = client.create_collection(temp_name, metadata=old.metadata or None)
+
+    total = old.count()
+    for offset in range(0, total, ID_BATCH_SIZE):
+        batch = old.get(limit=ID_BATCH_SIZE, offset=offset, include=["embeddings", "documents", "metadatas"])
+        if batch["ids"]:
+            temp.add(
+                ids=batch["ids"],
+                embeddings=batch["embeddings"],
+                documents=batch["documents"],
+                metadatas=batch["metadatas"],
+            )
+
+    client.delete_collection(name)
+    temp.modify(name=name)
+    vectordb.reopen()
+
+
+def vacuum_sqlite(persist_dir: str):
+    """Chroma SQLite 파일 VACUUM"""
+    db_path = os.path.join(persist_dir, "chroma.sqlite3")
+    if not os.path.exists(db_path):
+        return
+    try:
+        conn = sqlite3.connect(db_path)
+        conn.execute("VACUUM")
+        conn.close()
+    except Exception as e:
+        print(f"⚠️ VACUUM failed: {e}")
+
+
+def remove_orphan_segments(persist_dir: str):
+    """삭제된 컬렉션이 남긴 HNSW 세그먼트 디렉토리 정리"""
+    db_path = os.path.join(persist_dir, "chroma.sqlite3")
+    try:
+        conn = sqlite3.connect(db_path)
+        segment_ids = {row[0] for row in conn.execute("SELECT id FROM segments")}
+        conn.close()
+    except Exception as e:
+        print(f"⚠️ Could not read segments: {e}")
+        return
+
+    for name in os.listdir(persist_dir):
+        path = os.path.join(persist_dir, name)
+        if os.path.isdir(path) and name not in segment_ids:
+            shutil.rmtree(path, ignore_errors=True)
+
+
+def apply_retention(
+    vectordb: ShardedVectorStore,
+    persist_dir: str,
+    rules: Optional[Dict[str, dict]] = None,
+    now: Optional[datetime] = None,
+    compact: bool = True,
+) -> dict:
+    """
+    보존 정책 적용
+    Returns:
+        dict: {
+            "deleted": {게시판: 삭제 청크 수},
+            "expired_source_keys": 삭제된 문서 source_key set,
+            "compacted": 재구성한 샤드 list,
+            "size_before": bytes, "size_after": bytes,
+            "vectordb": 벡터스토어
+        }
+    """
+    rules = rules or RETENTION_RULES
+    now = now or datetime.now()
+    size_before = get_dir_size(persist_dir)
+    counts_before = vectordb.count_by_shard()
+
+    deleted: Dict[str, int] = {}
+    deleted_by_shard: Dict[str, int] = {}
+    expired_source_keys: Set[str] = set()
+    for board_name, rule in rules.items():
+        backfill_date_metadata(vectordb, board_name)
+        expired = find_expired_chunks(vectordb, board_name, rule, now)
+        if not expired:
+            continue
+        expired_ids: List[str] = list(expired.keys())
+        shard = shard_name({"board_name": board_name})
+        deleted_by_shard[shard] = deleted_by_shard.get(shard, 0) + len(expired_ids)
+        for start in range(0, len(expired_ids), ID_BATCH_SIZE):
+            vectordb.delete(ids=expired_ids[start:start + ID_BATCH_SIZE])
+        deleted[board_name] = len(expired_ids)
+        expired_source_keys.update(expired.values())
+
+    # 삭제 비율이 높은 샤드만 재구성
+    compacted = []
+    if compact:
+        compacted = [
+            shard for shard, count in deleted_by_shard.items()
+            if counts_before.get(shard) and count / counts_before[shard] >= COMPACT_MIN_DELETED_RATIO
+        ]
+        for shard in compacted:
+            compact_shard(vectordb, shard)
+    if compacted:
+        remove_orphan_segments(persist_dir)
+    if deleted:
+        vacuum_sqlite(persist_dir)
+
+    return {
+        "deleted": deleted,
+        "expired_source_keys": expired_source_keys,
+        "compacted": compacted,
+        "size_before": size_before,
+        "size_after": get_dir_size(persist_dir),
+        "vectordb": vectordb,
+    }
@@ -0,0 +1,367 @@
+"""
+벡터스토어 샤드 모듈
+PDF / 정적 데이터 / 게시판 공지를 출처 종류와 캠퍼스별 Chroma 컬렉션(샤드)에 나누어 저장
+- 같은 버전 디렉토리의 클라이언트 하나에 샤드마다 컬렉션 하나 (blue/green 복사/배포는 그대로)
+- 청크 메타데이터(board_name, campus, source_type)로 샤드 결정
+- 검색은 필터의 board_name/campus에 해당하는 샤드에만 보내고 거리 순으로 합침
+  (게시판 플래그 board:<게시판> 조건은 다른 게시판의 대표 공지로 합쳐진 공지를 찾으므로 공지 샤드 전체)
+- 샤드별로 따로 다시 만들 수 있음 (ingest.py --rebuild-shard)
+- 버전 관리 도입 전의 단일 컬렉션("langchain")은 ingest 시 샤드로 옮김 (임베딩 재사용)
+"""
+
+import os
+import sqlite3
+from typing import Dict, Iterable, List, Optional, Set
+
+import chromadb
+from langchain_community.vectorstores import Chroma
+from langchain_core.documents import Document
+
+# 게시판 -> 샤드 (Chroma 컬렉션 이름은 영문/숫자/._- 3~63자)
+SHARD_BY_BOARD = {
+    "소프트웨어학과": "notice_sw_dept",
+    "소프트웨어융합대학": "notice_sw_college",
+    "기숙사_서울": "notice_dorm_seoul",
+    "기숙사_수원": "notice_dorm_suwon",
+    "학교_대표공지": "notice_skku",
+    "학사일정": "static_calendar",
+    "중앙도서관": "static_library_humanities",
+    "삼성학술정보관": "static_library_natural",
+}
+# 캠퍼스별로 나누는 게시판 -> {campus: 샤드}
+CAMPUS_SHARDS = {
+    "건물정보": {
+        "인문사회": "static_building_humanities",
+        "자연과학": "static_building_natural",
+    },
+}
+PDF_SHARD = "pdf"
+OTHER_SHARD = "other"  # 어느 샤드에도 속하지 않는 문서 (새 게시판 등)
+LEGACY_COLLECTION = "langchain"  # 샤드 도입 전 기본 컬렉션
+ALL_SHARDS = tuple(dict.fromkeys(
+    list(SHARD_BY_BOARD.values())
+    + [name for shards in CAMPUS_SHARDS.values() for name in shards.values()]
+    + [PDF_SHARD, OTHER_SHARD]
+))
+
+NOTICE_SHARDS = tuple(name for name in SHARD_BY_BOARD.values() if name.startswith("notice_"))
+# 공지가 올라온 게시판마다 True인 메타데이터 (대표 공지 하나로 합친 교차 게시 공지를 게시판으로 검색)
+BOARD_FLAG_PREFIX = "board:"
+
+BATCH_SIZE = 500  # Chroma get/upsert/delete 호출당 레코드 수
+
+
+def shard_name(metadata: Optional[Dict]) -> str:
+    """청크 메타데이터 -> 샤드 이름"""
+    metadata = metadata or {}
+    if metadata.get("source_type") == "pdf":
+        return PDF_SHARD
+    board = metadata.get("board_name", "")
+    if board in CAMPUS_SHARDS:
+        return CAMPUS_SHARDS[board].get(metadata.get("campus"), OTHER_SHARD)
+    return SHARD_BY_BOARD.get(board, OTHER_SHARD)
+
+
+def board_flag(board_name: str) -> str:
+    """게시판 플래그 메타데이터 키 ("board:소프트웨어학과")"""
+    return f"{BOARD_FLAG_PREFIX}{board_name}"
+
+
+def board_flags(boards: Iterable[str], metadata: Optional[Dict] = None) -> Dict[str, bool]:
+    """
+    공지가 올라온 게시판 -> 게시판 플래그 값
+    metadata에 있던 다른 게시판 플래그는 False (Chroma update는 키를 지우지 않고 합치므로)
+    """
+    flags = {key: False for key in (metadata or {}) if key.startswith(BOARD_FLAG_PREFIX)}
+    flags.update({board_flag(board): True for board in boards})
+    return flags
+
+
+def shards_for_boards(boards: Iterable[str], campuses: Optional[Iterable[str]] = None) -> Set[str]:
+    """게시판 이름(+ 캠퍼스) -> 해당 게시판 문서가 들어 있는 샤드"""
+    campuses = set(campuses) if campuses is not None else None
+    shards = set()
+    for board in boards:
+        if board in CAMPUS_SHARDS:
+            shards.update(
+                name for campus, name in CAMPUS_SHARDS[board].items()
+                if campuses is None or campus in campuses
+            )
+        else:
+            shards.add(SHARD_BY_BOARD.get(board, OTHER_SHARD))
+    return shards
+
+
+def _field_values(where: Optional[Dict], key: str) -> Optional[Set[str]]:
+    """
+    Chroma where 조건에서 key가 가질 수 있는 값 (최상위 또는 $and 안의 $eq/$in 조건만 인식)
+    Returns:
+        set 또는 None (제한 없음)
+    """
+    if not where:
+        return None
+    if "$and" in where:
+        values = None
+        for condition in where["$and"]:
+            found = _field_values(condition, key)
+            if found is not None:
+                values = found if values is None else values & found
+        return values
+    condition = where.get(key)
+    if isinstance(condition, str):
+        return {condition}
+    if isinstance(condition, dict):
+        if "$eq" in condition:
+            return {condition["$eq"]}
+        if "$in" in condition:
+            return set(condition["$in"])
+    return None
+
+
+def shards_for_filter(where: Optional[Dict]) -> Optional[Set[str]]:
+    """
+    검색/조회 조건에 해당하는 샤드
+    $or는 조건마다 샤드를 합치고, $and 안의 $or는 나머지 조건의 샤드와 겹치는 샤드만 남김
+    Returns:
+        set 또는 None (board_name 조건이 없으면 전체 샤드)
+    """
+    if not where:
+        return None
+    if "$or" in where:
+        shards = set()
+        for condition in where["$or"]:
+            found = shards_for_filter(condition)
+            if found is None:
+                return None
+            shards |= found
+        return shards
+    if any(key.startswith(BOARD_FLAG_PREFIX) for key in where):
+        return set(NOTICE_SHARDS)
+
+    boards = _field_values(where, "board_name")
+    shards = shards_for_boards(boards, _field_values(where, "campus")) if boards is not None else None
+    for condition in where.get("$and", []):
+        if "$or" in condition:
+            found = shards_for_filter(condition)
+            if found is not None:
+                shards = found if shards is None else shards & found
+    return shards
+
+
+class ShardedVectorStore:
+    """
+    샤드 컬렉션 묶음 (ingest/retention/rag_engine이 쓰는 Chroma 기능만 지원)
+    get/update/upsert/delete는 Chroma 컬렉션과 같은 인자를 받고, 검색은 langchain Chroma와 같은 인자를 받음
+    """
+
+    def __init__(self, persist_dir: str, embeddings=None):
+        self.persist_dir = persist_dir
+        self.embeddings = embeddings
+        self._client = chromadb.PersistentClient(path=persist_dir)
+        self._shards: Dict[str, Chroma] = {}
+
+    def shard(self, name: str) -> Chroma:
+        """샤드 컬렉션 (없으면 생성)"""
+        if name not in self._shards:
+            self._shards[name] = Chroma(
+                client=self._client,
+                collection_name=name,
+                embedding_function=self.embeddings,
+            )
+        return self._shards[name]
+
+    def collection_names(self) -> List[str]:
+        """디렉토리에 있는 컬렉션 이름 전체"""
+        return sorted(c if isinstance(c, str) else c.name for c in self._client.list_collections())
+
+    def shard_names(self, names: Optional[Iterable[str]] = None) -> List[str]:
+        """
+        데이터가 있을 수 있는 샤드 (아직 옮기지 않은 기존 컬렉션 포함)
+        Args:
+            names: 이 샤드들로 제한 (None이면 전체)
+        """
+        existing = self.collection_names()
+        if LEGACY_COLLECTION in existing:
+            # 옮기기 전에는 어느 게시판이든 기존 컬렉션에 있을 수 있음
+            names = None if names is None else set(names) | {LEGACY_COLLECTION}
+        return [
+            name for name in existing
+            if (name in ALL_SHARDS or name == LEGACY_COLLECTION) and (names is None or name in names)
+        ]
+
+    def reopen(self):
+        """컬렉션을 새로 만들거나 이름을 바꾼 뒤 캐시된 컬렉션 객체 폐기 (retention.py)"""
+        self._shards.clear()
+
+    # --- 컬렉션 API (ids / where / include) ---
+
+    def get(self, ids: Optional[List[str]] = None, where: Optional[Dict] = None,
+            include: Optional[List[str]] = None) -> Dict[str, list]:
+        """샤드 전체(또는 where의 게시판에 해당하는 샤드)에서 조회한 결과를 합침"""
+        include = list(include) if include is not None else ["metadatas", "documents"]
+        result = {"ids": [], **{key: [] for key in include}}
+        if ids is not None and not ids:
+            return result
+        for name in self.shard_names(shards_for_filter(where)):
+            collection = self.shard(name)._collection
+            for start in range(0, len(ids), BATCH_SIZE) if ids is not None else [None]:
+                batch = ids[start:start + BATCH_SIZE] if ids is not None else None
+                data = collection.get(ids=batch, where=where or None, include=include)
+                result["ids"].extend(data["ids"])
+                for key in include:
+                    result[key].extend(list(data[key]) if data.get(key) is not None else [None] * len(data["ids"]))
+        return result
+
+    def upsert(self, ids: List[str], embeddings: List[List[float]], documents: List[str], metadatas: List[Dict]):
+        """메타데이터의 샤드별로 나누어 upsert"""
+        for name, indexes in self._group_by_shard(metadatas).items():
+            self.shard(name)._collection.upsert(
+                ids=[ids[i] for i in indexes],
+                embeddings=[embeddings[i] for i in indexes],
+                documents=[documents[i] for i in indexes],
+                metadatas=[metadatas[i] for i in indexes],
+            )
+
+    def update(self, ids: List[str], metadatas: List[Dict]):
+        """메타데이터 갱신 (전체 메타데이터를 받아 샤드 결정, 기존 컬렉션의 레코드도 함께 갱신)"""
+        legacy = LEGACY_COLLECTION in self.collection_names()
+        for name, indexes in self._group_by_shard(metadatas).items():
+            targets = [name]
+            if legacy:
+                targets.append(LEGACY_COLLECTION)
+            for target in targets:
+                collection = self.shard(target)._collection
+                batch = indexes
+                if legacy:
+                    # 옮기기 전에는 어느 쪽에 있는지 모르므로 있는 레코드만 갱신
+                    found = set(collection.get(ids=[ids[i] for i in indexes], include=[])["ids"])
+                    batch = [i for i in indexes if ids[i] in found]
+                if batch:
+                    collection.update(ids=[ids[i] for i in batch], metadatas=[metadatas[i] for i in batch])
+
+    def delete(self, ids: List[str]):
+        """ID로 삭제 (ID만으로는 샤드를 알 수 없으므로 전체 샤드에서 삭제)"""
+        if not ids:
+            return
+        for name in self.shard_names():
+            self.shard(name)._collection.delete(ids=ids)
+
+    def count(self) -> int:
+        return sum(self.count_by_shard().values())
+
+    def count_by_shard(self) -> Dict[str, int]:
+        """샤드별 청크 수"""
+        return {name: self.shard(name)._collection.count() for name in self.shard_names()}
+
+    def persist(self):
+        """PersistentClient는 쓰기마다 저장되므로 호출할 필요 없음 (langchain Chroma와 같은 인터페이스)"""
+
+    # --- 검색 (langchain Chroma와 같은 인자) ---
+
+    def similarity_search(self, query: str, k: int = 4, filter: Optional[Dict] = None) -> List[Document]:
+        return self.similarity_search_by_vector(self.embeddings.embed_query(query), k=k, filter=filter)
+
+    def similarity_search_by_vector(
+        self, embedding: List[float], k: int = 4, filter: Optional[Dict] = None
+    ) -> List[Document]:
+        return [doc for doc, _ in self.similarity_search_by_vector_with_score(embedding, k=k, filter=filter)]
+
+    def similarity_search_by_vector_with_score(
+        self, embedding: List[float], k: int = 4, filter: Optional[Dict] = None
+    ) -> List[tuple]:
+        """
+        필터에 해당하는 샤드에서만 k개씩 검색한 뒤 거리 순으로 합쳐 상위 k개
+        (샤드 모두 같은 임베딩 모델/거리 함수이므로 거리를 그대로 비교)
+        Returns:
+            list: [(Document, 거리), ...]
+        """
+        results = []
+        for name in self.shard_names(shards_for_filter(filter)):
+            shard = self.shard(name)
+            if not shard._collection.count():
+                continue
+            results.extend(shard.similarity_search_by_vector_with_relevance_scores(embedding, k=k, filter=filter))
+        results.sort(key=lambda pair: pair[1])
+        return results[:k]
+
+    # --- 샤드 관리 ---
+
+    def drop_shards(self, names: Iterable[str]) -> Dict[str, int]:
+        """
+        샤드 컬렉션 삭제 (다시 인덱싱하기 전, 스테이징 디렉토리에서만 사용)
+        Returns:
+            dict: {샤드: 삭제한 청크 수}
+        """
+        dropped = {}
+        existing = self.collection_names()
+        for name in names:
+            if name not in existing:
+                continue
+            dropped[name] = self.shard(name)._collection.count()
+            self._client.delete_collection(name)
+            self._shards.pop(name, None)
+        return dropped
+
+    def migrate_legacy(self) -> Dict[str, int]:
+        """
+        기존 단일 컬렉션의 레코드를 샤드로 옮긴 뒤 기존 컬렉션 삭제 (임베딩 재사용, 1회성)
+        Returns:
+            dict: {샤드: 옮긴 청크 수}
+        """
+        if LEGACY_COLLECTION not in self.collection_names():
+            return {}
+        legacy = self._client.get_collection(LEGACY_COLLECTION)
+        moved: Dict[str, int] = {}
+        total = legacy.count()
+        for offset in range(0, total, BATCH_SIZE):
+            batch = legacy.get(limit=BATCH_SIZE, offset=offset, include=["embeddings", "documents", "metadatas"])
+            if not batch["ids"]:
+                continue
+            metadatas = [m or {} for m in batch["metadatas"]]
+            self.upsert(batch["ids"], list(batch["embeddings"]), batch["documents"], metadatas)
+            for name, indexes in self._group_by_shard(metadatas).items():
+                moved[name] = moved.get(name, 0) + len(indexes)
+        self._client.delete_collection(LEGACY_COLLECTION)
+        self._shards.pop(LEGACY_COLLECTION, None)
+        return moved
+
+    def shard_stats(self) -> Dict[str, Dict[str, int]]:
+        """
+        샤드별 크기
+        Returns:
+            dict: {샤드: {"chunks": 청크 수, "bytes": HNSW 인덱스 파일 크기}}
+        """
+        sizes = _vector_segment_sizes(self.persist_dir)
+        return {
+            name: {"chunks": count, "bytes": sizes.get(name, 0)}
+            for name, count in self.count_by_shard().items()
+        }
+
+    def _group_by_shard(self, metadatas: List[Dict]) -> Dict[str, List[int]]:
+        grouped: Dict[str, List[int]] = {}
+        for i, metadata in enumerate(metadatas):
+            grouped.setdefault(shard_name(metadata), []).append(i)
+        return grouped
+
+
+def _vector_segment_sizes(persist_dir: str) -> Dict[str, int]:
+    """컬렉션별 HNSW 세그먼트 디렉토리 크기 (bytes, 메타데이터는 chroma.sqlite3 하나에 함께 저장됨)"""
+    try:
+        conn = sqlite3.connect(os.path.join(persist_dir, "chroma.sqlite3"))
+        rows = conn.execute(
+            "SELECT s.id, c.name FROM segments s JOIN collections c ON s.collection = c.id "
+            "WHERE s.scope = 'VECTOR'"
+        ).fetchall()
+        conn.close()
+    except Exception:
+        return {}
+
+    sizes: Dict[str, int] = {}
+    for segment_id, name in rows:
+        segment_dir = os.path.join(persist_dir, segment_id)
+        if not os.path.isdir(segment_dir):
+            continue
+        for entry in os.scandir(segment_dir):
+            if entry.is_file():
+                sizes[name] = sizes.get(name, 0) + entry.stat().st_size
+    return sizes
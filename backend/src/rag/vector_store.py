@@ -0,0 +1,247 @@
+"""
+벡터스토어 공통 모듈
+청크 ID 생성, upsert, 중복 청크 정리 등 Chroma 관련 로직을 관리
+"""
+
+import hashlib
+from typing import Callable, Dict, List, Optional, Set, Tuple
+
+from langchain_core.documents import Document
+
+from embedding_pipeline import embed_and_upsert, MAX_BATCH_TOKENS, MAX_CONCURRENCY
+from vector_shards import ShardedVectorStore
+
+ID_BATCH_SIZE = 500  # Chroma get/delete 호출당 ID 개수
+
+
+def get_source_key(metadata: Dict) -> str:
+    """
+    문서 출처 키 생성
+    - 공지사항: "게시판:글번호"
+    - PDF: "pdf:파일명:페이지"
+    - 정적 데이터: "게시판:post_num" 또는 "게시판:제목"
+    """
+    if metadata.get("source_type") == "pdf":
+        return f"pdf:{metadata.get('filename', '')}:{metadata.get('page', '')}"
+
+    board = metadata.get("board_name", "")
+    post = metadata.get("post_num") or metadata.get("post_id")
+    if post:
+        return f"{board}:{post}"
+    return f"{board}:{metadata.get('title', '')}"
+
+
+def content_hash(text: str) -> str:
+    """청크 본문 sha256"""
+    return hashlib.sha256((text or "").encode("utf-8")).hexdigest()
+
+
+def make_chunk_id(source_key: str, text: str) -> str:
+    """출처 키 + 본문 해시로 결정적(content-addressed) 청크 ID 생성"""
+    return hashlib.sha256(f"{source_key}\n{content_hash(text)}".encode("utf-8")).hexdigest()
+
+
+def assign_chunk_ids(chunks: List[Document]) -> Tuple[List[Document], List[str]]:
+    """
+    청크마다 source_key / content_hash 메타데이터와 ID 부여
+    같은 실행 안에서 동일 ID가 나오면 하나만 남김 (Chroma upsert는 ID 중복 불가)
+    Returns:
+        tuple: (unique_chunks, ids)
+    """
+    unique_chunks = []
+    ids = []
+    seen = set()
+    for chunk in chunks:
+        source_key = chunk.metadata.get("source_key") or get_source_key(chunk.metadata)
+        chunk.metadata["source_key"] = source_key
+        chunk.metadata["content_hash"] = content_hash(chunk.page_content)
+        chunk_id = make_chunk_id(source_key, chunk.page_content)
+        if chunk_id in seen:
+            continue
+        seen.add(chunk_id)
+        unique_chunks.append(chunk)
+        ids.append(chunk_id)
+    return unique_chunks, ids
+
+
+def open_vectorstore(persist_dir: str, embeddings=None) -> ShardedVectorStore:
+    """persist_dir의 벡터스토어 열기 (출처/캠퍼스별 샤드 컬렉션, vector_shards.py)"""
+    return ShardedVectorStore(persist_dir, embeddings)
+
+
+def get_existing_ids(vectordb: ShardedVectorStore, ids: List[str]) -> Set[str]:
+    """ids 중 이미 벡터스토어에 있는 ID 조회"""
+    existing = set()
+    for i in range(0, len(ids), ID_BATCH_SIZE):
+        batch = ids[i:i + ID_BATCH_SIZE]
+        existing.update(vectordb.get(ids=batch, include=[])["ids"])
+    return existing
+
+
+def upsert_chunks(
+    vectordb: ShardedVectorStore,
+    chunks: List[Document],
+    max_tokens: int = MAX_BATCH_TOKENS,
+    concurrency: int = MAX_CONCURRENCY,
+    on_batch: Optional[Callable[[int, int], None]] = None,
+) -> Dict[str, int]:
+    """
+    청크 upsert
+    - 새 ID만 토큰 기준 배치로 동시 임베딩하여 추가 (embedding_pipeline)
+    - 이미 있는 ID는 임베딩 없이 메타데이터만 갱신
+    Returns:
+        dict: {"new": 추가된 청크 수, "unchanged": 기존 청크 수}
+    """
+    chunks, ids = assign_chunk_ids(chunks)
+    existing = get_existing_ids(vectordb, ids)
+
+    new_chunks = [c for c, i in zip(chunks, ids) if i not in existing]
+    new_ids = [i for i in ids if i not in existing]
+    if new_chunks:
+        embed_and_upsert(
+            vectordb, new_chunks, new_ids, max_tokens=max_tokens, concurrency=concurrency, on_batch=on_batch
+        )
+
+    unchanged = [(c, i) for c, i in zip(chunks, ids) if i in existing]
+    for start in range(0, len(unchanged), ID_BATCH_SIZE):
+        batch = unchanged[start:start + ID_BATCH_SIZE]
+        vectordb.update(
+            ids=[i for _, i in batch],
+            metadatas=[c.metadata for c, _ in batch],
+        )
+
+    return {"new": len(new_chunks), "unchanged": len(unchanged)}
+
+
+def group_chunk_ids(chunks: List[Document]) -> Dict[str, List[str]]:
+    """
+    청크 ID를 출처 키별로 묶음
+    Returns:
+        dict: {source_key: [청크 ID, ...]}
+    """
+    chunks, ids = assign_chunk_ids(chunks)
+    grouped: Dict[str, List[str]] = {}
+    for chunk, chunk_id in zip(chunks, ids):
+        grouped.setdefault(chunk.metadata["source_key"], []).append(chunk_id)
+    return grouped
+
+
+def replace_stale_chunks(
+    vectordb: ShardedVectorStore,
+    notice_state: Dict[str, dict],
+    chunk_ids_by_key: Dict[str, List[str]]
+) -> int:
+    """
+    내용이 바뀐 공지의 이전 청크 삭제
+    새 청크가 이미 upsert된 뒤에 호출하여 공지가 검색되지 않는 구간이 없도록 함
+    Returns:
+        int: 삭제한 청크 수
+    """
+    stale_ids = []
+    for source_key, new_ids in chunk_ids_by_key.items():
+        record = notice_state.get(source_key)
+        if not record:
+            continue
+        stale_ids.extend(set(record.get("chunk_ids", [])) - set(new_ids))
+
+    for start in range(0, len(stale_ids), ID_BATCH_SIZE):
+        vectordb.delete(ids=stale_ids[start:start + ID_BATCH_SIZE])
+    return len(stale_ids)
+
+
+def replace_source_chunks(vectordb: ShardedVectorStore, chunk_ids_by_key: Dict[str, List[str]]) -> int:
+    """
+    공지 상태로 관리하지 않는 출처(정적 데이터, PDF 페이지)의 이전 청크 삭제
+    같은 출처 키의 청크 중 이번에 만든 청크 ID에 없는 청크 (본문이나 분할 방식이 바뀐 경우)
+    Returns:
+        int: 삭제한 청크 수
+    """
+    stale_ids = []
+    new_ids = {source_key: set(ids) for source_key, ids in chunk_ids_by_key.items()}
+    keys = list(new_ids)
+    for start in range(0, len(keys), ID_BATCH_SIZE):
+        batch = keys[start:start + ID_BATCH_SIZE]
+        stored = vectordb.get(where={"source_key": {"$in": batch}}, include=["metadatas"])
+        for chunk_id, metadata in zip(stored["ids"], stored["metadatas"]):
+            if chunk_id not in new_ids[metadata["source_key"]]:
+                stale_ids.append(chunk_id)
+
+    for start in range(0, len(stale_ids), ID_BATCH_SIZE):
+        vectordb.delete(ids=stale_ids[start:start + ID_BATCH_SIZE])
+    return len(stale_ids)
+
+
+def update_chunk_metadata(vectordb: ShardedVectorStore, chunk_ids: List[str], values: Dict) -> int:
+    """
+    청크 메타데이터 일부 값 변경 (본문/임베딩은 그대로, 다시 임베딩하지 않음)
+    Returns:
+        int: 변경한 청크 수
+    """
+    updated = 0
+    for start in range(0, len(chunk_ids), ID_BATCH_SIZE):
+        stored = vectordb.get(ids=chunk_ids[start:start + ID_BATCH_SIZE], include=["metadatas"])
+        if not stored["ids"]:
+            continue
+        vectordb.update(
+            ids=stored["ids"],
+            metadatas=[{**(metadata or {}), **values} for metadata in stored["metadatas"]],
+        )
+        updated += len(stored["ids"])
+    return updated
+
+
+def dedupe_vectorstore(vectordb: ShardedVectorStore) -> Dict[str, int]:
+    """
+    기존 인덱스의 중복 청크 정리 (1회성)
+    - 모든 레코드에 content-addressed ID를 다시 계산
+    - 같은 ID로 모이는 레코드는 하나만 남기고 삭제
+    - 랜덤 UUID로 저장된 레코드는 임베딩을 재사용해 새 ID로 옮김 (재임베딩 없음)
+    Returns:
+        dict: {"total": 전체, "kept": 남은 수, "rekeyed": ID 변경 수, "deleted": 삭제 수}
+    """
+    data = vectordb.get(include=["documents", "metadatas"])
+    groups: Dict[str, List[int]] = {}
+    for idx, (text, metadata) in enumerate(zip(data["documents"], data["metadatas"])):
+        metadata = metadata or {}
+        source_key = metadata.get("source_key") or get_source_key(metadata)
+        groups.setdefault(make_chunk_id(source_key, text), []).append(idx)
+
+    to_delete = []
+    rekey = []  # (new_id, old_idx)
+    for chunk_id, indexes in groups.items():
+        old_ids = [data["ids"][i] for i in indexes]
+        if chunk_id in old_ids:
+            to_delete.extend(i for i in old_ids if i != chunk_id)
+        else:
+            rekey.append((chunk_id, indexes[0]))
+            to_delete.extend(old_ids)
+
+    for start in range(0, len(rekey), ID_BATCH_SIZE):
+        batch = rekey[start:start + ID_BATCH_SIZE]
+        old_ids = [data["ids"][i] for _, i in batch]
+        stored = vectordb.get(ids=old_ids, include=["embeddings"])
+        embedding_by_id = dict(zip(stored["ids"], stored["embeddings"]))
+
+        metadatas = []
+        for _, i in batch:
+            metadata = dict(data["metadatas"][i] or {})
+            metadata["source_key"] = metadata.get("source_key") or get_source_key(metadata)
+            metadata["content_hash"] = content_hash(data["documents"][i])
+            metadatas.append(metadata)
+
+        vectordb.upsert(
+            ids=[new_id for new_id, _ in batch],
+            embeddings=[embedding_by_id[data["ids"][i]] for _, i in batch],
+            documents=[data["documents"][i] for _, i in batch],
+            metadatas=metadatas,
+        )
+
+    for start in range(0, len(to_delete), ID_BATCH_SIZE):
+        vectordb.delete(ids=to_delete[start:start + ID_BATCH_SIZE])
+
+    return {
+        "total": len(data["ids"]),
+        "kept": len(groups),
+        "rekeyed": len(rekey),
+        "deleted": len(data["ids"]) - len(groups),
+    }
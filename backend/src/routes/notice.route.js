@@ -3,9 +3,13 @@ const router = express.Router();
 
 const {
   getLatestNotices,
+  getNotices,
 } = require("../controllers/notice.controller");
 
 // 최신 공지사항 조회 (인증 불필요 - 메인 페이지용)
 router.get("/latest", getLatestNotices);
 
+// 공지사항 목록 조회 (게시판/제목/기간 필터 + cursor 페이지네이션, 인증 불필요)
+router.get("/", getNotices);
+
 module.exports = router;
\ No newline at end of file